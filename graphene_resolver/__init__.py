@@ -1,7 +1,7 @@
 """Using mongoose-like schema to write apollo-like resolver for graphene.  """
 
 __version__ = '0.1.2'
-from .resolver import Resolver
-from . import connection, typedef
+from .resolver import Resolver, compile_all
+from . import cache, connection, executor, memo, metrics, profiler, tracing, typedef
 from .schema import CONFIG_PROCESSOR
 from .typedef import TYPENAME_PROCESSOR
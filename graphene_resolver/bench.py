@@ -0,0 +1,316 @@
+"""Microbenchmarks for schema build, field resolution, unions and connections.
+
+Run with `python -m graphene_resolver.bench`, results can be saved as json
+and compared with a previous run.
+"""
+
+import argparse
+import functools
+import itertools
+import json
+import platform
+import statistics
+import sys
+import time
+import typing
+
+import graphene
+
+from . import __version__, connection, resolver, schema
+
+BENCHMARKS: typing.Dict[str, typing.Callable[[float], typing.Callable[[], typing.Any]]] = {}
+_COUNTER = itertools.count()
+
+
+def register(name: str):
+    """Get decorator to register benchmark setup function,
+    setup function receives scale and returns the function to time.
+
+    Args:
+        name (str): Benchmark name.
+    """
+
+    def _decorator(func):
+        BENCHMARKS[name] = func
+        return func
+    return _decorator
+
+
+def _unique_name(prefix: str) -> str:
+    return f'{prefix}{next(_COUNTER)}'
+
+
+def _execute(schema_: graphene.Schema, query: str):
+    ret = schema_.execute(query)
+    if ret.errors:
+        raise ret.errors[0]
+    return ret
+
+
+def _scaled(v: int, scale: float) -> int:
+    return max(int(v * scale), 1)
+
+
+@register('parse_wide_schema')
+def _parse_wide_schema(scale):
+    width = _scaled(200, scale)
+    definition = {f'field{i}': 'String' for i in range(width)}
+
+    def _run():
+        schema.FieldDefinition.parse(
+            definition, default={'name': _unique_name('Wide')}).as_type()
+    return _run
+
+
+@register('parse_deep_schema')
+def _parse_deep_schema(scale):
+    depth = _scaled(30, scale)
+    definition: typing.Any = {'leaf': 'String'}
+    for i in range(depth):
+        definition = {'value': 'Int', f'child{i}': definition}
+
+    def _run():
+        schema.FieldDefinition.parse(
+            definition, default={'name': _unique_name('Deep')}).as_type()
+    return _run
+
+
+@register('resolver_subclass')
+def _resolver_subclass(scale):
+    count = _scaled(50, scale)
+
+    def _run():
+        for _ in range(count):
+            type(_unique_name('Bench'), (resolver.Resolver,), dict(
+                schema={
+                    'args': {'id': 'ID!'},
+                    'type': {'name': 'String', 'value': 'Int', 'tags': ['String']},
+                },
+            ))
+    return _run
+
+
+def _list_schema(type_def, items):
+    class Items(resolver.Resolver):
+        schema = {'type': [type_def], 'name': _unique_name('Items')}
+
+        @staticmethod
+        def resolve(parent, info):
+            return items
+
+    class Query(graphene.ObjectType):
+        items = Items.as_field()
+
+    return graphene.Schema(query=Query)
+
+
+@register('resolve_scalar_list')
+def _resolve_scalar_list(scale):
+    schema_ = _list_schema('Int', list(range(_scaled(10000, scale))))
+    return lambda: _execute(schema_, '{ items }')
+
+
+@register('resolve_mapping_list')
+def _resolve_mapping_list(scale):
+    schema_ = _list_schema(
+        {'name': 'String', 'value': 'Int'},
+        [{'name': str(i), 'value': i} for i in range(_scaled(10000, scale))])
+    return lambda: _execute(schema_, '{ items { name value } }')
+
+
+def _default_resolver_calls(resolver_fn, scale):
+    # Field resolvers are bound like graphene does when building schema.
+    fields = [functools.partial(resolver_fn, i, None) for i in 'abcd']
+    items = [{'a': i, 'b': i, 'c': i, 'd': i} for i in range(_scaled(10000, scale))]
+
+    def _run():
+        for item in items:
+            for field in fields:
+                field(item, None)
+    return _run
+
+
+@register('default_resolver_fields')
+def _default_resolver_fields(scale):
+    return _default_resolver_calls(graphene.types.resolver.get_default_resolver(), scale)
+
+
+@register('default_resolver_fields_patched')
+def _default_resolver_fields_patched(scale):
+    # Compare with `default_resolver_fields` for the per-field cost
+    # of `connection.patch_lazy_default_resolver`.
+    default_resolver = graphene.types.resolver.get_default_resolver()
+    connection.patch_lazy_default_resolver()
+    try:
+        patched = graphene.types.resolver.get_default_resolver()
+    finally:
+        graphene.types.resolver.set_default_resolver(default_resolver)
+    return _default_resolver_calls(patched, scale)
+
+
+@register('union_resolve_type')
+def _union_resolve_type(scale):
+    type_names = [_unique_name('Member') for _ in range(3)]
+    members = [
+        type(i, (resolver.Resolver,), dict(schema={f'{i}Value': 'Int'}))
+        for i in type_names
+    ]
+    schema_ = _list_schema(
+        {'name': _unique_name('Mixed'), 'type': tuple(members)},
+        [{'__typename': type_names[i % 3], f'{type_names[i % 3]}Value': i}
+         for i in range(_scaled(10000, scale))])
+    query = '{ items { %s } }' % ' '.join(
+        f'... on {i} {{ {i}Value }}' for i in type_names)
+    return lambda: _execute(schema_, query)
+
+
+@register('connection_resolve')
+def _connection_resolve(scale):
+    items = list(range(_scaled(100000, scale)))
+    first = _scaled(10000, scale)
+
+    def _run():
+        ret = connection.resolve(items, first=first)
+        return ret.edges, ret.pageInfo.end_cursor
+    return _run
+
+
+@register('connection_execute')
+def _connection_execute(scale):
+    items = [{'name': str(i)} for i in range(_scaled(100000, scale))]
+    first = _scaled(10000, scale)
+    node_name = _unique_name('Node')
+
+    class Node(resolver.Resolver):
+        schema = {'name': node_name, 'type': {'name': 'String'}}
+
+    class Nodes(resolver.Resolver):
+        schema = connection.get_type(Node)
+
+        def resolve(self, **kwargs):
+            return connection.resolve(items, **kwargs)
+
+    class Query(graphene.ObjectType):
+        nodes = Nodes.as_field()
+
+    schema_ = graphene.Schema(query=Query)
+    query = ('{ nodes(first: %d) { edges { node { name } cursor } '
+             'pageInfo { hasNextPage endCursor } } }' % first)
+    return lambda: _execute(schema_, query)
+
+
+def run(
+        names: typing.Iterable[str] = None,
+        *,
+        repeat: int = 5,
+        scale: float = 1.0,
+) -> typing.Dict[str, typing.Any]:
+    """Run benchmarks.
+
+    Args:
+        names (typing.Iterable[str], optional): Benchmark names,
+            defaults to None, run all registered benchmarks.
+        repeat (int, optional): Timing repeat count for each benchmark. Defaults to 5.
+        scale (float, optional): Multiplier of data size. Defaults to 1.0.
+
+    Returns:
+        typing.Dict[str, typing.Any]: Json serializable results.
+    """
+
+    results = {}
+    for name in (names or BENCHMARKS):
+        func = BENCHMARKS[name](scale)
+        func()  # Warm up.
+        timings = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            func()
+            timings.append(time.perf_counter() - start)
+        results[name] = dict(
+            min=min(timings),
+            median=statistics.median(timings),
+            mean=statistics.mean(timings),
+            repeat=repeat,
+        )
+    return dict(
+        version=__version__,
+        python=platform.python_version(),
+        implementation=platform.python_implementation(),
+        scale=scale,
+        results=results,
+    )
+
+
+def compare(
+        base: typing.Mapping[str, typing.Any],
+        current: typing.Mapping[str, typing.Any],
+) -> typing.Dict[str, float]:
+    """Compare min timing of two runs.
+
+    Args:
+        base (typing.Mapping[str, typing.Any]): Base result of `run`.
+        current (typing.Mapping[str, typing.Any]): Current result of `run`.
+
+    Returns:
+        typing.Dict[str, float]: Ratio of current to base by benchmark name,
+            only benchmarks exists in both.
+    """
+
+    return {
+        k: v['min'] / base['results'][k]['min']
+        for k, v in current['results'].items()
+        if k in base['results'] and base['results'][k]['min']
+    }
+
+
+def main(argv: typing.Sequence[str] = None) -> int:
+    """Command line entry.
+
+    Args:
+        argv (typing.Sequence[str], optional): Arguments. Defaults to None, use `sys.argv`.
+
+    Returns:
+        int: Exit code, 1 when regression exceeds threshold.
+    """
+
+    parser = argparse.ArgumentParser(
+        prog='python -m graphene_resolver.bench',
+        description=__doc__.split('\n')[0])
+    parser.add_argument('names', nargs='*', metavar='name',
+                        help=f'benchmarks to run, defaults to all: {", ".join(BENCHMARKS)}')
+    parser.add_argument('-o', '--output', help='write json results to file')
+    parser.add_argument('-r', '--repeat', type=int, default=5)
+    parser.add_argument('-s', '--scale', type=float, default=1.0,
+                        help='multiplier of data size')
+    parser.add_argument('-c', '--compare', help='json results of previous run')
+    parser.add_argument('-t', '--threshold', type=float, default=1.2,
+                        help='max allowed ratio to compared run')
+    args = parser.parse_args(argv)
+    unknown = [i for i in args.names if i not in BENCHMARKS]
+    if unknown:
+        parser.error(f'unknown benchmark: {", ".join(unknown)}')
+
+    result = run(args.names, repeat=args.repeat, scale=args.scale)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(result, f, indent=2)
+
+    ratios = {}
+    if args.compare:
+        with open(args.compare, encoding='utf-8') as f:
+            ratios = compare(json.load(f), result)
+    for name, v in result['results'].items():
+        line = f'{name:<32} min {v["min"] * 1000:10.3f}ms  median {v["median"] * 1000:10.3f}ms'
+        if name in ratios:
+            line += f'  x{ratios[name]:.2f}'
+        print(line)
+    regressions = sorted(k for k, v in ratios.items() if v > args.threshold)
+    if regressions:
+        print(f'Regression over x{args.threshold}: {", ".join(regressions)}',
+              file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
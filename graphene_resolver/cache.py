@@ -0,0 +1,193 @@
+"""Cross-request resolver result cache with TTL and LRU eviction.  """
+
+import collections
+import dataclasses
+import inspect
+import threading
+import time
+import typing
+
+from promise import Promise
+
+from . import context as context_
+
+DEFAULT_MAXSIZE = 1024
+
+
+@dataclasses.dataclass
+class Stats:
+    """Cache statistics.  """
+
+    hits: int = 0
+    misses: int = 0
+    size: int = 0
+
+
+def default_key(parent: typing.Any, **kwargs) -> typing.Hashable:
+    """Default cache key for resolver call,
+    parent is used as-is so it should be hashable.
+
+    Args:
+        parent (typing.Any): Parent value.
+
+    Returns:
+        typing.Hashable: Cache key.
+    """
+
+    return (context_.freeze(parent), context_.freeze(kwargs))
+
+
+class Cache:
+    """Thread-safe cache with TTL and LRU eviction.  """
+
+    ttl: typing.Optional[float]
+    maxsize: typing.Optional[int]
+    key: typing.Callable[..., typing.Hashable]
+
+    def __init__(
+            self,
+            *,
+            ttl: float = None,
+            maxsize: typing.Optional[int] = DEFAULT_MAXSIZE,
+            key: typing.Callable[..., typing.Hashable] = None,
+            timer: typing.Callable[[], float] = time.monotonic,
+    ) -> None:
+        if maxsize is not None and maxsize < 1:
+            raise ValueError(f'Cache maxsize should be positive, got {maxsize}')
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self.key = key or default_key
+        self._timer = timer
+        self._lock = threading.Lock()
+        self._data: typing.MutableMapping[
+            typing.Hashable,
+            typing.Tuple[typing.Optional[float], typing.Any]
+        ] = collections.OrderedDict()
+        self._hits = 0
+        self._misses = 0
+
+    @classmethod
+    def parse(cls, v: typing.Union[bool, typing.Mapping]) -> 'Cache':
+        """Create cache from schema option.
+
+        Args:
+            v (typing.Union[bool, typing.Mapping]): `True` or mapping of options.
+
+        Returns:
+            Cache: Created cache.
+        """
+
+        if v is True:
+            return cls()
+        if isinstance(v, typing.Mapping):
+            return cls(**v)
+        raise ValueError(f'Cache option should be True or a mapping, got {v}')
+
+    def get(self, key: typing.Hashable) -> typing.Tuple[bool, typing.Any]:
+        """Get cached value.
+
+        Args:
+            key (typing.Hashable): Cache key.
+
+        Returns:
+            typing.Tuple[bool, typing.Any]: Whether found, and cached value.
+        """
+
+        with self._lock:
+            try:
+                expires_at, value = self._data[key]
+            except KeyError:
+                self._misses += 1
+                return False, None
+            if expires_at is not None and expires_at <= self._timer():
+                del self._data[key]
+                self._misses += 1
+                return False, None
+            self._data.move_to_end(key)
+            self._hits += 1
+            return True, value
+
+    def set(self, key: typing.Hashable, value: typing.Any) -> None:
+        """Set cached value, least recently used value will be evicted
+        when exceed `maxsize`.
+
+        Args:
+            key (typing.Hashable): Cache key.
+            value (typing.Any): Value to cache.
+        """
+
+        expires_at = None if self.ttl is None else self._timer() + self.ttl
+        with self._lock:
+            self._data[key] = (expires_at, value)
+            self._data.move_to_end(key)
+            if self.maxsize is not None:
+                while len(self._data) > self.maxsize:
+                    self._data.popitem(last=False)
+
+    def invalidate(self, key: typing.Hashable) -> bool:
+        """Remove cached value.
+
+        Args:
+            key (typing.Hashable): Cache key.
+
+        Returns:
+            bool: Whether value was cached.
+        """
+
+        with self._lock:
+            return self._data.pop(key, None) is not None
+
+    def clear(self) -> None:
+        """Remove all cached values and reset statistics.  """
+
+        with self._lock:
+            self._data.clear()
+            self._hits = 0
+            self._misses = 0
+
+    def stats(self) -> Stats:
+        """Get cache statistics.
+
+        Returns:
+            Stats: Current statistics.
+        """
+
+        with self._lock:
+            return Stats(hits=self._hits, misses=self._misses, size=len(self._data))
+
+    def get_or_call(self, key: typing.Hashable, fn: typing.Callable[[], typing.Any]):
+        """Get cached value, call function and cache result on miss.
+        promise and awaitable result will be cached after resolved,
+        function result is not cached when key is not hashable.
+
+        Args:
+            key (typing.Hashable): Cache key.
+            fn (typing.Callable[[], typing.Any]): Function to call on miss.
+
+        Returns:
+            typing.Any: Cached value or function result.
+        """
+
+        try:
+            hash(key)
+        except TypeError:
+            # e.g. parent is a dataclass with `eq=True`.
+            return fn()
+        found, value = self.get(key)
+        if found:
+            return value
+        ret = fn()
+        if isinstance(ret, Promise):
+            def _set(v):
+                self.set(key, v)
+                return v
+            return ret.then(_set)
+        if inspect.isawaitable(ret):
+            return self._set_async(key, ret)
+        self.set(key, ret)
+        return ret
+
+    async def _set_async(self, key: typing.Hashable, awaitable: typing.Awaitable):
+        ret = await awaitable
+        self.set(key, ret)
+        return ret
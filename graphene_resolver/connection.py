@@ -1,12 +1,26 @@
 """Relay compatible connection resolver.  """
 
+import asyncio
+import binascii
+import collections.abc
+import functools
+import inspect
+import itertools
+import json
 import re
+import time
 import typing
 
 import graphene
+import graphql
 import lazy_object_proxy as lazy
-from graphql_relay.connection import arrayconnection
+# Kept as module attribute for compatibility.
+from graphql_relay.connection import arrayconnection  # pylint:disable=unused-import
+from graphql_relay.utils import base64, unbase64
 
+from . import cache as cache_
+from . import context as context_
+from . import metrics
 from . import resolver
 from . import schema as schema_
 
@@ -28,7 +42,10 @@ def _get_node_name(node: typing.Union[resolver.Resolver, str, typing.Any]) -> st
 def build_schema(
         node: typing.Union[resolver.Resolver, str, typing.Any],
         *,
-        name: str = None,) -> dict:
+        name: str = None,
+        max_page_size: int = None,
+        default_page_size: int = None,
+        total_count_is_estimate: bool = False,) -> dict:
     """Build a github-like connection resolver schema.
     see at https://developer.github.com/v4/explorer/
 
@@ -36,6 +53,12 @@ def build_schema(
         node (typing.Union[resolver.Resolver, str, typing.Any]): Node resolver or schema.
         name (str, optional): Override default connection name,
             required when node name is not defined.
+        max_page_size (int, optional): Max value of `first` and `last`,
+            exceeded value is rejected with error. Defaults to None.
+        default_page_size (int, optional): `first` value when neither `first` nor `last`
+            is given, defaults to `max_page_size`.
+        total_count_is_estimate (bool, optional): Add `totalCountIsEstimate` field,
+            for `approximate_count` option of `resolve`. Defaults to False.
 
     Returns:
         dict: dict for Resolver schema.
@@ -43,10 +66,28 @@ def build_schema(
 
     name = name or f'{_get_node_name(node)}Connection'
     edge_name = f"{re.sub('Connection$', '', name)}Edge"
+    node_field = {
+        'type': node,
+        'description': 'The item at the end of the edge.',
+    }
+    if not (isinstance(node, type) and issubclass(node, resolver.Resolver)):
+        # Resolver node gets edge as parent, keep it unchanged.
+        node_field['resolver'] = _lazy_field_resolver('node')
+
+    _check_page_size(max_page_size, default_page_size)
+    size_description = (f' At most {max_page_size}.'
+                        if max_page_size is not None
+                        else '')
 
-    return dict(
+    ret = dict(
         name=name,
         description=f"The connection type for {re.sub('Connection$', '', name)}.",
+        prepare_kwargs=(
+            functools.partial(_prepare_page_size_kwargs,
+                              max_page_size=max_page_size,
+                              default_page_size=default_page_size)
+            if max_page_size is not None or default_page_size is not None
+            else None),
         args=dict(
             after={
                 'type': 'String',
@@ -60,11 +101,11 @@ def build_schema(
             },
             first={
                 'type': 'Int',
-                'description': 'Returns the first _n_ elements from the list.'
+                'description': f'Returns the first _n_ elements from the list.{size_description}'
             },
             last={
                 'type': 'Int',
-                'description': 'Returns the last _n_ elements from the list.'
+                'description': f'Returns the last _n_ elements from the list.{size_description}'
             },
         ),
         type={
@@ -72,39 +113,51 @@ def build_schema(
                 'type': [{
                     'name': edge_name,
                     'type': {
-                        'node': {
-                            'type': node,
-                            'description': 'The item at the end of the edge.',
-                        },
+                        'node': node_field,
                         'cursor': {
                             'type': 'String!',
-                            'description': 'A cursor for use in pagination.'
+                            'description': 'A cursor for use in pagination.',
+                            'resolver': _lazy_field_resolver('cursor'),
                         },
                     },
                 }],
-                'description': 'A list of edges.'
+                'description': 'A list of edges.',
+                'resolver': _lazy_field_resolver('edges'),
             },
             'nodes': {
                 'type': [node],
-                'description': 'A list of nodes.'
+                'description': 'A list of nodes.',
+                'resolver': _lazy_field_resolver('nodes'),
             },
             'pageInfo': {
                 'type': graphene.relay.PageInfo,
                 'required': True,
                 'description': 'Information to aid in pagination.',
+                'resolver': _resolve_lazy_page_info,
             },
             'totalCount': {
                 'type': 'Int!',
                 'description': 'Identifies the total count of items in the connection.',
+                'resolver': _lazy_field_resolver('totalCount'),
             },
         }
     )
+    if total_count_is_estimate:
+        ret['type']['totalCountIsEstimate'] = {
+            'type': 'Boolean!',
+            'description': 'Whether `totalCount` is an estimated value.',
+            'resolver': _lazy_field_resolver('totalCountIsEstimate'),
+        }
+    return ret
 
 
 def get_type(
         node: typing.Union[resolver.Resolver, str, typing.Any],
         *,
         name: str = None,
+        max_page_size: int = None,
+        default_page_size: int = None,
+        total_count_is_estimate: bool = False,
 ) -> resolver.Resolver:
     """Get connection resolver from registry.
     one will be created with `build_schema` if not found in registry.
@@ -113,32 +166,118 @@ def get_type(
         node (typing.Union[resolver.Resolver, str, typing.Any]): Node resolver or schema.
         name (str, optional): Override default connection name,
             required when node name is not defined.
+        max_page_size (int, optional): See `build_schema`.
+        default_page_size (int, optional): See `build_schema`.
+        total_count_is_estimate (bool, optional): See `build_schema`.
+
+    Raises:
+        ValueError: When resolver with same name registered with different options.
 
     Returns:
         resolver.Resolver: Created connection resolver, same name will returns same resolver.
     """
 
     name = name or f'{_get_node_name(node)}Connection'
+    options = dict(
+        max_page_size=max_page_size,
+        default_page_size=default_page_size,
+        total_count_is_estimate=total_count_is_estimate,
+    )
 
     if name in REGISTRY:
-        return REGISTRY[name]
+        registered = REGISTRY[name]
+        registered_options = getattr(registered, '_connection_options', options)
+        if registered_options != options:
+            raise ValueError(
+                f'Connection `{name}` already registered with options '
+                f'{registered_options}, got {options}')
+        return registered
 
     REGISTRY[name] = type(
         name, (resolver.Resolver,),
-        dict(schema=build_schema(node, name=name))
+        dict(
+            schema=build_schema(node, name=name, **options),
+            _connection_options=options,
+        )
     )
 
     return REGISTRY[name]
 
 
+def _check_count_cache(count_cache: typing.Optional[cache_.Cache], count_key: typing.Hashable):
+    if count_cache is not None and count_key is None:
+        raise ValueError('`count_key` is required when `count_cache` is given')
+
+
+def _check_page_size(max_page_size: typing.Optional[int], default_page_size: typing.Optional[int]):
+    if max_page_size is not None and max_page_size < 1:
+        raise ValueError(f'Max page size should be positive, got {max_page_size}')
+    if default_page_size is not None and default_page_size < 1:
+        raise ValueError(f'Default page size should be positive, got {default_page_size}')
+    if (max_page_size is not None
+            and default_page_size is not None
+            and default_page_size > max_page_size):
+        raise ValueError(
+            f'Default page size {default_page_size} exceeds max page size {max_page_size}')
+
+
+def _limit_page_size(
+        first: typing.Optional[int],
+        last: typing.Optional[int],
+        max_page_size: typing.Optional[int],
+        default_page_size: typing.Optional[int],
+) -> typing.Tuple[typing.Optional[int], typing.Optional[int]]:
+    if first is None and last is None:
+        first = default_page_size if default_page_size is not None else max_page_size
+    if max_page_size is not None:
+        for arg, value in (('first', first), ('last', last)):
+            if value is not None and value > max_page_size:
+                raise graphql.GraphQLError(
+                    f'`{arg}` exceeds max page size {max_page_size}, got {value}')
+    return first, last
+
+
+def _prepare_page_size_kwargs(kwargs, *, max_page_size, default_page_size):
+    first, _ = _limit_page_size(
+        kwargs.get('first'), kwargs.get('last'), max_page_size, default_page_size)
+    if first is None:
+        return kwargs
+    return {**kwargs, 'first': first}
+
+
 def _get_lazy_wrapped(v):
     if not isinstance(v, lazy.Proxy):
         return v
     return _get_lazy_wrapped(v.__wrapped__)
 
 
+def _resolve_lazy_field(name: str, parent, info):
+    default_resolver = graphene.types.resolver.get_default_resolver()
+    return _get_lazy_wrapped(default_resolver(name, None, parent, info))
+
+
+def _lazy_field_resolver(name: str) -> typing.Callable:
+    def _resolve(parent, info, **_):
+        return _resolve_lazy_field(name, parent, info)
+    return _resolve
+
+
+def _resolve_lazy_page_info(parent, info, **_):
+    ret = _resolve_lazy_field('pageInfo', parent, info)
+    if ret is None or isinstance(ret, PageInfo):
+        return ret
+    return PageInfo(**{
+        k: Deferred(functools.partial(_resolve_lazy_field, k, ret, info))
+        for k in PageInfo.FIELDS
+    })
+
+
 def patch_lazy_default_resolver() -> None:
-    """Patch graphene default resolver to support lazy object proxy.  """
+    """Patch graphene default resolver to support lazy object proxy.
+
+    Fields of connection types from `build_schema` already unwrap lazy object proxy,
+    only use this when proxy is returned for other fields, it slows down every field.
+    """
 
     default_resolver = graphene.types.resolver.get_default_resolver()
 
@@ -154,93 +293,1008 @@ def patch_lazy_default_resolver() -> None:
         _lazy_patched_default_resolver)
 
 
-patch_lazy_default_resolver()
+class Deferred:
+    """Value that computed on first access of `Connection` or `PageInfo` field.  """
+
+    __slots__ = ('fn',)
+
+    def __init__(self, fn: typing.Callable[[], typing.Any]):
+        self.fn = fn
+
+
+def _once(fn: typing.Callable[[], typing.Any]) -> typing.Callable[[], typing.Any]:
+    ret = []
+
+    def _wrapped():
+        if not ret:
+            ret.append(fn())
+        return ret[0]
+    return _wrapped
+
+
+def _deferred_property(slot: str) -> property:
+    def _get(self):
+        ret = getattr(self, slot)
+        if isinstance(ret, Deferred):
+            ret = ret.fn()
+            setattr(self, slot, ret)
+        return ret
+    return property(_get)
+
+
+class PageInfo(collections.abc.Mapping):
+    """Relay page info, field value can be `Deferred`.
+    also a read-only mapping of `FIELDS` for compatibility.  """
+
+    FIELDS = ('start_cursor', 'end_cursor', 'has_previous_page', 'has_next_page')
+    __slots__ = tuple(f'_{i}' for i in FIELDS)
+
+    start_cursor = _deferred_property('_start_cursor')
+    end_cursor = _deferred_property('_end_cursor')
+    has_previous_page = _deferred_property('_has_previous_page')
+    has_next_page = _deferred_property('_has_next_page')
+
+    def __init__(
+            self,
+            *,
+            start_cursor=None,
+            end_cursor=None,
+            has_previous_page=False,
+            has_next_page=False,
+    ):
+        self._start_cursor = start_cursor
+        self._end_cursor = end_cursor
+        self._has_previous_page = has_previous_page
+        self._has_next_page = has_next_page
+
+    def __getitem__(self, key: str):
+        if key not in self.FIELDS:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __iter__(self):
+        return iter(self.FIELDS)
+
+    def __len__(self):
+        return len(self.FIELDS)
+
+    def __contains__(self, key):
+        # Not compute deferred value.
+        return key in self.FIELDS
+
+
+class Connection(collections.abc.Mapping):
+    """Connection data that returned by `resolve`, field value can be `Deferred`.
+    also a read-only mapping of `FIELDS` for compatibility.  """
+    # pylint:disable=invalid-name
+
+    FIELDS = ('nodes', 'edges', 'pageInfo', 'totalCount', 'totalCountIsEstimate')
+    __slots__ = tuple(f'_{i}' for i in FIELDS)
+
+    nodes = _deferred_property('_nodes')
+    edges = _deferred_property('_edges')
+    pageInfo = _deferred_property('_pageInfo')
+    totalCount = _deferred_property('_totalCount')
+    totalCountIsEstimate = _deferred_property('_totalCountIsEstimate')
+
+    def __init__(
+            self,
+            *,
+            nodes=None,
+            edges=None,
+            page_info=None,
+            total_count=None,
+            total_count_is_estimate=False,
+    ):
+        self._nodes = nodes
+        self._edges = edges
+        self._pageInfo = page_info
+        self._totalCount = total_count
+        self._totalCountIsEstimate = total_count_is_estimate
+
+    def __getitem__(self, key: str):
+        if key not in self.FIELDS:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __iter__(self):
+        return iter(self.FIELDS)
+
+    def __len__(self):
+        return len(self.FIELDS)
+
+    def __contains__(self, key):
+        # Not compute deferred value.
+        return key in self.FIELDS
+
+
+OFFSET_PREFIX = 'arrayconnection:'
+COMPACT_PREFIX = '~'
+# Base64 of first 15 bytes of prefix is constant, only rest bytes need encoding.
+_OFFSET_PREFIX_HEAD = binascii.b2a_base64(
+    OFFSET_PREFIX[:15].encode(), newline=False).decode()
+_OFFSET_PREFIX_TAIL = OFFSET_PREFIX[15:].encode()
+
+
+def offset_to_cursor(offset: int, *, compact: bool = False) -> str:
+    """Encode offset as cursor, same as `graphql_relay` one by default.
+
+    Args:
+        offset (int): Item offset.
+        compact (bool, optional): Use compact format. Defaults to False.
+
+    Returns:
+        str: Cursor.
+    """
+
+    if compact:
+        return f'{COMPACT_PREFIX}{offset}'
+    return _OFFSET_PREFIX_HEAD + binascii.b2a_base64(
+        _OFFSET_PREFIX_TAIL + str(offset).encode(), newline=False).decode()
+
+
+def offsets_to_cursors(start: int, stop: int, *, compact: bool = False) -> typing.List[str]:
+    """Encode contiguous offset range as cursors.
+
+    Args:
+        start (int): First offset.
+        stop (int): Offset after last one.
+        compact (bool, optional): Use compact format. Defaults to False.
+
+    Returns:
+        typing.List[str]: Cursors.
+    """
+
+    if compact:
+        return [f'{COMPACT_PREFIX}{i}' for i in range(start, stop)]
+    head, tail, b2a = _OFFSET_PREFIX_HEAD, _OFFSET_PREFIX_TAIL, binascii.b2a_base64
+    return [head + b2a(tail + str(i).encode(), newline=False).decode()
+            for i in range(start, stop)]
+
+
+def cursor_to_offset(cursor: str) -> typing.Optional[int]:
+    """Decode cursor in both compact and `graphql_relay` format.
+
+    Args:
+        cursor (str): Cursor.
+
+    Returns:
+        typing.Optional[int]: Offset, `None` if cursor is invalid.
+    """
+
+    try:
+        if cursor.startswith(COMPACT_PREFIX):
+            return int(cursor[len(COMPACT_PREFIX):])
+        value = binascii.a2b_base64(cursor.encode()).decode()
+        if not value.startswith(OFFSET_PREFIX):
+            return None
+        return int(value[len(OFFSET_PREFIX):])
+    except (binascii.Error, UnicodeError, ValueError, AttributeError):
+        return None
+
+
+def _get_offset(cursor: typing.Optional[str], default: typing.Optional[int]):
+    if not isinstance(cursor, str):
+        return default
+    ret = cursor_to_offset(cursor)
+    return default if ret is None else ret
+
+
+class PageableSource:
+    """Data source that connection fetch page from,
+    subclass should implement `count` and `fetch`.  """
+
+    def count(self) -> int:
+        """Get total count of items.
+
+        Returns:
+            int: Total count.
+        """
+
+        raise NotImplementedError()
+
+    def fetch(self, offset: int, limit: typing.Optional[int]) -> typing.Sequence:
+        """Fetch items.
+
+        Args:
+            offset (int): Start index.
+            limit (typing.Optional[int]): Max items count, `None` for no limit.
+
+        Returns:
+            typing.Sequence: Items.
+        """
+
+        raise NotImplementedError()
+
+    def estimate_count(self) -> typing.Optional[int]:
+        """Get estimated total count, should be cheaper than `count`.
+
+        Returns:
+            typing.Optional[int]: Estimated count, `None` if not supported.
+        """
+        # pylint:disable=no-self-use
+        return None
+
+    def fetch_last(self, limit: int, skip: int) -> typing.Optional[typing.Sequence]:
+        """Fetch items from the end, e.g. `ORDER BY id DESC LIMIT limit OFFSET skip` then reverse,
+        so `last` does not require total count.
+
+        Args:
+            limit (int): Max items count.
+            skip (int): Items count to skip at the end.
+
+        Returns:
+            typing.Optional[typing.Sequence]: Items in original order,
+                `None` if not supported.
+        """
+        # pylint:disable=no-self-use,unused-argument
+        return None
+
+
+class SequenceSource(PageableSource):
+    """Pageable source for sliceable sequence.  """
+
+    def __init__(self, sequence, length: int = None):
+        self.sequence = sequence
+        self.length = length
+
+    def count(self) -> int:
+        if self.length is None:
+            return len(self.sequence)
+        return self.length
+
+    def fetch(self, offset: int, limit: typing.Optional[int]) -> typing.Sequence:
+        return self.sequence[offset:None if limit is None else offset + limit]
+
+
+class IteratorSource(PageableSource):
+    """Pageable source for iterator (e.g. generator),
+    page is read with `itertools.islice` so memory scale with page size.
+    iterator can only be fetched once.
+    """
+
+    def __init__(
+            self,
+            iterator: typing.Iterator,
+            length: int = None,
+            *,
+            count: typing.Callable[[], int] = None,
+    ):
+        self.iterator = iterator
+        self.length = length
+        self._count = count
+
+    def count(self) -> int:
+        if self.length is not None:
+            return self.length
+        if self._count is None:
+            raise NotImplementedError(
+                'Iterator total count requires `length` or `count`.')
+        return self._count()
+
+    def fetch(self, offset: int, limit: typing.Optional[int]) -> typing.Sequence:
+        return list(itertools.islice(
+            self.iterator,
+            offset,
+            None if limit is None else offset + limit))
+
+
+class DBAPISource(PageableSource):
+    """Pageable source for a sql query, executed with DB-API cursor.
+
+    `count` executes `SELECT COUNT(*)` on the query,
+    `fetch` executes the query with `LIMIT` and `OFFSET`,
+    query without limit will skip offset rows on client side.
+    """
+
+    def __init__(
+            self,
+            cursor,
+            sql: str,
+            params: typing.Union[typing.Sequence, typing.Mapping] = (),
+    ):
+        self.cursor = cursor
+        self.sql = sql
+        self.params = params
+
+    def count(self) -> int:
+        self.cursor.execute(
+            f'SELECT COUNT(*) FROM ({self.sql}) AS _count', self.params)
+        return self.cursor.fetchone()[0]
+
+    def fetch(self, offset: int, limit: typing.Optional[int]) -> typing.Sequence:
+        if limit is None:
+            self.cursor.execute(self.sql, self.params)
+            return self.cursor.fetchall()[offset:]
+        self.cursor.execute(
+            f'{self.sql} LIMIT {int(limit)} OFFSET {int(offset)}', self.params)
+        return self.cursor.fetchall()
+
+
+class _MeteredSource(PageableSource):
+    """Record source operation metrics.  """
+
+    def __init__(self, source: PageableSource, registry: metrics.Registry):
+        self.source = source
+        self.registry = registry
+        self.name = type(source).__name__
+
+    def _observe(self, operation: str, start: float, page=None):
+        self.registry.observe('graphene_resolver_connection_source_seconds',
+                              time.perf_counter() - start,
+                              source=self.name, operation=operation)
+        if page is not None:
+            self.registry.observe('graphene_resolver_connection_page_size',
+                                  len(page), buckets=metrics.SIZE_BUCKETS,
+                                  source=self.name)
+
+    def count(self) -> int:
+        start = time.perf_counter()
+        ret = self.source.count()
+        self._observe('count', start)
+        return ret
+
+    def fetch(self, offset: int, limit: typing.Optional[int]) -> typing.Sequence:
+        start = time.perf_counter()
+        ret = self.source.fetch(offset, limit)
+        self._observe('fetch', start, ret)
+        return ret
+
+    def estimate_count(self) -> typing.Optional[int]:
+        start = time.perf_counter()
+        ret = self.source.estimate_count()
+        self._observe('estimate_count', start)
+        return ret
+
+    def fetch_last(self, limit: int, skip: int) -> typing.Optional[typing.Sequence]:
+        start = time.perf_counter()
+        ret = self.source.fetch_last(limit, skip)
+        self._observe('fetch_last', start, ret)
+        return ret
+
+
+def _get_tail_skip(first, last, after_offset, before_offset) -> typing.Optional[int]:
+    # Page can be fetched from the end when only bounded by `last`
+    # and `before` cursor that also created from the end.
+    if not isinstance(last, int) or isinstance(first, int) or after_offset is not None:
+        return None
+    if before_offset is None:
+        return 0
+    if before_offset < 0:
+        return -before_offset
+    return None
+
+
+def _get_tail_page(
+        items: typing.Optional[typing.Sequence],
+        last: int,
+) -> typing.Optional[typing.Tuple[typing.Sequence, bool]]:
+    if items is None:
+        return None
+    if len(items) > last:
+        return items[len(items) - last:], True
+    return items, False
+
+
+def _is_length_required(first, last, after_offset, before_offset) -> bool:
+    return ((after_offset is not None and after_offset < 0)
+            or (before_offset is not None and before_offset < 0)
+            or (isinstance(last, int)
+                and before_offset is None
+                and not isinstance(first, int)))
+
+
+def _get_offset_range(
+        first: typing.Optional[int],
+        last: typing.Optional[int],
+        after_offset: typing.Optional[int],
+        before_offset: typing.Optional[int],
+        get_length: typing.Callable[[], int],
+) -> typing.Tuple[int, typing.Optional[int], int, typing.Optional[int]]:
+    # Negative offset is counted from the end, created by `fetch_last` page.
+    if after_offset is None:
+        after_index = 0
+    elif after_offset < 0:
+        after_index = max(get_length() + after_offset, -1) + 1
+    else:
+        after_index = after_offset + 1
+    before_index = before_offset
+    if before_offset is not None and before_offset < 0:
+        before_index = max(get_length() + before_offset, 0)
+
+    end_index = before_index
+    if isinstance(first, int):
+        end_index = (min(after_index + first, end_index)
+                     if end_index is not None
+                     else after_index + first)
+    start_index = after_index
+    if isinstance(last, int):
+        start_index = max((get_length()
+                           if end_index is None
+                           else end_index) - last, start_index)
+    return after_index, before_index, start_index, end_index
+
+
+def get_request_count_cache(context: typing.Any) -> typing.Optional[cache_.Cache]:
+    """Get count cache for current request, for `count_cache` option of `resolve`.
+
+    Args:
+        context (typing.Any): `info.context` of resolve info.
+
+    Returns:
+        typing.Optional[cache_.Cache]: Request scoped cache,
+            `None` when context can not hold data.
+    """
+
+    storage = context_.get_storage(context)
+    if storage is None:
+        return None
+    return storage.setdefault('connection_count_cache', cache_.Cache(maxsize=None))
 
 
 def resolve(
         iterable,
         length: int = None,
         *,
+        count: typing.Callable[[], int] = None,
         first: int = None,
         last: int = None,
         after: str = None,
         before: str = None,
+        compact_cursor: bool = False,
+        max_page_size: int = None,
+        default_page_size: int = None,
+        approximate_count: bool = False,
+        count_cache: cache_.Cache = None,
+        count_key: typing.Hashable = None,
         **_,
-) -> dict:
+) -> 'Connection':
     """Resolve iterable to connection
 
     Args:
-        iterable (typing.Iterable): value
+        iterable (typing.Union[typing.Sequence, typing.Iterator, PageableSource]):
+            value, sequence will be wrapped as `SequenceSource`,
+            iterator will be wrapped as `IteratorSource`.
         length (int, Optional): defaults to `len(iterable)`,
             iterable length.
+        count (typing.Callable[[], int], Optional): Lazy total count for iterator,
+            only called when needed.
+        compact_cursor (bool, Optional): Use compact cursor format,
+            both format is accepted as `after` and `before`. Defaults to False.
+        max_page_size (int, Optional): Max value of `first` and `last`,
+            exceeded value raises `graphql.GraphQLError`. Defaults to None.
+        default_page_size (int, Optional): `first` value when neither `first` nor `last`
+            is given, defaults to `max_page_size`.
+        approximate_count (bool, Optional): Use `estimate_count` of source for `totalCount`
+            when it returns a value, `totalCountIsEstimate` will be true. Defaults to False.
+        count_cache (cache_.Cache, Optional): Cache exact count with `count_key`,
+            e.g. a `cache.Cache` with ttl or `get_request_count_cache(info.context)`.
+        count_key (typing.Hashable, Optional): Key for `count_cache`, required with it.
+
+    Raises:
+        ValueError: `count_cache` is given without `count_key`.
 
     Returns:
-        dict: Connection data.
+        Connection: Connection data, computed on first access.
     """
-    def _get_length():
-        if length is None:
-            return len(iterable)
-        return length
-    _len = lazy.Proxy(_get_length)
+    _check_count_cache(count_cache, count_key)
+    first, _ = _limit_page_size(first, last, max_page_size, default_page_size)
+    if isinstance(iterable, PageableSource):
+        source = iterable
+    elif isinstance(iterable, typing.Iterator):
+        source = IteratorSource(iterable, length, count=count)
+    else:
+        source = SequenceSource(iterable, length)
+    has_fetch_last = type(source).fetch_last is not PageableSource.fetch_last
+    if metrics.REGISTRY is not None:
+        source = _MeteredSource(source, metrics.REGISTRY)
+    _len = _once(
+        source.count
+        if count_cache is None
+        else lambda: count_cache.get_or_call(count_key, source.count))
 
-    after_index = arrayconnection.get_offset_with_default(after, -1) + 1
-    before_index = arrayconnection.get_offset_with_default(before, None)
+    @_once
+    def _get_total_count():
+        if approximate_count:
+            ret = source.estimate_count()
+            if ret is not None:
+                return ret, True
+        return _len(), False
 
-    def _get_start_index() -> typing.Optional[int]:
-        ret = after_index
-        if isinstance(last, int):
-            _end_index_value = end_index.__wrapped__
-            ret = max((_len
-                       if _end_index_value is None
-                       else _end_index_value) - last, ret)
-        return ret
+    after_offset = _get_offset(after, None)
+    before_offset = _get_offset(before, None)
+    tail_skip = (_get_tail_skip(first, last, after_offset, before_offset)
+                 if has_fetch_last
+                 else None)
 
-    def _get_end_index() -> typing.Optional[int]:
-        ret = before_index
-        if isinstance(first, int):
-            ret = (min(after_index + first, ret)
-                   if ret is not None
-                   else after_index + first)
-        return ret
+    @_once
+    def _get_range() -> typing.Tuple[int, typing.Optional[int], int, typing.Optional[int]]:
+        return _get_offset_range(first, last, after_offset, before_offset, _len)
 
-    start_index = lazy.Proxy(_get_start_index)
-    end_index = lazy.Proxy(_get_end_index)
+    @_once
+    def _fetch_tail():
+        if tail_skip is None:
+            return None
+        return _get_tail_page(source.fetch_last(last + 1, tail_skip), last)
 
-    def _get_nodes():
-        # lazy proxy None can not use as None index.
-        return iterable[start_index.__wrapped__:end_index.__wrapped__]
+    @_once
+    def _fetch():
+        tail = _fetch_tail()
+        if tail is not None:
+            nodes, has_previous_page = tail
+            return nodes, -(tail_skip + len(nodes)), has_previous_page, False
+        after_index, before_index, start, end_index = _get_range()
+        has_previous_page = isinstance(last, int) and start > (
+            after_index + 1 if after else 0)
+        if end_index is None:
+            return source.fetch(
+                start, last if isinstance(last, int) else None), start, has_previous_page, False
+        limit = max(end_index - start, 0)
+        if isinstance(first, int) and not before:
+            # Fetch one more item to know whether has next page.
+            ret = source.fetch(start, limit + 1)
+            return ret[:limit], start, has_previous_page, len(ret) > limit
+        return (source.fetch(start, limit), start, has_previous_page,
+                isinstance(first, int) and end_index < before_index)
 
-    nodes = lazy.Proxy(_get_nodes)
-    edges = lazy.Proxy(lambda: [
-        dict(
-            node=node,
-            cursor=arrayconnection.offset_to_cursor(start_index + i)
-        )
-        for i, node in enumerate(nodes)
-    ])
+    def _get_edges():
+        nodes, start, _, _ = _fetch()
+        cursors = offsets_to_cursors(
+            start, start + len(nodes), compact=compact_cursor)
+        return [dict(node=node, cursor=cursor)
+                for node, cursor in zip(nodes, cursors)]
 
     def _get_start_cursor():
-        end = end_index.__wrapped__
-        start = start_index.__wrapped__
-        if end is not None and end <= start:
+        if tail_skip is not None:
+            return ret.edges[0]['cursor'] if ret.edges else None
+        _, _, start, end_index = _get_range()
+        if end_index is not None and end_index <= start:
             return None
-        return arrayconnection.offset_to_cursor(start)
+        return offset_to_cursor(start, compact=compact_cursor)
 
     def _get_end_cursor():
-        if not edges:
+        if not ret.edges:
             return None
-        return edges[-1]['cursor']
+        return ret.edges[-1]['cursor']
+
+    def _get_has_previous_page():
+        if not isinstance(last, int):
+            return False
+        if tail_skip is not None:
+            return _fetch()[2]
+        after_index, _, start, _ = _get_range()
+        return start > (after_index + 1 if after else 0)
+
+    ret = Connection(
+        nodes=Deferred(lambda: _fetch()[0]),
+        edges=Deferred(_get_edges),
+        page_info=PageInfo(
+            start_cursor=Deferred(_get_start_cursor),
+            end_cursor=Deferred(_get_end_cursor),
+            has_previous_page=Deferred(_get_has_previous_page),
+            has_next_page=Deferred(lambda: _fetch()[3]),
+        ),
+        total_count=Deferred(lambda: _get_total_count()[0]),
+        total_count_is_estimate=Deferred(lambda: _get_total_count()[1]),
+    )
+    return ret
+
+
+class AsyncPageableSource:
+    """Async version of `PageableSource`.  """
+
+    async def count(self) -> int:
+        """Get total count of items.
+
+        Returns:
+            int: Total count.
+        """
+
+        raise NotImplementedError()
+
+    async def fetch(self, offset: int, limit: typing.Optional[int]) -> typing.Sequence:
+        """Fetch items.
+
+        Args:
+            offset (int): Start index.
+            limit (typing.Optional[int]): Max items count, `None` for no limit.
+
+        Returns:
+            typing.Sequence: Items.
+        """
+
+        raise NotImplementedError()
+
+    async def estimate_count(self) -> typing.Optional[int]:
+        """Get estimated total count, should be cheaper than `count`.
+
+        Returns:
+            typing.Optional[int]: Estimated count, `None` if not supported.
+        """
+        # pylint:disable=no-self-use
+        return None
+
+    async def fetch_last(self, limit: int, skip: int) -> typing.Optional[typing.Sequence]:
+        """Fetch items from the end, e.g. `ORDER BY id DESC LIMIT limit OFFSET skip` then reverse,
+        so `last` does not require total count.
+
+        Args:
+            limit (int): Max items count.
+            skip (int): Items count to skip at the end.
+
+        Returns:
+            typing.Optional[typing.Sequence]: Items in original order,
+                `None` if not supported.
+        """
+        # pylint:disable=no-self-use,unused-argument
+        return None
+
+
+class AsyncIteratorSource(AsyncPageableSource):
+    """Async pageable source for async iterable,
+    iterable can only be fetched once.
+    """
+
+    def __init__(
+            self,
+            iterable: typing.AsyncIterable,
+            length: int = None,
+            *,
+            count: typing.Callable[[], typing.Awaitable[int]] = None,
+    ):
+        self.iterable = iterable
+        self.length = length
+        self._count = count
+
+    async def count(self) -> int:
+        if self.length is not None:
+            return self.length
+        if self._count is None:
+            raise NotImplementedError(
+                'Async iterable total count requires `length` or `count`.')
+        return await self._count()
+
+    async def fetch(self, offset: int, limit: typing.Optional[int]) -> typing.Sequence:
+        ret: typing.List = []
+        if limit is not None and limit <= 0:
+            return ret
+        index = 0
+        iterator = self.iterable.__aiter__()
+        try:
+            async for i in iterator:
+                if index >= offset:
+                    ret.append(i)
+                    if limit is not None and len(ret) >= limit:
+                        break
+                index += 1
+        finally:
+            # Release resources like database cursor without waiting for gc.
+            if hasattr(iterator, 'aclose'):
+                await iterator.aclose()
+        return ret
+
+
+class _AsyncMeteredSource(AsyncPageableSource):
+    """Record async source operation metrics.  """
+
+    def __init__(self, source: AsyncPageableSource, registry: metrics.Registry):
+        self.source = source
+        self.registry = registry
+        self.name = type(source).__name__
+
+    _observe = _MeteredSource._observe
+
+    async def count(self) -> int:
+        start = time.perf_counter()
+        ret = await self.source.count()
+        self._observe('count', start)
+        return ret
+
+    async def fetch(self, offset: int, limit: typing.Optional[int]) -> typing.Sequence:
+        start = time.perf_counter()
+        ret = await self.source.fetch(offset, limit)
+        self._observe('fetch', start, ret)
+        return ret
+
+    async def estimate_count(self) -> typing.Optional[int]:
+        start = time.perf_counter()
+        ret = await self.source.estimate_count()
+        self._observe('estimate_count', start)
+        return ret
+
+    async def fetch_last(self, limit: int, skip: int) -> typing.Optional[typing.Sequence]:
+        start = time.perf_counter()
+        ret = await self.source.fetch_last(limit, skip)
+        self._observe('fetch_last', start, ret)
+        return ret
+
+
+async def resolve_async(
+        iterable,
+        length: int = None,
+        *,
+        count: typing.Callable[[], typing.Awaitable[int]] = None,
+        first: int = None,
+        last: int = None,
+        after: str = None,
+        before: str = None,
+        compact_cursor: bool = False,
+        max_page_size: int = None,
+        default_page_size: int = None,
+        approximate_count: bool = False,
+        count_cache: cache_.Cache = None,
+        count_key: typing.Hashable = None,
+        **_,
+) -> Connection:
+    """Async version of `resolve`, page is fetched before return.
+
+    Args:
+        iterable (typing.Union[typing.AsyncIterable, AsyncPageableSource]):
+            value, async iterable will be wrapped as `AsyncIteratorSource`.
+        length (int, Optional): iterable length.
+        count (typing.Callable[[], typing.Awaitable[int]], Optional):
+            Lazy total count for async iterable, only called when needed.
+        compact_cursor (bool, Optional): Use compact cursor format. Defaults to False.
+        max_page_size (int, Optional): Max value of `first` and `last`,
+            exceeded value raises `graphql.GraphQLError`. Defaults to None.
+        default_page_size (int, Optional): `first` value when neither `first` nor `last`
+            is given, defaults to `max_page_size`.
+        approximate_count (bool, Optional): Use async `estimate_count` of source for `totalCount`
+            when it returns a value, `totalCountIsEstimate` will be true. Defaults to False.
+        count_cache (cache_.Cache, Optional): Cache exact count with `count_key`,
+            e.g. a `cache.Cache` with ttl or `get_request_count_cache(info.context)`.
+        count_key (typing.Hashable, Optional): Key for `count_cache`, required with it.
+
+    Raises:
+        ValueError: `count_cache` is given without `count_key`.
+
+    Returns:
+        Connection: Connection data, `totalCount` and `totalCountIsEstimate`
+            are awaitable when not computed.
+    """
+    _check_count_cache(count_cache, count_key)
+    first, _ = _limit_page_size(first, last, max_page_size, default_page_size)
+
+    source = (iterable
+              if isinstance(iterable, AsyncPageableSource)
+              else AsyncIteratorSource(iterable, length, count=count))
+    has_fetch_last = type(source).fetch_last is not AsyncPageableSource.fetch_last
+    if metrics.REGISTRY is not None:
+        source = _AsyncMeteredSource(source, metrics.REGISTRY)
+    _len: typing.List[int] = []
+
+    async def _get_length():
+        if not _len:
+            ret = (source.count()
+                   if count_cache is None
+                   else count_cache.get_or_call(count_key, source.count))
+            if inspect.isawaitable(ret):
+                ret = await ret
+            _len.append(ret)
+        return _len[0]
+
+    async def _get_total_count():
+        if approximate_count and not _len:
+            ret = await source.estimate_count()
+            if ret is not None:
+                return ret, True
+        return await _get_length(), False
+
+    _total_count: typing.List[asyncio.Future] = []
+
+    def _get_total_count_future() -> asyncio.Future:
+        if not _total_count:
+            _total_count.append(asyncio.ensure_future(_get_total_count()))
+        return _total_count[0]
+
+    async def _get_total_count_item(index: int):
+        return (await _get_total_count_future())[index]
+
+    def _defer_total_count_item(index: int) -> Deferred:
+        # Future can be awaited again when field is selected multiple times.
+        return Deferred(lambda: asyncio.ensure_future(_get_total_count_item(index)))
+
+    after_offset = _get_offset(after, None)
+    before_offset = _get_offset(before, None)
+    tail_skip = (_get_tail_skip(first, last, after_offset, before_offset)
+                 if has_fetch_last
+                 else None)
 
-    return dict(
+    tail = (_get_tail_page(await source.fetch_last(last + 1, tail_skip), last)
+            if tail_skip is not None
+            else None)
+    if tail is not None:
+        nodes, has_previous_page = tail
+        start_index = -(tail_skip + len(nodes))
+        has_next_page = False
+        start_cursor = None
+    else:
+        if _is_length_required(first, last, after_offset, before_offset):
+            await _get_length()
+        after_index, before_index, start_index, end_index = _get_offset_range(
+            first, last, after_offset, before_offset, lambda: _len[0])
+        has_previous_page = isinstance(last, int) and start_index > (
+            after_index + 1 if after else 0)
+        start_cursor = (
+            None
+            if end_index is not None and end_index <= start_index
+            else offset_to_cursor(start_index, compact=compact_cursor))
+        if end_index is None:
+            nodes = await source.fetch(
+                start_index, last if isinstance(last, int) else None)
+            has_next_page = False
+        else:
+            limit = max(end_index - start_index, 0)
+            if isinstance(first, int) and not before:
+                # Fetch one more item to know whether has next page.
+                nodes = await source.fetch(start_index, limit + 1)
+                nodes, has_next_page = nodes[:limit], len(nodes) > limit
+            else:
+                nodes = await source.fetch(start_index, limit)
+                has_next_page = end_index < before_index
+    edges = [
+        dict(node=node, cursor=cursor)
+        for node, cursor in zip(nodes, offsets_to_cursors(
+            start_index, start_index + len(nodes), compact=compact_cursor))
+    ]
+    if tail is not None and edges:
+        start_cursor = edges[0]['cursor']
+
+    return Connection(
         nodes=nodes,
         edges=edges,
-        pageInfo=dict(
-            start_cursor=lazy.Proxy(_get_start_cursor),
-            end_cursor=lazy.Proxy(_get_end_cursor),
-            has_previous_page=lazy.Proxy(lambda: isinstance(
-                last, int) and start_index > (after_index + 1 if after else 0)),
-            has_next_page=lazy.Proxy(lambda: isinstance(first, int) and end_index < (
-                before_index if before else _len))
+        page_info=PageInfo(
+            start_cursor=start_cursor,
+            end_cursor=edges[-1]['cursor'] if edges else None,
+            has_previous_page=has_previous_page,
+            has_next_page=isinstance(first, int) and has_next_page,
+        ),
+        total_count=_len[0] if _len else _defer_total_count_item(0),
+        total_count_is_estimate=False if _len else _defer_total_count_item(1),
+    )
+
+
+KEYSET_PREFIX = 'keyset:'
+# Field names, or function that returns sort key of a node.
+SortKeys = typing.Union[typing.Sequence[str], typing.Callable[[typing.Any], typing.Sequence]]
+
+
+def keyset_to_cursor(key: typing.Sequence) -> str:
+    """Encode sort key values as opaque cursor.
+
+    Args:
+        key (typing.Sequence): Json serializable sort key values.
+
+    Returns:
+        str: Cursor.
+    """
+
+    return base64(KEYSET_PREFIX + json.dumps(list(key), separators=(',', ':')))
+
+
+def cursor_to_keyset(cursor: str) -> typing.Optional[tuple]:
+    """Decode cursor created by `keyset_to_cursor`.
+
+    Args:
+        cursor (str): Cursor.
+
+    Returns:
+        typing.Optional[tuple]: Sort key values, `None` if cursor is invalid.
+    """
+
+    try:
+        value = unbase64(cursor)
+    except (binascii.Error, UnicodeDecodeError, ValueError, TypeError):
+        return None
+    if not value.startswith(KEYSET_PREFIX):
+        return None
+    try:
+        ret = json.loads(value[len(KEYSET_PREFIX):])
+    except ValueError:
+        return None
+    if not isinstance(ret, list):
+        return None
+    return tuple(ret)
+
+
+def _get_sort_key_fn(
+        sort_keys: SortKeys,
+) -> typing.Callable[[typing.Any], tuple]:
+    if callable(sort_keys):
+        return lambda node: tuple(sort_keys(node))
+
+    def _get_key(node):
+        if isinstance(node, typing.Mapping):
+            return tuple(node[i] for i in sort_keys)
+        return tuple(getattr(node, i) for i in sort_keys)
+    return _get_key
+
+
+def resolve_keyset(
+        query: typing.Callable[..., typing.Sequence],
+        *,
+        sort_keys: SortKeys,
+        count: typing.Callable[[], int] = None,
+        first: int = None,
+        last: int = None,
+        after: str = None,
+        before: str = None,
+        max_page_size: int = None,
+        default_page_size: int = None,
+        **_,
+) -> Connection:
+    """Resolve connection with keyset (seek) pagination,
+    cursor encode sort key values of the edge node,
+    so a page can be fetched with `WHERE key > ? LIMIT n` instead of offset.
+
+    Args:
+        query (typing.Callable[..., typing.Sequence]): Fetch nodes with
+            keyword arguments `after`, `before` (sort key tuple or `None`, exclusive),
+            `limit` (int or `None`) and `descending` (bool),
+            nodes should be sorted by sort key in the requested direction.
+        sort_keys (SortKeys):
+            Field names of sort key, or a function that returns sort key from node.
+        count (typing.Callable[[], int], optional): Function returns total count,
+            required when `totalCount` is queried.
+        max_page_size (int, optional): Max value of `first` and `last`,
+            exceeded value raises `graphql.GraphQLError`. Defaults to None.
+        default_page_size (int, optional): `first` value when neither `first` nor `last`
+            is given, defaults to `max_page_size`.
+
+    Returns:
+        Connection: Connection data, computed on first access.
+    """
+    first, _ = _limit_page_size(first, last, max_page_size, default_page_size)
+
+    get_key = _get_sort_key_fn(sort_keys)
+    after_key = cursor_to_keyset(after) if after else None
+    before_key = cursor_to_keyset(before) if before else None
+
+    def _fetch():
+        if isinstance(first, int):
+            ret = list(query(after=after_key, before=before_key,
+                             limit=first + 1, descending=False))
+            has_next_page = len(ret) > first
+            ret = ret[:first]
+            has_previous_page = False
+            if isinstance(last, int):
+                has_previous_page = len(ret) > last
+                ret = ret[max(len(ret) - last, 0):]
+            return ret, has_previous_page, has_next_page
+        if isinstance(last, int):
+            ret = list(query(after=after_key, before=before_key,
+                             limit=last + 1, descending=True))
+            has_previous_page = len(ret) > last
+            ret = ret[:last][::-1]
+            return ret, has_previous_page, False
+        ret = list(query(after=after_key, before=before_key,
+                         limit=None, descending=False))
+        return ret, False, False
+
+    _fetch = _once(_fetch)
+    edges = _once(lambda: [
+        dict(
+            node=node,
+            cursor=keyset_to_cursor(get_key(node))
+        )
+        for node in _fetch()[0]
+    ])
+
+    def _get_total_count():
+        if count is None:
+            raise NotImplementedError('`count` is required for total count.')
+        return count()
+
+    return Connection(
+        nodes=Deferred(lambda: _fetch()[0]),
+        edges=Deferred(edges),
+        page_info=PageInfo(
+            start_cursor=Deferred(
+                lambda: edges()[0]['cursor'] if edges() else None),
+            end_cursor=Deferred(
+                lambda: edges()[-1]['cursor'] if edges() else None),
+            has_previous_page=Deferred(lambda: _fetch()[1]),
+            has_next_page=Deferred(lambda: _fetch()[2]),
         ),
-        totalCount=_len,
+        total_count=Deferred(_get_total_count),
     )
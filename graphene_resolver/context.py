@@ -0,0 +1,55 @@
+"""Request scoped storage on resolve context.  """
+
+import typing
+
+STORAGE_KEY = '__graphene_resolver__'
+
+
+def get_storage(context: typing.Any) -> typing.Optional[typing.MutableMapping]:
+    """Get storage for current request from resolve context.
+
+    Mapping context will store data under `STORAGE_KEY` key,
+    other context will store data as attribute.
+
+    Args:
+        context (typing.Any): `info.context` of resolve info.
+
+    Returns:
+        typing.Optional[typing.MutableMapping]: Request storage,
+            `None` when context can not hold data (e.g. context is `None`).
+    """
+
+    if context is None:
+        return None
+    if isinstance(context, typing.MutableMapping):
+        return context.setdefault(STORAGE_KEY, {})
+    try:
+        return getattr(context, STORAGE_KEY)
+    except AttributeError:
+        pass
+    try:
+        setattr(context, STORAGE_KEY, {})
+    except (AttributeError, TypeError):
+        return None
+    return getattr(context, STORAGE_KEY)
+
+
+def freeze(v: typing.Any) -> typing.Hashable:
+    """Convert value to a hashable value, for use as a key.
+
+    Args:
+        v (typing.Any): Value, usually resolve kwargs.
+
+    Returns:
+        typing.Hashable: Frozen value.
+    """
+
+    if isinstance(v, typing.Mapping):
+        return tuple(sorted(
+            ((k, freeze(i)) for k, i in v.items()),
+            key=lambda i: repr(i[0])))
+    if isinstance(v, (list, tuple)):
+        return tuple(freeze(i) for i in v)
+    if isinstance(v, (set, frozenset)):
+        return frozenset(freeze(i) for i in v)
+    return v
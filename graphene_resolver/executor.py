@@ -0,0 +1,115 @@
+"""Thread pool execution for blocking resolvers.  """
+
+import collections
+import concurrent.futures
+import os
+import threading
+import typing
+
+from graphql.execution.executors.utils import process
+from promise import Promise
+
+_POOL: typing.Optional[concurrent.futures.ThreadPoolExecutor] = None
+_POOL_LOCK = threading.Lock()
+_MAX_WORKERS: int = min(32, (os.cpu_count() or 1) + 4)
+
+
+def get_pool() -> concurrent.futures.ThreadPoolExecutor:
+    """Get shared thread pool, create one if not created.
+
+    Returns:
+        concurrent.futures.ThreadPoolExecutor: Shared thread pool.
+    """
+
+    global _POOL  # pylint:disable=global-statement
+    if _POOL is None:
+        with _POOL_LOCK:
+            if _POOL is None:
+                _POOL = concurrent.futures.ThreadPoolExecutor(
+                    max_workers=_MAX_WORKERS,
+                    thread_name_prefix='graphene_resolver',
+                )
+    return _POOL
+
+
+def set_max_workers(value: int) -> None:
+    """Set max workers of shared thread pool,
+    current pool will be shutdown after running jobs finished.
+
+    Args:
+        value (int): Max workers count.
+    """
+
+    global _POOL, _MAX_WORKERS  # pylint:disable=global-statement
+    if value < 1:
+        raise ValueError(f'Max workers should be positive, got {value}')
+    with _POOL_LOCK:
+        _MAX_WORKERS = value
+        pool, _POOL = _POOL, None
+    if pool is not None:
+        pool.shutdown(wait=False)
+
+
+class Limiter:
+    """Limit concurrent jobs that submitted to shared thread pool,
+    exceeded jobs will wait in queue without occupying pool worker.  """
+
+    limit: typing.Optional[int]
+
+    def __init__(self, limit: int = None) -> None:
+        if limit is not None and limit < 1:
+            raise ValueError(f'Concurrency limit should be positive, got {limit}')
+        self.limit = limit
+        self._lock = threading.Lock()
+        self._running = 0
+        self._pending: typing.Deque[typing.Tuple[Promise, typing.Callable]] = (
+            collections.deque())
+
+    @property
+    def running(self) -> int:
+        """Running jobs count.  """
+
+        return self._running
+
+    @property
+    def pending(self) -> int:
+        """Waiting jobs count.  """
+
+        return len(self._pending)
+
+    def submit(self, fn: typing.Callable, *args, **kwargs) -> Promise:
+        """Run function in shared thread pool.
+
+        Args:
+            fn (typing.Callable): Function to run.
+
+        Returns:
+            Promise: Function result.
+        """
+
+        job = (Promise(), lambda: fn(*args, **kwargs))
+        with self._lock:
+            if self.limit is not None and self._running >= self.limit:
+                self._pending.append(job)
+                return job[0]
+            self._running += 1
+        self._start(job)
+        return job[0]
+
+    def _start(self, job: typing.Tuple[Promise, typing.Callable]) -> None:
+        promise, fn = job
+
+        def _run():
+            try:
+                process(promise, fn, (), {})
+            finally:
+                self._done()
+        get_pool().submit(_run)
+
+    def _done(self) -> None:
+        with self._lock:
+            if not self._pending:
+                self._running -= 1
+                return
+            job = self._pending.popleft()
+        self._start(job)
@@ -0,0 +1,497 @@
+"""Concurrent load generator with a representative schema.
+
+Run with `python -m graphene_resolver.loadtest`, reports throughput
+and latency percentiles of a query mix.
+"""
+
+import argparse
+import collections
+import concurrent.futures
+import dataclasses
+import json
+import math
+import platform
+import random
+import sys
+import time
+import typing
+
+import graphene
+import graphql_relay
+
+from . import __version__, connection, resolver
+
+SPECIES = ('cat', 'dog', 'bird')
+
+QUERIES: typing.Dict[str, str] = {
+    'pet_page': '''\
+query petPage($first: Int, $after: String) {
+    pets(first: $first, after: $after) {
+        edges {
+            node { id name age species }
+            cursor
+        }
+        pageInfo { hasNextPage endCursor }
+        totalCount
+    }
+}
+''',
+    'nested': '''\
+query nested($first: Int) {
+    pets(first: $first) {
+        nodes {
+            name
+            owner {
+                name
+                pets { name species }
+            }
+        }
+    }
+}
+''',
+    'node': '''\
+query node($id: ID!) {
+    node(id: $id) {
+        id
+        __typename
+        ... on Pet { name species owner { name } }
+        ... on Owner { name }
+    }
+}
+''',
+    'feed': '''\
+query feed($first: Int) {
+    feed(first: $first) {
+        __typename
+        ... on Pet { name species }
+        ... on Owner { name }
+    }
+}
+''',
+    'by_species': '''\
+query bySpecies($species: Species!) {
+    petsBySpecies(species: $species) { name age }
+}
+''',
+}
+
+# Query name to weight.
+DEFAULT_MIX: typing.Dict[str, float] = {
+    'pet_page': 4,
+    'nested': 2,
+    'node': 3,
+    'feed': 2,
+    'by_species': 1,
+}
+
+
+@dataclasses.dataclass
+class OwnerRecord:
+    """Owner data.  """
+
+    id: int
+    name: str
+
+
+@dataclasses.dataclass
+class PetRecord:
+    """Pet data.  """
+
+    id: int
+    name: str
+    age: int
+    species: str
+    owner_id: int
+
+
+def get_data(size: int = 1000, *, seed: int = 0) -> typing.Tuple[
+        typing.List[PetRecord], typing.List[OwnerRecord]]:
+    """Generate deterministic data.
+
+    Args:
+        size (int, optional): Pet count, owner count is a tenth of it. Defaults to 1000.
+        seed (int, optional): Random seed. Defaults to 0.
+
+    Returns:
+        typing.Tuple[typing.List[PetRecord], typing.List[OwnerRecord]]: Pets and owners.
+    """
+
+    rand = random.Random(seed)
+    owners = [OwnerRecord(id=i, name=f'owner{i}') for i in range(max(size // 10, 1))]
+    pets = [
+        PetRecord(id=i, name=f'pet{i}', age=rand.randint(1, 20),
+                  species=rand.choice(SPECIES), owner_id=rand.randrange(len(owners)))
+        for i in range(size)
+    ]
+    return pets, owners
+
+
+def build_schema(size: int = 1000, *, seed: int = 0) -> graphene.Schema:
+    """Build schema with nested resolvers, union, enum, relay nodes and connection.
+
+    Args:
+        size (int, optional): See `get_data`. Defaults to 1000.
+        seed (int, optional): See `get_data`. Defaults to 0.
+
+    Returns:
+        graphene.Schema: Schema for `QUERIES`.
+    """
+
+    pets, owners = get_data(size, seed=seed)
+    pets_by_owner: typing.Dict[int, typing.List[PetRecord]] = collections.defaultdict(list)
+    for i in pets:
+        pets_by_owner[i.owner_id].append(i)
+
+    class OwnerPets(resolver.Resolver):
+        schema = ['Pet']
+
+        def resolve(self, **kwargs):
+            return pets_by_owner[self.parent.id]
+
+    class Owner(resolver.Resolver):
+        schema = {
+            'type': {
+                'name': 'String',
+                'pets': OwnerPets,
+            },
+            'interfaces': (graphene.Node,),
+        }
+
+        def resolve(self, **kwargs):
+            return owners[self.parent.owner_id]
+
+        def get_node(self, id_):
+            return owners[int(id_)]
+
+        def validate(self, value):
+            return isinstance(value, OwnerRecord)
+
+    class Pet(resolver.Resolver):
+        schema = {
+            'type': {
+                'name': 'String',
+                'age': 'Int',
+                'species': {'type': SPECIES, 'name': 'Species'},
+                'owner': Owner,
+            },
+            'interfaces': (graphene.Node,),
+        }
+
+        def get_node(self, id_):
+            return pets[int(id_)]
+
+        def validate(self, value):
+            return isinstance(value, PetRecord)
+
+    class Pets(resolver.Resolver):
+        schema = connection.build_schema(Pet, name='PetConnection', max_page_size=100)
+
+        def resolve(self, **kwargs):
+            return connection.resolve(pets, **kwargs)
+
+    class Feed(resolver.Resolver):
+        schema = {
+            'args': {'first': 'Int'},
+            'type': [{
+                'type': (Pet, Owner),
+                'name': 'FeedItem',
+                'typename_of': {PetRecord: 'Pet', OwnerRecord: 'Owner'},
+            }],
+        }
+
+        def resolve(self, **kwargs):
+            first = kwargs.get('first') or 10
+            return [i for pair in zip(pets[:first], owners[:first]) for i in pair]
+
+    class PetsBySpecies(resolver.Resolver):
+        schema = {
+            'args': {'species': 'Species!'},
+            'type': [Pet],
+        }
+
+        def resolve(self, **kwargs):
+            return [i for i in pets if i.species == kwargs['species']][:100]
+
+    class Query(graphene.ObjectType):
+        node = graphene.Node.Field()
+        pets = Pets.as_field()
+        feed = Feed.as_field()
+        pets_by_species = PetsBySpecies.as_field()
+
+    return graphene.Schema(query=Query, types=[Pet.as_type(), Owner.as_type()])
+
+
+def get_variables(
+        name: str,
+        rand: random.Random,
+        size: int = 1000,
+) -> typing.Dict[str, typing.Any]:
+    """Generate variables for query.
+
+    Args:
+        name (str): Query name in `QUERIES`.
+        rand (random.Random): Random generator.
+        size (int, optional): Data size used by `build_schema`. Defaults to 1000.
+
+    Returns:
+        typing.Dict[str, typing.Any]: Query variables.
+    """
+
+    if name == 'pet_page':
+        offset = rand.randrange(size)
+        return dict(
+            first=rand.randint(10, 50),
+            after=connection.offset_to_cursor(offset) if offset else None,
+        )
+    if name == 'node':
+        if rand.random() < 0.5:
+            return dict(id=graphql_relay.to_global_id('Owner', rand.randrange(max(size // 10, 1))))
+        return dict(id=graphql_relay.to_global_id('Pet', rand.randrange(size)))
+    if name == 'by_species':
+        return dict(species=rand.choice(SPECIES))
+    return dict(first=10)
+
+
+def plan(
+        requests: int,
+        *,
+        mix: typing.Mapping[str, float] = None,
+        size: int = 1000,
+        seed: int = 0,
+) -> typing.List[typing.Tuple[str, typing.Dict[str, typing.Any]]]:
+    """Generate deterministic request sequence.
+
+    Args:
+        requests (int): Request count.
+        mix (typing.Mapping[str, float], optional): Query name to weight.
+            Defaults to None, use `DEFAULT_MIX`.
+        size (int, optional): Data size used by `build_schema`. Defaults to 1000.
+        seed (int, optional): Random seed. Defaults to 0.
+
+    Returns:
+        typing.List[typing.Tuple[str, typing.Dict[str, typing.Any]]]:
+            Query name and variables.
+    """
+
+    mix = mix or DEFAULT_MIX
+    rand = random.Random(seed)
+    names = rand.choices(list(mix), weights=list(mix.values()), k=requests)
+    return [(i, get_variables(i, rand, size)) for i in names]
+
+
+# Schema used by `_execute`, set per process.
+_SCHEMA: typing.Optional[graphene.Schema] = None
+
+
+def _init_process(size: int, seed: int) -> None:
+    global _SCHEMA  # pylint:disable=global-statement
+    _SCHEMA = build_schema(size, seed=seed)
+
+
+def _execute(
+        request: typing.Tuple[str, typing.Dict[str, typing.Any]],
+) -> typing.Tuple[str, float, bool]:
+    name, variables = request
+    start = time.perf_counter()
+    result = _SCHEMA.execute(QUERIES[name], variable_values=variables)
+    return name, time.perf_counter() - start, bool(result.errors)
+
+
+def percentile(values: typing.Sequence[float], q: float) -> float:
+    """Get percentile with nearest-rank method.
+
+    Args:
+        values (typing.Sequence[float]): Sorted values.
+        q (float): Percentile in `[0, 100]`.
+
+    Returns:
+        float: Value, `nan` if values is empty.
+    """
+
+    if not values:
+        return math.nan
+    return values[max(math.ceil(q / 100 * len(values)) - 1, 0)]
+
+
+@dataclasses.dataclass
+class Stats:
+    """Latency statistics in seconds.  """
+
+    count: int
+    errors: int
+    p50: float
+    p95: float
+    p99: float
+    max: float
+
+    @classmethod
+    def from_latencies(cls, latencies: typing.Sequence[float], errors: int = 0) -> 'Stats':
+        """Create from latencies.
+
+        Args:
+            latencies (typing.Sequence[float]): Latencies in any order.
+            errors (int, optional): Failed request count. Defaults to 0.
+
+        Returns:
+            Stats: Statistics.
+        """
+
+        values = sorted(latencies)
+        return cls(
+            count=len(values),
+            errors=errors,
+            p50=percentile(values, 50),
+            p95=percentile(values, 95),
+            p99=percentile(values, 99),
+            max=values[-1] if values else math.nan,
+        )
+
+
+@dataclasses.dataclass
+class Report:
+    """Load test result.  """
+
+    executor: str
+    concurrency: int
+    # Wall time in seconds, excludes worker startup.
+    duration: float
+    total: Stats
+    by_query: typing.Dict[str, Stats]
+
+    @property
+    def throughput(self) -> float:
+        """Requests per second.  """
+
+        return self.total.count / self.duration if self.duration else math.nan
+
+    def as_dict(self) -> typing.Dict[str, typing.Any]:
+        """Get json serializable data.
+
+        Returns:
+            typing.Dict[str, typing.Any]: Report data.
+        """
+
+        return dict(
+            dataclasses.asdict(self),
+            throughput=self.throughput,
+            version=__version__,
+            python=platform.python_version(),
+        )
+
+    def __str__(self):
+        lines = [
+            f'{self.total.count} requests, {self.total.errors} errors '
+            f'in {self.duration:.3f}s with {self.concurrency} {self.executor} workers',
+            f'throughput: {self.throughput:.1f} req/s',
+            f'{"query":<12} {"count":>7} {"errors":>7} '
+            f'{"p50 ms":>9} {"p95 ms":>9} {"p99 ms":>9} {"max ms":>9}',
+        ]
+        for name, v in sorted(self.by_query.items()) + [('total', self.total)]:
+            lines.append(
+                f'{name:<12} {v.count:>7} {v.errors:>7} '
+                f'{v.p50 * 1000:>9.3f} {v.p95 * 1000:>9.3f} '
+                f'{v.p99 * 1000:>9.3f} {v.max * 1000:>9.3f}')
+        return '\n'.join(lines)
+
+
+def run(
+        requests: int = 1000,
+        *,
+        concurrency: int = 8,
+        executor: str = 'thread',
+        mix: typing.Mapping[str, float] = None,
+        size: int = 1000,
+        seed: int = 0,
+) -> Report:
+    """Execute planned requests concurrently against `build_schema`.
+
+    Args:
+        requests (int, optional): Request count. Defaults to 1000.
+        concurrency (int, optional): Worker count. Defaults to 8.
+        executor (str, optional): `thread` or `process`. Defaults to 'thread'.
+        mix (typing.Mapping[str, float], optional): See `plan`. Defaults to None.
+        size (int, optional): See `build_schema`. Defaults to 1000.
+        seed (int, optional): Seed for both data and requests. Defaults to 0.
+
+    Raises:
+        ValueError: Unknown executor.
+
+    Returns:
+        Report: Result.
+    """
+
+    items = plan(requests, mix=mix, size=size, seed=seed)
+    if executor == 'thread':
+        _init_process(size, seed)
+        pool: concurrent.futures.Executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=concurrency)
+    elif executor == 'process':
+        pool = concurrent.futures.ProcessPoolExecutor(
+            max_workers=concurrency, initializer=_init_process, initargs=(size, seed))
+    else:
+        raise ValueError(f'Unknown executor: {executor}')
+
+    with pool:
+        # Start workers before timing.
+        list(pool.map(_execute, items[:concurrency]))
+        start = time.perf_counter()
+        results = list(pool.map(
+            _execute, items,
+            chunksize=1 if executor == 'thread' else max(requests // (concurrency * 16), 1)))
+        duration = time.perf_counter() - start
+
+    latencies: typing.Dict[str, typing.List[float]] = collections.defaultdict(list)
+    errors: typing.Counter[str] = collections.Counter()
+    for name, latency, is_error in results:
+        latencies[name].append(latency)
+        errors[name] += is_error
+    return Report(
+        executor=executor,
+        concurrency=concurrency,
+        duration=duration,
+        total=Stats.from_latencies(
+            [i for v in latencies.values() for i in v], sum(errors.values())),
+        by_query={k: Stats.from_latencies(v, errors[k]) for k, v in latencies.items()},
+    )
+
+
+def main(argv: typing.Sequence[str] = None) -> int:
+    """Command line entry.
+
+    Args:
+        argv (typing.Sequence[str], optional): Arguments. Defaults to None, use `sys.argv`.
+
+    Returns:
+        int: Exit code, 1 when any request failed.
+    """
+
+    parser = argparse.ArgumentParser(
+        prog='python -m graphene_resolver.loadtest',
+        description=__doc__.split('\n')[0])
+    parser.add_argument('-n', '--requests', type=int, default=1000)
+    parser.add_argument('-c', '--concurrency', type=int, default=8)
+    parser.add_argument('-e', '--executor', choices=('thread', 'process'), default='thread')
+    parser.add_argument('-s', '--size', type=int, default=1000, help='pet count of data')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('-q', '--query', action='append', choices=sorted(QUERIES),
+                        help='only run given queries, can be repeated')
+    parser.add_argument('-o', '--output', help='write json report to file')
+    args = parser.parse_args(argv)
+
+    report = run(
+        args.requests,
+        concurrency=args.concurrency,
+        executor=args.executor,
+        mix={k: v for k, v in DEFAULT_MIX.items() if k in args.query} if args.query else None,
+        size=args.size,
+        seed=args.seed,
+    )
+    print(report)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(report.as_dict(), f, indent=2)
+    return 1 if report.total.errors else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
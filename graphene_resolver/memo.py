@@ -0,0 +1,118 @@
+"""Request scoped memoization of resolver results.  """
+
+import asyncio
+import dataclasses
+import inspect
+import typing
+
+from . import context as context_
+from . import metrics
+
+
+@dataclasses.dataclass
+class Stats:
+    """Memoization statistics.  """
+
+    hits: int = 0
+    misses: int = 0
+
+
+class _SharedAwaitable:
+    """Awaitable that can be awaited multiple times.  """
+
+    def __init__(self, awaitable: typing.Awaitable):
+        self._awaitable = awaitable
+        self._future: typing.Optional[asyncio.Future] = None
+
+    def __await__(self):
+        if self._future is None:
+            self._future = asyncio.ensure_future(self._awaitable)
+        return self._future.__await__()
+
+
+class _Identity:
+    """Hashable wrapper that compare value by identity,
+    wrapped value is kept alive so `id` will not be reused.  """
+
+    __slots__ = ('value',)
+
+    def __init__(self, value: typing.Any):
+        self.value = value
+
+    def __hash__(self):
+        return id(self.value)
+
+    def __eq__(self, other):
+        return isinstance(other, _Identity) and other.value is self.value
+
+
+def get_stats(context: typing.Any) -> typing.Dict[type, Stats]:
+    """Get memoization statistics of current request.
+
+    Args:
+        context (typing.Any): `info.context` of resolve info.
+
+    Returns:
+        typing.Dict[type, Stats]: Statistics by resolver class.
+    """
+
+    storage = context_.get_storage(context)
+    if storage is None:
+        return {}
+    return storage.setdefault('memo_stats', {})
+
+
+def memoize(
+        context: typing.Any,
+        resolver: type,
+        parent: typing.Any,
+        kwargs: typing.Mapping,
+        fn: typing.Callable[[], typing.Any],
+        *,
+        field_name: str = None,
+        parent_key: typing.Callable[[typing.Any], typing.Hashable] = None,
+) -> typing.Any:
+    """Call function only once for same resolver, field, parent and kwargs in one request.
+
+    Args:
+        context (typing.Any): `info.context` of resolve info.
+        resolver (type): Resolver class.
+        parent (typing.Any): Parent value.
+        kwargs (typing.Mapping): Resolve kwargs.
+        fn (typing.Callable[[], typing.Any]): Function to call on miss.
+        field_name (str, optional): Field name, resolver can be used for multiple fields
+            of same parent. Defaults to None.
+        parent_key (typing.Callable[[typing.Any], typing.Hashable], optional):
+            Get key from parent value. Defaults to None, compare parent by identity.
+
+    Returns:
+        typing.Any: Function result.
+    """
+
+    storage = context_.get_storage(context)
+    if storage is None:
+        return fn()
+    key = (
+        resolver,
+        field_name,
+        parent_key(parent) if parent_key else _Identity(parent),
+        context_.freeze(kwargs),
+    )
+    memo = storage.setdefault('memo', {})
+    stats = storage.setdefault('memo_stats', {}).setdefault(resolver, Stats())
+    registry = metrics.REGISTRY
+    if key in memo:
+        stats.hits += 1
+        if registry is not None:
+            registry.inc('graphene_resolver_memo_total',
+                         resolver=resolver.__name__, result='hit')
+        return memo[key]
+    stats.misses += 1
+    if registry is not None:
+        registry.inc('graphene_resolver_memo_total',
+                     resolver=resolver.__name__, result='miss')
+    ret = fn()
+    if inspect.isawaitable(ret):
+        ret = _SharedAwaitable(ret)
+    memo[key] = ret
+    return ret
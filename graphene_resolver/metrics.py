@@ -0,0 +1,349 @@
+"""Prometheus-style metrics for resolvers, exported in text format without a server.  """
+
+import math
+import os
+import tempfile
+import threading
+import typing
+
+from . import tracing
+
+DEFAULT_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05,
+                   0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+SIZE_BUCKETS = (0, 1, 5, 10, 25, 50, 100, 250, 500, 1000, 5000)
+
+HELP = {
+    'graphene_resolver_call_seconds':
+    'Resolver call latency, includes time to settle promise or awaitable.',
+    'graphene_resolver_call_errors_total': 'Resolver calls that raised error.',
+    'graphene_resolver_cache_hits_total': 'Resolver cache hits.',
+    'graphene_resolver_cache_misses_total': 'Resolver cache misses.',
+    'graphene_resolver_cache_size': 'Resolver cache size.',
+    'graphene_resolver_cache_hit_ratio': 'Resolver cache hit ratio.',
+    'graphene_resolver_memo_total': 'Request scoped memoization lookups.',
+    'graphene_resolver_connection_source_seconds': 'Connection source operation latency.',
+    'graphene_resolver_connection_page_size': 'Connection fetched page size.',
+    'graphene_resolver_union_resolve_type_seconds': 'Union type resolution latency.',
+    'graphene_resolver_union_resolve_type_cache_total': 'Union type resolution cache lookups.',
+}
+
+# Metrics are only recorded when enabled.
+REGISTRY: typing.Optional['Registry'] = None
+
+
+class Histogram:
+    """Cumulative histogram.  """
+
+    buckets: typing.Tuple[float, ...]
+
+    def __init__(self, buckets: typing.Sequence[float] = DEFAULT_BUCKETS) -> None:
+        self.buckets = tuple(sorted(buckets))
+        self.counts = [0] * len(self.buckets)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        """Add a value.
+
+        Args:
+            value (float): Observed value.
+        """
+
+        self.count += 1
+        self.sum += value
+        for index, bound in enumerate(self.buckets):
+            if value <= bound:
+                self.counts[index] += 1
+                break
+
+    def cumulative_counts(self) -> typing.List[int]:
+        """Get count of values less than or equal to each bucket bound.
+
+        Returns:
+            typing.List[int]: Counts in bucket order.
+        """
+
+        ret = []
+        total = 0
+        for i in self.counts:
+            total += i
+            ret.append(total)
+        return ret
+
+    def quantile(self, q: float) -> float:
+        """Estimate quantile with linear interpolation in bucket,
+        same as `histogram_quantile` of prometheus.
+
+        Args:
+            q (float): Quantile in `[0, 1]`.
+
+        Returns:
+            float: Estimated value, `nan` if no value observed,
+                highest bound if value is in `+Inf` bucket.
+        """
+
+        if not self.count:
+            return math.nan
+        rank = q * self.count
+        lower_bound, lower_count = 0.0, 0
+        for bound, count in zip(self.buckets, self.cumulative_counts()):
+            if count >= rank:
+                if count == lower_count:
+                    return bound
+                return lower_bound + (bound - lower_bound) * (
+                    (rank - lower_count) / (count - lower_count))
+            lower_bound, lower_count = bound, count
+        return self.buckets[-1]
+
+
+def _format_labels(labels: typing.Tuple[typing.Tuple[str, str], ...]) -> str:
+    if not labels:
+        return ''
+    escaped = (
+        (k, v.replace('\\', '\\\\').replace('\n', '\\n').replace('"', '\\"'))
+        for k, v in labels)
+    return '{' + ','.join(f'{k}="{v}"' for k, v in escaped) + '}'
+
+
+def _format_value(v: float) -> str:
+    if v == math.inf:
+        return '+Inf'
+    if isinstance(v, float) and math.isnan(v):
+        return 'NaN'
+    return repr(float(v)) if isinstance(v, float) else str(v)
+
+
+class Registry:
+    """Thread-safe metrics storage.  """
+
+    _Key = typing.Tuple[str, typing.Tuple[typing.Tuple[str, str], ...]]
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._counters: typing.Dict[Registry._Key, float] = {}
+        self._gauges: typing.Dict[Registry._Key, float] = {}
+        self._histograms: typing.Dict[Registry._Key, Histogram] = {}
+        # Called before render, for metrics that read from other places.
+        self.collectors: typing.List[typing.Callable[['Registry'], None]] = []
+
+    @staticmethod
+    def _key(name: str, labels: typing.Mapping[str, typing.Any]) -> 'Registry._Key':
+        return (name, tuple(sorted((k, str(v)) for k, v in labels.items())))
+
+    def inc(self, name: str, value: float = 1, **labels) -> None:
+        """Increase counter.
+
+        Args:
+            name (str): Metric name.
+            value (float, optional): Increment. Defaults to 1.
+        """
+
+        key = self._key(name, labels)
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + value
+
+    def set(self, name: str, value: float, *, counter: bool = False, **labels) -> None:
+        """Set gauge value.
+
+        Args:
+            name (str): Metric name.
+            value (float): Value.
+            counter (bool, optional): Render as counter,
+                for counter value maintained elsewhere. Defaults to False.
+        """
+
+        key = self._key(name, labels)
+        with self._lock:
+            (self._counters if counter else self._gauges)[key] = value
+
+    def observe(
+            self,
+            name: str,
+            value: float,
+            *,
+            buckets: typing.Sequence[float] = DEFAULT_BUCKETS,
+            **labels,
+    ) -> None:
+        """Add value to histogram.
+
+        Args:
+            name (str): Metric name.
+            value (float): Observed value.
+            buckets (typing.Sequence[float], optional): Bucket bounds,
+                only used when histogram created. Defaults to DEFAULT_BUCKETS.
+        """
+
+        key = self._key(name, labels)
+        with self._lock:
+            try:
+                histogram = self._histograms[key]
+            except KeyError:
+                histogram = self._histograms[key] = Histogram(buckets)
+            histogram.observe(value)
+
+    def get_value(self, name: str, **labels) -> typing.Optional[float]:
+        """Get counter or gauge value.
+
+        Args:
+            name (str): Metric name.
+
+        Returns:
+            typing.Optional[float]: Value, `None` if not recorded.
+        """
+
+        key = self._key(name, labels)
+        with self._lock:
+            return self._counters.get(key, self._gauges.get(key))
+
+    def get_histogram(self, name: str, **labels) -> typing.Optional[Histogram]:
+        """Get histogram.
+
+        Args:
+            name (str): Metric name.
+
+        Returns:
+            typing.Optional[Histogram]: Histogram, `None` if not recorded.
+        """
+
+        with self._lock:
+            return self._histograms.get(self._key(name, labels))
+
+    def clear(self) -> None:
+        """Remove all recorded metrics.  """
+
+        with self._lock:
+            self._counters.clear()
+            self._gauges.clear()
+            self._histograms.clear()
+
+    def render(self) -> str:
+        """Render metrics in prometheus text format.
+
+        Returns:
+            str: Rendered text.
+        """
+
+        for i in self.collectors:
+            i(self)
+
+        lines: typing.List[str] = []
+        with self._lock:
+            groups: typing.Dict[str, typing.Tuple[str, typing.List]] = {}
+            for type_, items in (('counter', self._counters),
+                                 ('gauge', self._gauges),
+                                 ('histogram', self._histograms)):
+                for (name, labels), value in items.items():
+                    groups.setdefault(name, (type_, []))[1].append((labels, value))
+            for name in sorted(groups):
+                type_, items = groups[name]
+                if name in HELP:
+                    lines.append(f'# HELP {name} {HELP[name]}')
+                lines.append(f'# TYPE {name} {type_}')
+                for labels, value in sorted(items, key=lambda i: i[0]):
+                    if type_ != 'histogram':
+                        lines.append(
+                            f'{name}{_format_labels(labels)} {_format_value(value)}')
+                        continue
+                    for bound, count in zip(
+                            value.buckets + (math.inf,),
+                            value.cumulative_counts() + [value.count]):
+                        lines.append(
+                            f'{name}_bucket'
+                            f'{_format_labels(labels + (("le", _format_value(bound)),))}'
+                            f' {count}')
+                    lines.append(
+                        f'{name}_sum{_format_labels(labels)} {_format_value(value.sum)}')
+                    lines.append(
+                        f'{name}_count{_format_labels(labels)} {value.count}')
+        lines.append('')
+        return '\n'.join(lines)
+
+    def write(self, path: str) -> None:
+        """Write rendered metrics to file atomically,
+        e.g. for node exporter textfile collector.
+
+        Args:
+            path (str): File path.
+        """
+
+        text = self.render()
+        fd, tmp_path = tempfile.mkstemp(
+            dir=os.path.dirname(os.path.abspath(path)), suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                f.write(text)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+
+def _on_event(event: tracing.Event) -> None:
+    registry = REGISTRY
+    if registry is None:
+        return
+    info = event.info
+    labels = dict(resolver=event.resolver.__name__, kind=event.kind)
+    if info is not None:
+        labels['field'] = f'{info.parent_type}.{info.field_name}'
+        labels['type'] = str(info.return_type)
+    registry.observe('graphene_resolver_call_seconds', event.duration, **labels)
+    if event.error is not None:
+        registry.inc('graphene_resolver_call_errors_total', **labels)
+
+
+def collect_cache_stats(registry: Registry) -> None:
+    """Collect cache statistics of all resolver classes that cache enabled.
+
+    Args:
+        registry (Registry): Target registry.
+    """
+
+    from . import resolver
+
+    pending = list(resolver.Resolver.__subclasses__())
+    while pending:
+        cls = pending.pop()
+        pending.extend(cls.__subclasses__())
+        stats = cls.__dict__.get('_cache') and cls.cache_stats()
+        if not stats:
+            continue
+        name = cls.__name__
+        registry.set('graphene_resolver_cache_hits_total',
+                     stats.hits, counter=True, resolver=name)
+        registry.set('graphene_resolver_cache_misses_total',
+                     stats.misses, counter=True, resolver=name)
+        registry.set('graphene_resolver_cache_size', stats.size, resolver=name)
+        total = stats.hits + stats.misses
+        registry.set('graphene_resolver_cache_hit_ratio',
+                     stats.hits / total if total else math.nan, resolver=name)
+
+
+def enable(registry: Registry = None) -> Registry:
+    """Start recording metrics.
+
+    Args:
+        registry (Registry, optional): Registry to record. Defaults to None,
+            create a new one with `collect_cache_stats` collector.
+
+    Returns:
+        Registry: Recording registry.
+    """
+
+    global REGISTRY  # pylint:disable=global-statement
+    if registry is None:
+        registry = Registry()
+        registry.collectors.append(collect_cache_stats)
+    REGISTRY = registry
+    if _on_event not in tracing.HOOKS:
+        tracing.add_hook(_on_event)
+    return registry
+
+
+def disable() -> None:
+    """Stop recording metrics.  """
+
+    global REGISTRY  # pylint:disable=global-statement
+    REGISTRY = None
+    if _on_event in tracing.HOOKS:
+        tracing.remove_hook(_on_event)
@@ -1,32 +1,79 @@
 """Simple weighted function execution.  """
 
+import collections
 import typing
 
 
 class Processor:
     """A processor can register multiple process, they will executed by weight
-    and stop on first value returns.  """
+    and stop on first value returns.
+
+    When `dispatch_key` is set, type of that keyword argument is used to
+    cache dispatch, registered function that is type-determined will be
+    skipped for types it not matched, and later functions will be skipped
+    for types it matched.
+    """
 
     _process_registry: typing.List[typing.Tuple[float, typing.Callable]]
+    _type_determined: typing.Set[typing.Callable]
+    _dispatch_cache: typing.Dict[type, typing.Tuple[typing.Callable, ...]]
+    match_counts: typing.Counter[typing.Callable]
+    # Increased on every register, for external cache invalidation.
+    version: int
 
-    def __init__(self) -> None:
+    def __init__(self, *, dispatch_key: str = None) -> None:
+        self.dispatch_key = dispatch_key
+        self.version = 0
         self._process_registry = []
+        self._type_determined = set()
+        self._dispatch_cache = {}
+        self.match_counts = collections.Counter()
 
-    def register(self, weight: float) -> typing.Callable[[typing.Callable], None]:
+    def register(
+            self,
+            weight: float,
+            *,
+            type_determined: bool = False,
+    ) -> typing.Callable[[typing.Callable], None]:
         """Get decorator for process registering.
 
         Args:
             weight (float): Function weight, higher weight will executed first.
+            type_determined (bool, optional): Whether function returns `None`
+                or not is only determined by type of `dispatch_key` argument.
+                Defaults to False.
 
         Returns:
             typing.Callable[[typing.Callable], None]: Decorator.
         """
 
         def _decorator(func: typing.Callable) -> None:
-            self._process_registry.append((weight, func))
-            self._process_registry.sort(key=lambda v: v[0], reverse=True)
+            index = len(self._process_registry)
+            for i, (_weight, _) in enumerate(self._process_registry):
+                if _weight < weight:
+                    index = i
+                    break
+            self._process_registry.insert(index, (weight, func))
+            if type_determined:
+                self._type_determined.add(func)
+            self._dispatch_cache.clear()
+            self.version += 1
         return _decorator
 
+    def is_type_determined(self, type_: type) -> bool:
+        """Whether process result is only determined by type,
+        only known after a value of the type processed.
+
+        Args:
+            type_ (type): Type of `dispatch_key` argument.
+
+        Returns:
+            bool: True if only type-determined function used for the type.
+        """
+
+        handlers = self._dispatch_cache.get(type_)
+        return bool(handlers) and all(i in self._type_determined for i in handlers)
+
     def process(self, **kwargs) -> dict:
         """Execute all registered function by weight,
         high weight function execute first.
@@ -38,8 +85,38 @@ class Processor:
             dict: First return value.
         """
 
-        for _, i in self._process_registry:
+        if self.dispatch_key is None:
+            return self._process((i for _, i in self._process_registry), kwargs)
+
+        type_ = type(kwargs[self.dispatch_key])
+        try:
+            handlers = self._dispatch_cache[type_]
+        except KeyError:
+            return self._process_and_cache(type_, kwargs)
+        return self._process(handlers, kwargs)
+
+    def _process(self, handlers: typing.Iterable[typing.Callable], kwargs) -> dict:
+        for i in handlers:
             ret = i(**kwargs)
             if ret is not None:
+                self.match_counts[i] += 1
                 return ret
         raise NotImplementedError('Process not implemented')
+
+    def _process_and_cache(self, type_: type, kwargs) -> dict:
+        handlers = []
+        for _, i in self._process_registry:
+            is_type_determined = i in self._type_determined
+            ret = i(**kwargs)
+            if ret is None:
+                if not is_type_determined:
+                    handlers.append(i)
+                continue
+            self.match_counts[i] += 1
+            if is_type_determined:
+                handlers.append(i)
+                self._dispatch_cache[type_] = tuple(handlers)
+            # Otherwise later functions are unknown for this type.
+            return ret
+        self._dispatch_cache[type_] = tuple(handlers)
+        raise NotImplementedError('Process not implemented')
@@ -0,0 +1,183 @@
+"""Sampling profiler that reports slow resolvers.  """
+
+import dataclasses
+import logging
+import random
+import threading
+import time
+import typing
+
+from . import context as context_
+from . import tracing
+
+LOGGER = logging.getLogger(__name__)
+
+
+@dataclasses.dataclass
+class FieldTiming:
+    """Timing of a resolved field.  """
+
+    path: typing.Tuple
+    resolver: type
+    duration: float
+    # Resolver classes of ancestor fields, from root.
+    chain: typing.Tuple[type, ...]
+    # Types of argument values, see `get_shape`.
+    args: typing.Any
+    error: typing.Optional[BaseException] = None
+
+    def __str__(self):
+        path = '.'.join(str(i) for i in self.path)
+        chain = ' > '.join(i.__name__ for i in self.chain + (self.resolver,))
+        return f'{path} ({chain}) took {self.duration:.6f}s, args: {self.args}'
+
+
+def get_shape(v: typing.Any) -> typing.Any:
+    """Get value shape that not contains actual data, e.g. for logging arguments.
+
+    Args:
+        v (typing.Any): Value.
+
+    Returns:
+        typing.Any: Dict of shapes for mapping,
+            `list[<length>]` for sequence, type name for others.
+    """
+
+    if isinstance(v, typing.Mapping):
+        return {k: get_shape(i) for k, i in v.items()}
+    if isinstance(v, (list, tuple)):
+        return f'{type(v).__name__}[{len(v)}]'
+    return type(v).__name__
+
+
+class Profile:
+    """Field timings of a sampled request.  """
+
+    fields: typing.List[FieldTiming]
+
+    def __init__(self) -> None:
+        self.fields = []
+        self._resolvers: typing.Dict[typing.Tuple, type] = {}
+
+    def add(self, event: tracing.Event) -> FieldTiming:
+        """Add resolve event to profile.
+
+        Args:
+            event (tracing.Event): Event.
+
+        Returns:
+            FieldTiming: Added timing.
+        """
+
+        path = event.path
+        self._resolvers[path] = event.resolver
+        chain = tuple(
+            self._resolvers[path[:i]]
+            for i in range(1, len(path))
+            if path[:i] in self._resolvers)
+        ret = FieldTiming(
+            path=path,
+            resolver=event.resolver,
+            duration=event.duration,
+            chain=chain,
+            args=get_shape(event.kwargs),
+            error=event.error,
+        )
+        self.fields.append(ret)
+        return ret
+
+
+class Profiler:
+    """Hook that profile sampled requests and report field slower than threshold.
+
+    Sampling is decided once for each request context,
+    `max_samples_per_second` bounds the sampled requests when traffic is high.
+    Requests with `None` context are not sampled.
+    """
+
+    def __init__(
+            self,
+            *,
+            threshold: float = 0.1,
+            sample_rate: float = 1.0,
+            max_samples_per_second: float = None,
+            callback: typing.Callable[[FieldTiming], None] = None,
+            logger: logging.Logger = LOGGER,
+            timer: typing.Callable[[], float] = time.monotonic,
+            random_fn: typing.Callable[[], float] = random.random,
+    ) -> None:
+        """
+        Args:
+            threshold (float, optional): Slow field threshold in seconds. Defaults to 0.1.
+            sample_rate (float, optional): Fraction of requests to sample. Defaults to 1.0.
+            max_samples_per_second (float, optional): Max sampled requests per second,
+                defaults to None, no limit.
+            callback (typing.Callable[[FieldTiming], None], optional):
+                Called with slow field. Defaults to None.
+            logger (logging.Logger, optional): Logger for slow field,
+                warning is logged when `callback` not given.
+        """
+
+        self.threshold = threshold
+        self.sample_rate = sample_rate
+        self.max_samples_per_second = max_samples_per_second
+        self.callback = callback
+        self.logger = logger
+        self._timer = timer
+        self._random = random_fn
+        self._lock = threading.Lock()
+        self._tokens = max_samples_per_second or 0
+        self._updated_at = timer()
+        self._storage_key = f'profile_{id(self)}'
+
+    def _should_sample(self) -> bool:
+        if self._random() >= self.sample_rate:
+            return False
+        if self.max_samples_per_second is None:
+            return True
+        with self._lock:
+            now = self._timer()
+            self._tokens = min(
+                self.max_samples_per_second,
+                self._tokens + (now - self._updated_at) * self.max_samples_per_second)
+            self._updated_at = now
+            if self._tokens < 1:
+                return False
+            self._tokens -= 1
+            return True
+
+    def get_profile(self, context: typing.Any) -> typing.Optional[Profile]:
+        """Get profile of request.
+
+        Args:
+            context (typing.Any): `info.context` of resolve info.
+
+        Returns:
+            typing.Optional[Profile]: Profile, `None` if request not sampled.
+        """
+
+        storage = context_.get_storage(context)
+        if storage is None:
+            return None
+        return storage.get(self._storage_key)
+
+    def __call__(self, event: tracing.Event) -> None:
+        if event.kind != 'resolve' or event.info is None:
+            return
+        storage = context_.get_storage(event.info.context)
+        if storage is None:
+            return
+        try:
+            profile = storage[self._storage_key]
+        except KeyError:
+            profile = storage[self._storage_key] = (
+                Profile() if self._should_sample() else None)
+        if profile is None:
+            return
+        timing = profile.add(event)
+        if timing.duration < self.threshold:
+            return
+        if self.callback:
+            self.callback(timing)
+        else:
+            self.logger.warning('Slow resolver: %s', timing)
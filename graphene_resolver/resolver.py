@@ -1,17 +1,44 @@
 # -*- coding=UTF-8 -*-
 """Apollo-like resolver.  """
 
+import inspect
+import threading
 import typing
 
 import graphene
 import graphql
+from promise import Promise
+from promise.dataloader import DataLoader
 
+from . import cache as cache_
+from . import context as context_
+from . import executor as executor_
+from . import memo
 from . import schema as schema_
+from . import tracing
+
+
+_COMPILE_LOCK = threading.RLock()
+_PENDING: typing.List[typing.Type['Resolver']] = []
+
+
+def compile_all() -> None:
+    """Compile all lazy resolvers that not compiled yet, for eager warm-up.  """
+
+    while True:
+        with _COMPILE_LOCK:
+            pending = list(_PENDING)
+        if not pending:
+            return
+        for i in pending:
+            i.compile()
 
 
 class Resolver:
     """Apollo-like schema field resolver.  """
 
+    __slots__ = ('parent', 'info', 'context')
+
     # Resolver definitions.
     schema: typing.Optional[typing.MutableMapping] = None
 
@@ -25,14 +52,45 @@ class Resolver:
     _type: typing.Optional[typing.Union[graphene.Scalar,
                                         graphene.ObjectType]] = None
     _as_interface: typing.Optional[typing.Type[graphene.Interface]] = None
+    _limiter: typing.Optional[executor_.Limiter] = None
+    _cache: typing.Optional[cache_.Cache] = None
+    _lazy: bool = False
 
-    def __init_subclass__(cls, abstract=False, **kwargs):
+    def __init_subclass__(cls, abstract=False, lazy=None, **kwargs):
+        if lazy is not None:
+            cls._lazy = lazy
         if abstract:
             return
-        cls._parse_schema(default={'name': cls.__name__})
-        cls.as_type()
+        if cls._lazy:
+            with _COMPILE_LOCK:
+                _PENDING.append(cls)
+        else:
+            cls.compile()
         super().__init_subclass__(**kwargs)
 
+    @classmethod
+    def compile(cls) -> None:
+        """Parse schema and build graphene type,
+        lazy resolver will compile on first `as_type`, `as_field` or `as_interface` call.
+        """
+
+        if cls.__dict__.get('_type') is not None:
+            return
+        with _COMPILE_LOCK:
+            if cls.__dict__.get('_type') is not None:
+                return
+            # Removed before compiling, so failed class will not block `compile_all`.
+            if cls in _PENDING:
+                _PENDING.remove(cls)
+            try:
+                cls._parse_schema(default={'name': cls.__name__})
+                cls._type = cls._build_type()
+            except Exception:
+                for i in ('_schema', '_limiter', '_cache', '_type'):
+                    if i in cls.__dict__:
+                        delattr(cls, i)
+                raise
+
     def __init__(
             self,
             *,
@@ -44,7 +102,7 @@ class Resolver:
         self.context = info.context
 
     def resolve(self, **kwargs):
-        """Resolve the field.  """
+        """Resolve the field, can be a coroutine function.  """
         # pylint:disable=unused-argument
 
         field_name = self.info.field_name
@@ -55,8 +113,26 @@ class Resolver:
         raise NotImplementedError(
             f'`{self.__class__.__name__}.resolve` is not implemented.')
 
+    def resolve_batch(self, parents: typing.Sequence, **kwargs) -> typing.Sequence:
+        """Resolve the field for multiple parents at once.
+
+        Override this method to enable batching, all calls with same kwargs
+        in one execution tick will be collected into one call.
+        `self.parent` is `None` and `self.info` is info of first call.
+
+        Args:
+            parents (typing.Sequence): Parent values.
+
+        Returns:
+            typing.Sequence: Results in same order as parents,
+                or a promise of it.
+        """
+
+        return [self.__class__(parent=i, info=self.info).resolve(**kwargs)
+                for i in parents]
+
     def get_node(self, id_: str):
-        """Get node value from id.
+        """Get node value from id, can be a coroutine function.
 
         Args:
             id_ (str): Node id.
@@ -68,7 +144,8 @@ class Resolver:
         return None
 
     def validate(self, value) -> bool:
-        """Test whether value is match resolver schema type.
+        """Test whether value is match resolver schema type,
+        can not be a coroutine function since graphql-core checks type synchronously.
 
         Args:
             value (typing.Any): Value to validate.
@@ -85,8 +162,7 @@ class Resolver:
             raise NotImplementedError(
                 f'Resolver schema is not defined: {cls.__name__}')
 
-        def resolve_fn(parent, info: graphql.execution.base.ResolveInfo, **kwargs):
-            ret = cls(parent=parent, info=info).resolve(**kwargs)
+        def _convert(ret, info: graphql.execution.base.ResolveInfo):
             if isinstance(ret, typing.Mapping) and '__typename' in ret:
                 type_ = info.schema.get_type(ret['__typename']).graphene_type
                 ret = type_(
@@ -94,12 +170,137 @@ class Resolver:
                        if k in type_._meta.fields})
             return ret
 
+        async def _convert_async(ret, info: graphql.execution.base.ResolveInfo):
+            return _convert(await ret, info)
+
+        is_batch = cls.resolve_batch is not Resolver.resolve_batch
+        is_static = cls._is_static('resolve')
+
+        def _resolve(parent, info: graphql.execution.base.ResolveInfo, kwargs):
+            if is_batch:
+                return cls._get_loader(info, kwargs).load((parent,))
+            if is_static:
+                return cls._execute(cls.resolve, parent, info, **kwargs)
+            return cls._execute(
+                cls(parent=parent, info=info).resolve, **kwargs)
+
+        def _resolve_cached(parent, info: graphql.execution.base.ResolveInfo, kwargs):
+            cache = cls._cache
+            if cache is None:
+                return _resolve(parent, info, kwargs)
+            return cache.get_or_call(
+                (info.field_name, cache.key(parent, **kwargs)),
+                lambda: _resolve(parent, info, kwargs))
+
+        def _resolve_fn(parent, info: graphql.execution.base.ResolveInfo, **kwargs):
+            if cls._schema.prepare_kwargs:
+                kwargs = cls._schema.prepare_kwargs(kwargs)
+            memoize = cls._schema.memoize
+            if memoize:
+                ret = memo.memoize(
+                    info.context, cls, parent, kwargs,
+                    lambda: _resolve_cached(parent, info, kwargs),
+                    field_name=info.field_name,
+                    parent_key=memoize if callable(memoize) else None)
+            else:
+                ret = _resolve_cached(parent, info, kwargs)
+            if isinstance(ret, Promise):
+                return ret.then(lambda v: _convert(v, info))
+            if inspect.isawaitable(ret):
+                return _convert_async(ret, info)
+            return _convert(ret, info)
+
+        def resolve_fn(parent, info: graphql.execution.base.ResolveInfo, **kwargs):
+            if tracing.HOOKS:
+                return tracing.trace(cls, 'resolve', info, _resolve_fn,
+                                     args=(parent, info), kwargs=kwargs)
+            return _resolve_fn(parent, info, **kwargs)
+
         cls._schema = schema_.FieldDefinition.parse(
             cls.schema,
             default={**default, 'resolver': resolve_fn}
         )
+        cls._limiter = (executor_.Limiter(cls._schema.max_concurrency)
+                        if cls._schema.executor == 'thread'
+                        else None)
+        cls._cache = (cache_.Cache.parse(cls._schema.cache)
+                      if cls._schema.cache
+                      else None)
         return cls._schema
 
+    @classmethod
+    def cache_clear(cls) -> None:
+        """Remove all cached results, do nothing when cache is not enabled.  """
+
+        if cls._cache:
+            cls._cache.clear()
+
+    @classmethod
+    def cache_invalidate(cls, key: typing.Hashable, *, field_name: str) -> bool:
+        """Remove cached result.
+
+        Args:
+            key (typing.Hashable): Cache key, result of `key` cache option,
+                defaults to `cache.default_key(parent, **kwargs)`.
+            field_name (str): Field name, results are cached by field,
+                since resolver can be used for multiple fields of same parent.
+
+        Returns:
+            bool: Whether result was cached.
+        """
+
+        if not cls._cache:
+            return False
+        return cls._cache.invalidate((field_name, key))
+
+    @classmethod
+    def cache_stats(cls) -> typing.Optional[cache_.Stats]:
+        """Get cache statistics.
+
+        Returns:
+            typing.Optional[cache_.Stats]: Statistics,
+                `None` when cache is not enabled.
+        """
+
+        if not cls._cache:
+            return None
+        return cls._cache.stats()
+
+    @classmethod
+    def _is_static(cls, name: str) -> bool:
+        return isinstance(inspect.getattr_static(cls, name), staticmethod)
+
+    @classmethod
+    def _execute(cls, fn: typing.Callable, *args, **kwargs) -> typing.Any:
+        if cls._limiter:
+            return cls._limiter.submit(fn, *args, **kwargs)
+        return fn(*args, **kwargs)
+
+    @classmethod
+    def _get_loader(
+            cls,
+            info: graphql.execution.base.ResolveInfo,
+            kwargs: typing.Dict,
+    ) -> DataLoader:
+        def batch_load_fn(keys):
+            parents = [i[0] for i in keys]
+            if cls._is_static('resolve_batch'):
+                ret = cls._execute(cls.resolve_batch, parents, info, **kwargs)
+            else:
+                ret = cls._execute(
+                    cls(info=info).resolve_batch, parents, **kwargs)
+            return Promise.resolve(ret)
+
+        storage = context_.get_storage(info.context)
+        if storage is None:
+            # No request scope, batch is not possible.
+            return DataLoader(batch_load_fn, batch=False, cache=False)
+        key = (cls, context_.freeze(kwargs))
+        loaders = storage.setdefault('loaders', {})
+        if key not in loaders:
+            loaders[key] = DataLoader(batch_load_fn, cache=False)
+        return loaders[key]
+
     @classmethod
     def as_type(
             cls,
@@ -114,20 +315,50 @@ class Resolver:
             graphene.types.unmountedtype.UnmountedType:
         """
 
-        if cls._type:
-            return cls._type
+        cls.compile()
+        return cls._type
 
+    @classmethod
+    def _build_type(cls) -> graphene.types.unmountedtype.UnmountedType:
         ret = cls._schema.as_type()
 
+        if cls._is_static('get_node'):
+            def _get_node(info, id_):
+                return cls.get_node(info, id_)
+        else:
+            def _get_node(info, id_):
+                return cls(info=info).get_node(id_)
+
         def get_node(info, id_):
-            return cls(info=info).get_node(id_)
+            if tracing.HOOKS:
+                return tracing.trace(cls, 'get_node', info, _get_node, args=(info, id_))
+            return _get_node(info, id_)
         ret.get_node = get_node
 
+        is_static_validate = cls._is_static('validate')
+        validate_error = (
+            f'`{cls.__name__}.validate` should not be a coroutine function, '
+            'graphql-core checks type synchronously, '
+            'use `typename_of` option or `__typename` key to determinate type.')
+        if inspect.iscoroutinefunction(cls.validate):
+            raise TypeError(validate_error)
+
+        def _is_type_of(value, info):
+            if is_static_validate:
+                ret = cls.validate(value, info)
+            else:
+                ret = cls(info=info).validate(value)
+            if inspect.isawaitable(ret):
+                if inspect.iscoroutine(ret):
+                    ret.close()
+                raise TypeError(validate_error)
+            return ret
+
         def is_type_of(value, info):
-            return cls(info=info).validate(value)
+            if tracing.HOOKS:
+                return tracing.trace(cls, 'is_type_of', info, _is_type_of, args=(value, info))
+            return _is_type_of(value, info)
         ret.is_type_of = is_type_of
-
-        cls._type = ret
         return ret
 
     @classmethod
@@ -141,6 +372,7 @@ class Resolver:
         if cls._field:
             return cls._field
 
+        cls.compile()
         cls._field = cls._schema.mount(type_=cls.as_type(), as_=graphene.Field)
         return cls._field
 
@@ -154,6 +386,8 @@ class Resolver:
         Returns:
             typing.Type[graphene.Interface]: Convert result, will cache on class.
         """
+
+        cls.compile()
         if cls._schema.type is not schema_.SpecialType.MAPPING:
             raise ValueError(
                 f'Schema can not use as interface, should be mapping: {cls.__name__}')
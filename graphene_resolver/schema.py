@@ -2,6 +2,7 @@
 """Mongoose-like schema.  """
 # pylint:disable=unused-import
 
+import collections
 import dataclasses
 import enum
 import typing
@@ -22,7 +23,7 @@ class SpecialType(enum.Enum):
     UNION = enum.auto()
 
 
-CONFIG_PROCESSOR = processor.Processor()
+CONFIG_PROCESSOR = processor.Processor(dispatch_key='type_def')
 
 
 @CONFIG_PROCESSOR.register(100)
@@ -32,6 +33,7 @@ def _process_resolver_config(type_def, config):
             and issubclass(type_def, resolver.Resolver)):
         return None
     _resolver: typing.Type[resolver.Resolver] = type_def
+    _resolver.compile()
     # merge schema
     config['name'] = _resolver._schema.name
     config['type'] = _resolver.as_type()
@@ -45,6 +47,12 @@ def _process_resolver_config(type_def, config):
         if _parent_resolver:
             parent = _parent_resolver(parent, info, **kwargs)
         return _resolver._schema.resolver(parent, info, **kwargs)
+    prepare_kwargs = _resolver._schema.prepare_kwargs
+    if prepare_kwargs and _parent_resolver:
+        # Own resolver of `_resolver` is not used, apply to field resolver.
+        def _prepared_resolve_fn(parent, info, **kwargs):
+            return _parent_resolver(parent, info, **prepare_kwargs(kwargs))
+        config['resolver'] = _prepared_resolve_fn
     config.setdefault('resolver', resolve_fn)
     config.setdefault('description', _resolver._schema.description)
     config.setdefault('deprecation_reason',
@@ -56,7 +64,7 @@ def _process_resolver_config(type_def, config):
     )
 
 
-@CONFIG_PROCESSOR.register(90)
+@CONFIG_PROCESSOR.register(90, type_determined=True)
 def _process_str_type_def(type_def, config):
     if not isinstance(type_def, str):
         return None
@@ -69,7 +77,7 @@ def _process_str_type_def(type_def, config):
     )
 
 
-@CONFIG_PROCESSOR.register(80)
+@CONFIG_PROCESSOR.register(80, type_determined=True)
 def _process_mapping_type_def(type_def, config):
     if not isinstance(type_def, typing.Mapping):
         return None
@@ -109,7 +117,7 @@ def _process_enum_type_def(type_def, config):
     )
 
 
-@CONFIG_PROCESSOR.register(40)
+@CONFIG_PROCESSOR.register(40, type_determined=True)
 def _process_union_type_def(type_def, config):
     if not isinstance(type_def, typing.Iterable):
         return None
@@ -120,7 +128,7 @@ def _process_union_type_def(type_def, config):
     )
 
 
-@CONFIG_PROCESSOR.register(-1)
+@CONFIG_PROCESSOR.register(-1, type_determined=True)
 def _process_type_type_def(type_def, config):
     config['type'] = type_def
     return dict(
@@ -151,6 +159,26 @@ class EnumFieldDefinition:
             f'Enum field should be a str or 2-value tuple, got {v}')
 
 
+def _get_typename_by_key(
+        schemas: typing.Iterable['FieldDefinition'],
+) -> typing.Dict[str, str]:
+    # Map field key that only one mapping member has to member typename.
+    keys_by_name = {
+        i.name: tuple(i.child_definition)
+        for i in schemas
+        if (isinstance(i.child_definition, typing.Mapping)
+            and i.type is not SpecialType.LIST)
+    }
+    counts = collections.Counter(
+        k for keys in keys_by_name.values() for k in keys)
+    return {
+        k: name
+        for name, keys in keys_by_name.items()
+        for k in keys
+        if counts[k] == 1
+    }
+
+
 @dataclasses.dataclass
 class FieldDefinition:
     """A mongoose-like schema for resolver field.  """
@@ -165,6 +193,13 @@ class FieldDefinition:
     deprecation_reason: typing.Optional[str]
     resolver: typing.Optional[typing.Callable]
     default: typing.Any
+    executor: typing.Optional[str]
+    max_concurrency: typing.Optional[int]
+    memoize: typing.Union[bool, typing.Callable[[typing.Any], typing.Hashable]]
+    cache: typing.Union[bool, typing.Mapping, None]
+    typename_of: typing.Optional[typing.Mapping[type, str]]
+    discriminator: typing.Optional[str]
+    prepare_kwargs: typing.Optional[typing.Callable[[typing.Dict], typing.Dict]]
 
     # Parse results:
     child_definition: typing.Any
@@ -227,6 +262,16 @@ class FieldDefinition:
         config.setdefault('deprecation_reason', None)
         config.setdefault('resolver', None)
         config.setdefault('default', None)
+        config.setdefault('executor', None)
+        config.setdefault('max_concurrency', None)
+        config.setdefault('memoize', False)
+        config.setdefault('cache', None)
+        config.setdefault('typename_of', None)
+        config.setdefault('discriminator', None)
+        config.setdefault('prepare_kwargs', None)
+        if config['executor'] not in (None, 'thread'):
+            raise ValueError(
+                f'Unknown executor: {config["executor"]}')
 
         return cls(
             type=config['type'],
@@ -238,6 +283,13 @@ class FieldDefinition:
             interfaces=config['interfaces'],
             resolver=config['resolver'],
             default=config['default'],
+            executor=config['executor'],
+            max_concurrency=config['max_concurrency'],
+            memoize=config['memoize'],
+            cache=config['cache'],
+            typename_of=config['typename_of'],
+            discriminator=config['discriminator'],
+            prepare_kwargs=config['prepare_kwargs'],
             child_definition=child_definition,
         )
 
@@ -354,14 +406,18 @@ class FieldDefinition:
 
             def _dynamic():
                 if not isinstance(registry[namespace], type):
-                    _types = [FieldDefinition.parse(i, default={'name': f'{namespace}{index}'}).as_type()
-                              for index, i in enumerate(self.child_definition)]
+                    _schemas = [FieldDefinition.parse(i, default={'name': f'{namespace}{index}'})
+                                for index, i in enumerate(self.child_definition)]
+                    _types = [i.as_type() for i in _schemas]
                     _types = [i() if callable(i) and not isinstance(i, type) else i
                               for i in _types]
                     registry[namespace] = type(namespace, (typedef.Union,), dict(
                         Meta=dict(
                             types=_types,
                             description=self.description,
+                            typename_of=self.typename_of,
+                            discriminator=self.discriminator,
+                            typename_by_key=_get_typename_by_key(_schemas),
                         )
                     ))
                 return registry[namespace]
@@ -0,0 +1,221 @@
+"""Timing and tracing instrumentation for resolvers.  """
+
+import dataclasses
+import datetime
+import inspect
+import threading
+import time
+import typing
+
+from promise import Promise
+
+# Resolver calls are only wrapped when there is any hook.
+HOOKS: typing.List[typing.Callable[['Event'], None]] = []
+
+
+@dataclasses.dataclass
+class Event:
+    """A finished resolver call.  """
+
+    resolver: type
+    # One of `resolve`, `is_type_of`, `get_node`.
+    kind: str
+    info: typing.Any
+    # `time.perf_counter()` value when call started.
+    start: float
+    # In seconds, includes time to settle returned promise or awaitable.
+    duration: float
+    error: typing.Optional[BaseException] = None
+    # Resolve arguments, empty for other kinds.
+    kwargs: typing.Mapping[str, typing.Any] = dataclasses.field(default_factory=dict)
+
+    @property
+    def path(self) -> typing.Tuple:
+        """Response path of the field, empty when info not available.  """
+
+        return tuple(getattr(self.info, 'path', None) or ())
+
+
+def add_hook(hook: typing.Callable[[Event], None]) -> None:
+    """Add a callback that called with every resolver call event.
+
+    Args:
+        hook (typing.Callable[[Event], None]): Callback.
+    """
+
+    HOOKS.append(hook)
+
+
+def remove_hook(hook: typing.Callable[[Event], None]) -> None:
+    """Remove a callback that added by `add_hook`.
+
+    Args:
+        hook (typing.Callable[[Event], None]): Callback.
+    """
+
+    HOOKS.remove(hook)
+
+
+def _emit(event: Event) -> None:
+    for i in tuple(HOOKS):
+        i(event)
+
+
+async def _trace_async(awaitable, resolver, kind, info, *, start, kwargs):
+    try:
+        ret = await awaitable
+    except Exception as ex:
+        _emit(Event(resolver, kind, info, start, time.perf_counter() - start, ex, kwargs))
+        raise
+    _emit(Event(resolver, kind, info, start, time.perf_counter() - start, None, kwargs))
+    return ret
+
+
+def trace(
+        resolver: type,
+        kind: str,
+        info: typing.Any,
+        fn: typing.Callable,
+        *,
+        args: typing.Sequence = (),
+        kwargs: typing.Mapping[str, typing.Any] = None,
+) -> typing.Any:
+    """Call function and emit event to hooks when result settled.
+
+    Args:
+        resolver (type): Resolver class.
+        kind (str): Call kind.
+        info (typing.Any): Resolve info.
+        fn (typing.Callable): Function to call.
+        args (typing.Sequence, optional): Positional arguments for `fn`. Defaults to ().
+        kwargs (typing.Mapping[str, typing.Any], optional): Keyword arguments for `fn`,
+            recorded as `Event.kwargs`. Defaults to None.
+
+    Returns:
+        typing.Any: Function result.
+    """
+
+    kwargs = kwargs or {}
+    start = time.perf_counter()
+    try:
+        ret = fn(*args, **kwargs)
+    except Exception as ex:
+        _emit(Event(resolver, kind, info, start, time.perf_counter() - start, ex, kwargs))
+        raise
+    if isinstance(ret, Promise):
+        def _on_fulfilled(v):
+            _emit(Event(resolver, kind, info, start,
+                        time.perf_counter() - start, None, kwargs))
+            return v
+
+        def _on_rejected(ex):
+            _emit(Event(resolver, kind, info, start,
+                        time.perf_counter() - start, ex, kwargs))
+            raise ex
+        return ret.then(_on_fulfilled, _on_rejected)
+    if inspect.isawaitable(ret):
+        return _trace_async(ret, resolver, kind, info, start=start, kwargs=kwargs)
+    _emit(Event(resolver, kind, info, start, time.perf_counter() - start, None, kwargs))
+    return ret
+
+
+@dataclasses.dataclass
+class Stats:
+    """Aggregated call statistics.  """
+
+    count: int = 0
+    errors: int = 0
+    total_time: float = 0
+    max_time: float = 0
+
+    def add(self, event: Event) -> None:
+        """Add event to statistics.
+
+        Args:
+            event (Event): Event.
+        """
+
+        self.count += 1
+        if event.error is not None:
+            self.errors += 1
+        self.total_time += event.duration
+        self.max_time = max(self.max_time, event.duration)
+
+
+class Collector:
+    """Hook that aggregate events by resolver class and by field path,
+    list indexes in path are ignored.  """
+
+    by_resolver: typing.Dict[typing.Tuple[type, str], Stats]
+    by_path: typing.Dict[typing.Tuple[str, ...], Stats]
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.by_resolver = {}
+        self.by_path = {}
+
+    def __call__(self, event: Event) -> None:
+        with self._lock:
+            key = (event.resolver, event.kind)
+            self.by_resolver.setdefault(key, Stats()).add(event)
+            if event.kind == 'resolve' and event.path:
+                path = tuple(i for i in event.path if isinstance(i, str))
+                self.by_path.setdefault(path, Stats()).add(event)
+
+    def clear(self) -> None:
+        """Remove all collected statistics.  """
+
+        with self._lock:
+            self.by_resolver.clear()
+            self.by_path.clear()
+
+
+class ApolloTracing:
+    """Hook that record resolve events in apollo tracing format,
+    see https://github.com/apollographql/apollo-tracing .  """
+
+    def __init__(self, *, context: typing.Any = None) -> None:
+        """
+        Args:
+            context (typing.Any, optional): Only record events of this `info.context`,
+                defaults to None, record all events.
+        """
+
+        self.context = context
+        self._start = time.perf_counter()
+        self._start_time = datetime.datetime.utcnow()
+        self._resolvers: typing.List[typing.Dict[str, typing.Any]] = []
+
+    def __call__(self, event: Event) -> None:
+        info = event.info
+        if event.kind != 'resolve' or info is None:
+            return
+        if self.context is not None and info.context is not self.context:
+            return
+        self._resolvers.append(dict(
+            path=list(event.path),
+            parentType=str(info.parent_type),
+            fieldName=info.field_name,
+            returnType=str(info.return_type),
+            startOffset=int((event.start - self._start) * 1e9),
+            duration=int(event.duration * 1e9),
+        ))
+
+    def as_dict(self) -> typing.Dict[str, typing.Any]:
+        """Get tracing data, ends at now.
+
+        Returns:
+            typing.Dict[str, typing.Any]: Data for `tracing` key of response extensions.
+        """
+
+        duration = time.perf_counter() - self._start
+        end_time = self._start_time + datetime.timedelta(seconds=duration)
+        return dict(
+            version=1,
+            startTime=self._start_time.isoformat() + 'Z',
+            endTime=end_time.isoformat() + 'Z',
+            duration=int(duration * 1e9),
+            execution=dict(
+                resolvers=list(self._resolvers),
+            ),
+        )
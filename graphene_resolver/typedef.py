@@ -2,10 +2,12 @@
 """Mongoose-like schema.  """
 
 import functools
+import time
 import typing
 
 import graphene
 
+from . import metrics
 from . import processor
 from . import types
 
@@ -26,10 +28,10 @@ REGISTRY: typing.Dict[
     'Node': graphene.Node,
 }
 
-TYPENAME_PROCESSOR = processor.Processor()
+TYPENAME_PROCESSOR = processor.Processor(dispatch_key='value')
 
 
-@TYPENAME_PROCESSOR.register(-1)
+@TYPENAME_PROCESSOR.register(-1, type_determined=True)
 def _resolve_type(value) -> dict:  # pylint:disable=unused-argument
     return {
         '__typename': None
@@ -37,18 +39,106 @@ def _resolve_type(value) -> dict:  # pylint:disable=unused-argument
 
 
 class Union(graphene.Union):
+    """Union that resolve type from `typename_of` option, `__typename` key,
+    `discriminator` key, `TYPENAME_PROCESSOR` or member unique key,
+    result only determined by value class is cached.  """
+
+    _typename_of: typing.Dict[type, str]
+    _discriminator: typing.Optional[str]
+    _typename_by_key: typing.Dict[str, str]
+    _typename_cache: typing.Dict[type, typing.Any]
+    _typename_cache_version: int
+
     class Meta:
         abstract = True
 
+    @classmethod
+    def __init_subclass_with_meta__(
+            cls,
+            typename_of=None,
+            discriminator=None,
+            typename_by_key=None,
+            **options
+    ):
+        cls._typename_of = dict(typename_of or {})
+        cls._discriminator = discriminator
+        cls._typename_by_key = dict(typename_by_key or {})
+        cls._typename_cache = {}
+        cls._typename_cache_version = TYPENAME_PROCESSOR.version
+        super().__init_subclass_with_meta__(**options)
+
     @classmethod
     def resolve_type(cls, instance, info):
+        registry = metrics.REGISTRY
+        if registry is None:
+            return cls._resolve_type(instance, info)
+        is_cached = type(instance) in cls._typename_cache
+        start = time.perf_counter()
+        ret = cls._resolve_type(instance, info)
+        registry.observe('graphene_resolver_union_resolve_type_seconds',
+                         time.perf_counter() - start, union=cls._meta.name)
+        registry.inc('graphene_resolver_union_resolve_type_cache_total',
+                     union=cls._meta.name, result='hit' if is_cached else 'miss')
+        return ret
+
+    @classmethod
+    def _resolve_type(cls, instance, info):
+        class_ = type(instance)
+        if cls._typename_cache_version != TYPENAME_PROCESSOR.version:
+            cls._typename_cache = {}
+            cls._typename_cache_version = TYPENAME_PROCESSOR.version
+        try:
+            return cls._typename_cache[class_]
+        except KeyError:
+            pass
+
+        ret = next((cls._typename_of[i]
+                    for i in class_.__mro__
+                    if i in cls._typename_of), None)
+        if ret is not None:
+            cls._typename_cache[class_] = ret
+            return ret
+
         ret = super().resolve_type(instance, info)
         if ret is not None:
+            cls._typename_cache[class_] = ret
             return ret
 
-        if isinstance(instance, typing.Mapping) and '__typename' in instance:
-            return info.schema.get_type(instance['__typename']).graphene_type
-        return TYPENAME_PROCESSOR.process(value=instance)['__typename']
+        if isinstance(instance, typing.Mapping):
+            if '__typename' in instance:
+                return info.schema.get_type(instance['__typename']).graphene_type
+            if cls._discriminator and cls._discriminator in instance:
+                return cls._get_discriminated_type(instance[cls._discriminator])
+        ret = TYPENAME_PROCESSOR.process(value=instance)['__typename']
+        if ret is not None and TYPENAME_PROCESSOR.is_type_determined(class_):
+            cls._typename_cache[class_] = ret
+        if ret is None and isinstance(instance, typing.Mapping):
+            ret = cls._get_type_by_key(instance, info)
+        return ret
+
+    @classmethod
+    def _get_discriminated_type(cls, typename):
+        ret = next((i for i in cls._meta.types if i._meta.name == typename), None)
+        if ret is None:
+            raise ValueError(
+                f'Union `{cls._meta.name}` has no member named {typename!r}, '
+                f'got it from `{cls._discriminator}` key, expected one of: '
+                f'{", ".join(i._meta.name for i in cls._meta.types)}')
+        return ret
+
+    @classmethod
+    def _get_type_by_key(cls, instance, info):
+        # Only when unique keys of exactly one member matched,
+        # otherwise member `is_type_of` is used.
+        typenames = {v for k, v in cls._typename_by_key.items() if k in instance}
+        if len(typenames) != 1:
+            return None
+        typename = typenames.pop()
+        member = next(i for i in cls._meta.types if i._meta.name == typename)
+        is_type_of = getattr(member, 'is_type_of', None)
+        if is_type_of and not is_type_of(instance, info):
+            return None
+        return member
 
 
 def dynamic_type(type_: typing.Any, *, registry=None) -> typing.Callable:
@@ -65,7 +155,13 @@ def dynamic_type(type_: typing.Any, *, registry=None) -> typing.Callable:
 
     def type_fn(type_, *_args, **_kwargs):
         if isinstance(type_, str):
-            type_ = registry[type_]
+            try:
+                type_ = registry[type_]
+            except KeyError:
+                # Type may be defined by a lazy resolver that not compiled yet.
+                from . import resolver
+                resolver.compile_all()
+                type_ = registry[type_]
 
         assert (isinstance(type_, (type, typing.Callable))), repr(type_)
         return type_
@@ -3,14 +3,20 @@ import graphene_resolver as resolver
 
 
 _DEFAULT_TYPE_REGISTRY = dict(resolver.typedef.REGISTRY)
+_DEFAULT_TYPENAME_PROCESSES = list(resolver.typedef.TYPENAME_PROCESSOR._process_registry)
 
 
 @pytest.fixture(autouse=True)
 def _clear_registry():
     resolver.connection.REGISTRY.clear()
+    resolver.resolver._PENDING.clear()
     resolver.typedef.REGISTRY.clear()
     resolver.typedef.REGISTRY.update(**_DEFAULT_TYPE_REGISTRY)
     old_process_registry = resolver.typedef.TYPENAME_PROCESSOR._process_registry
-    resolver.typedef.TYPENAME_PROCESSOR._process_registry = []
+    resolver.typedef.TYPENAME_PROCESSOR._process_registry = list(_DEFAULT_TYPENAME_PROCESSES)
+    resolver.typedef.TYPENAME_PROCESSOR._dispatch_cache.clear()
     yield
+    resolver.metrics.disable()
+    resolver.tracing.HOOKS.clear()
     resolver.typedef.TYPENAME_PROCESSOR._process_registry = old_process_registry
+    resolver.typedef.TYPENAME_PROCESSOR._dispatch_cache.clear()
@@ -0,0 +1,175 @@
+# pylint:disable=missing-docstring,invalid-name,unused-variable
+import asyncio
+import time
+import types
+import typing
+
+import graphene
+import pytest
+from graphql.execution.executors.asyncio import AsyncioExecutor
+
+import graphene_resolver as resolver
+
+
+def _execute(schema, query, **kwargs):
+    loop = asyncio.new_event_loop()
+    try:
+        return schema.execute(
+            query, executor=AsyncioExecutor(loop=loop), **kwargs)
+    finally:
+        loop.close()
+
+
+def test_simple():
+    class Foo(resolver.Resolver):
+        schema = {
+            'args': {'value': 'String!'},
+            'type': 'String!',
+        }
+
+        async def resolve(self, **kwargs):
+            await asyncio.sleep(0)
+            return kwargs['value']
+
+    class Query(graphene.ObjectType):
+        foo = Foo.as_field()
+
+    schema = graphene.Schema(query=Query)
+    result = _execute(schema, '''\
+{
+    foo(value: "v")
+}
+''')
+    assert not result.errors
+    assert result.data == {"foo": "v"}
+
+
+def test_concurrent():
+    class Foo(resolver.Resolver):
+        schema = 'Int'
+
+        async def resolve(self, **kwargs):
+            await asyncio.sleep(0.1)
+            return 1
+
+    class Query(graphene.ObjectType):
+        foo = Foo.as_field()
+
+    schema = graphene.Schema(query=Query)
+    start = time.perf_counter()
+    result = _execute(schema, '''\
+{
+    a: foo
+    b: foo
+    c: foo
+    d: foo
+}
+''')
+    cost = time.perf_counter() - start
+    assert not result.errors
+    assert result.data == {"a": 1, "b": 1, "c": 1, "d": 1}
+    assert cost < 0.3
+
+
+def test_nested():
+    class Foo(resolver.Resolver):
+        schema = 'Int'
+
+        async def resolve(self, **kwargs):
+            await asyncio.sleep(0)
+            return self.parent['bar']
+
+    class Bar(resolver.Resolver):
+        schema = {
+            'foo': Foo,
+            'typename': {'__typename': 'String'},
+        }
+
+        async def resolve(self, **kwargs):
+            return {'bar': 42}
+
+    class Query(graphene.ObjectType):
+        bar = Bar.as_field()
+
+    schema = graphene.Schema(query=Query)
+    result = _execute(schema, '''\
+{
+    bar {
+        foo
+    }
+}
+''')
+    assert not result.errors
+    assert result.data == {"bar": {"foo": 42}}
+
+
+def test_node():
+    pets = [dict(
+        id=1,
+        name='pet1',
+        age=1,
+    )]
+
+    class Pet(resolver.Resolver):
+        schema = {
+            'type': {
+                'name': 'String',
+                'age': 'Int',
+            },
+            'interfaces': (graphene.Node,)
+        }
+
+        async def get_node(self, id_):
+            await asyncio.sleep(0)
+            return next(i for i in pets if i['id'] == int(id_))
+
+        def validate(self, value):
+            return (
+                isinstance(value, typing.Mapping)
+                and isinstance(value.get('name'), str)
+                and isinstance(value.get('age'), int)
+            )
+
+    class Query(graphene.ObjectType):
+        node = graphene.Node.Field()
+
+    schema = graphene.Schema(query=Query, types=[Pet.as_type()])
+    query = '''\
+{
+    node(id: "UGV0OjE=") {
+        id
+        __typename
+        ... on Pet {
+            name
+            age
+        }
+    }
+}
+'''
+    expected = {"node": {"id": "UGV0OjE=", "__typename": "Pet",
+                         "name": "pet1", "age": 1}}
+    result = _execute(schema, query)
+    assert not result.errors
+    assert result.data == expected
+
+
+def test_validate_coroutine():
+    with pytest.raises(TypeError, match='typename_of'):
+        class Foo(resolver.Resolver):
+            schema = {'name': 'String'}
+
+            async def validate(self, value):
+                return True
+
+    async def _validate(value):
+        return True
+
+    class Bar(resolver.Resolver):
+        schema = {'name': 'String'}
+
+        def validate(self, value):
+            return _validate(value)
+
+    info = types.SimpleNamespace(context=None)
+    with pytest.raises(TypeError, match='typename_of'):
+        Bar.as_type().is_type_of({}, info)
@@ -0,0 +1,139 @@
+# pylint:disable=missing-docstring,invalid-name,unused-variable
+import graphene
+
+import graphene_resolver as resolver
+
+
+def test_simple():
+    calls = []
+
+    class Foo(resolver.Resolver):
+        schema = 'Int'
+
+        def resolve_batch(self, parents, **kwargs):
+            calls.append(parents)
+            return [i['value'] * kwargs.get('times', 1) for i in parents]
+
+    class Bar(resolver.Resolver):
+        schema = [{
+            'value': 'Int',
+            'foo': Foo,
+        }]
+
+        def resolve(self, **kwargs):
+            return [{'value': i} for i in range(5)]
+
+    class Query(graphene.ObjectType):
+        bar = Bar.as_field()
+
+    schema = graphene.Schema(query=Query)
+    result = schema.execute('''\
+{
+    bar {
+        foo
+    }
+}
+''', context_value={})
+    assert not result.errors
+    assert result.data == {"bar": [{"foo": i} for i in range(5)]}
+    assert len(calls) == 1
+    assert [i['value'] for i in calls[0]] == list(range(5))
+
+
+def test_args():
+    calls = []
+
+    class Foo(resolver.Resolver):
+        schema = {
+            'args': {'times': 'Int'},
+            'type': 'Int',
+        }
+
+        def resolve_batch(self, parents, **kwargs):
+            calls.append(kwargs)
+            return [i['value'] * kwargs.get('times', 1) for i in parents]
+
+    class Bar(resolver.Resolver):
+        schema = [{
+            'value': 'Int',
+            'foo': Foo,
+        }]
+
+        def resolve(self, **kwargs):
+            return [{'value': i} for i in range(3)]
+
+    class Query(graphene.ObjectType):
+        bar = Bar.as_field()
+
+    schema = graphene.Schema(query=Query)
+    result = schema.execute('''\
+{
+    bar {
+        a: foo
+        b: foo(times: 2)
+        c: foo(times: 2)
+    }
+}
+''', context_value={})
+    assert not result.errors
+    assert result.data == {"bar": [
+        {"a": i, "b": i * 2, "c": i * 2} for i in range(3)]}
+    assert calls == [{}, {'times': 2}]
+
+
+def test_without_context():
+    calls = []
+
+    class Foo(resolver.Resolver):
+        schema = 'Int'
+
+        def resolve_batch(self, parents, **kwargs):
+            calls.append(parents)
+            return [i['value'] for i in parents]
+
+    class Bar(resolver.Resolver):
+        schema = [{
+            'foo': Foo,
+        }]
+
+        def resolve(self, **kwargs):
+            return [{'value': i} for i in range(3)]
+
+    class Query(graphene.ObjectType):
+        bar = Bar.as_field()
+
+    schema = graphene.Schema(query=Query)
+    result = schema.execute('''\
+{
+    bar {
+        foo
+    }
+}
+''')
+    assert not result.errors
+    assert result.data == {"bar": [{"foo": i} for i in range(3)]}
+    assert len(calls) == 3
+
+
+def test_root_field():
+
+    class Foo(resolver.Resolver):
+        schema = {'value': 'Int'}
+
+        def resolve_batch(self, parents, **kwargs):
+            assert parents == [None]
+            return [{'value': 1}]
+
+    class Query(graphene.ObjectType):
+        foo = Foo.as_field()
+
+    schema = graphene.Schema(query=Query)
+    result = schema.execute('''\
+{
+    foo {
+        value
+    }
+}
+''', context_value={})
+    assert not result.errors
+    assert result.data == {"foo": {"value": 1}}
@@ -0,0 +1,28 @@
+# pylint:disable=missing-docstring,invalid-name,unused-variable
+import json
+
+import graphene_resolver as resolver
+from graphene_resolver import bench
+
+
+def test_run():
+    result = bench.run(repeat=1, scale=0.001)
+    assert result['version'] == resolver.__version__
+    assert set(result['results']) == set(bench.BENCHMARKS)
+    for v in result['results'].values():
+        assert 0 < v['min'] <= v['median']
+
+
+def test_main(tmp_path, capsys):
+    base = tmp_path / 'base.json'
+    assert bench.main(['resolve_scalar_list', '-r', '1',
+                       '-s', '0.001', '-o', str(base)]) == 0
+    data = json.loads(base.read_text())
+    assert list(data['results']) == ['resolve_scalar_list']
+    data['results']['resolve_scalar_list']['min'] = 1e-12
+    base.write_text(json.dumps(data))
+    assert bench.main(['resolve_scalar_list', '-r', '1',
+                       '-s', '0.001', '-c', str(base)]) == 1
+    out, err = capsys.readouterr()
+    assert 'resolve_scalar_list' in out
+    assert 'Regression' in err
@@ -0,0 +1,220 @@
+# pylint:disable=missing-docstring,invalid-name,unused-variable
+import dataclasses
+
+import graphene
+
+import graphene_resolver as resolver
+
+
+def test_simple():
+    calls = []
+
+    class Foo(resolver.Resolver):
+        schema = {
+            'args': {'value': 'Int'},
+            'type': 'Int',
+            'cache': True,
+        }
+
+        def resolve(self, **kwargs):
+            calls.append(kwargs)
+            return kwargs.get('value', 0)
+
+    class Query(graphene.ObjectType):
+        foo = Foo.as_field()
+
+    schema = graphene.Schema(query=Query)
+    for _ in range(3):
+        result = schema.execute('''\
+{
+    a: foo
+    b: foo(value: 1)
+}
+''')
+        assert not result.errors
+        assert result.data == {"a": 0, "b": 1}
+    assert calls == [{}, {'value': 1}]
+    assert Foo.cache_stats() == resolver.cache.Stats(hits=4, misses=2, size=2)
+
+    assert Foo.cache_invalidate(resolver.cache.default_key(None, value=1), field_name='foo')
+    assert not Foo.cache_invalidate(resolver.cache.default_key(None, value=1), field_name='foo')
+    result = schema.execute('''\
+{
+    b: foo(value: 1)
+}
+''')
+    assert not result.errors
+    assert calls == [{}, {'value': 1}, {'value': 1}]
+
+    Foo.cache_clear()
+    assert Foo.cache_stats() == resolver.cache.Stats(hits=0, misses=0, size=0)
+
+
+def test_ttl():
+    now = [0]
+    calls = []
+
+    class Foo(resolver.Resolver):
+        schema = {
+            'type': 'Int',
+            'cache': {'ttl': 30, 'timer': lambda: now[0]},
+        }
+
+        def resolve(self, **kwargs):
+            calls.append(kwargs)
+            return 1
+
+    class Query(graphene.ObjectType):
+        foo = Foo.as_field()
+
+    schema = graphene.Schema(query=Query)
+    assert schema.execute('{ foo }').data == {'foo': 1}
+    now[0] = 29
+    assert schema.execute('{ foo }').data == {'foo': 1}
+    assert len(calls) == 1
+    now[0] = 30
+    assert schema.execute('{ foo }').data == {'foo': 1}
+    assert len(calls) == 2
+
+
+def test_maxsize():
+    cache = resolver.cache.Cache(maxsize=2)
+    cache.set('a', 1)
+    cache.set('b', 2)
+    assert cache.get('a') == (True, 1)
+    cache.set('c', 3)
+    assert cache.get('b') == (False, None)
+    assert cache.get('a') == (True, 1)
+    assert cache.get('c') == (True, 3)
+    assert cache.stats().size == 2
+
+
+def test_default_maxsize():
+    assert resolver.cache.Cache().maxsize == resolver.cache.DEFAULT_MAXSIZE
+    assert resolver.cache.Cache.parse(True).maxsize == resolver.cache.DEFAULT_MAXSIZE
+    assert resolver.cache.Cache(maxsize=None).maxsize is None
+
+
+def test_unhashable_parent():
+    calls = []
+
+    @dataclasses.dataclass
+    class P:
+        a: int
+
+    class C(resolver.Resolver):
+        schema = {
+            'type': 'Int',
+            'cache': True,
+        }
+
+        def resolve(self, **kwargs):
+            calls.append(self.parent)
+            return self.parent.a
+
+    class Ps(resolver.Resolver):
+        schema = [{'c': C}]
+
+        def resolve(self, **kwargs):
+            return [P(1), P(2)]
+
+    class Query(graphene.ObjectType):
+        ps = Ps.as_field()
+
+    schema = graphene.Schema(query=Query)
+    for _ in range(2):
+        result = schema.execute('{ ps { c } }')
+        assert not result.errors
+        assert result.data == {"ps": [{"c": 1}, {"c": 2}]}
+    assert len(calls) == 4
+    assert C.cache_stats().size == 0
+
+
+def test_key():
+    calls = []
+
+    class Foo(resolver.Resolver):
+        schema = {
+            'type': 'Int',
+            'cache': {'key': lambda parent, **kwargs: parent['id']},
+        }
+
+        def resolve(self, **kwargs):
+            calls.append(self.parent)
+            return self.parent['id']
+
+    class Bar(resolver.Resolver):
+        schema = [{'foo': Foo}]
+
+        def resolve(self, **kwargs):
+            return [{'id': 1, 'extra': object()}, {'id': 2}, {'id': 1}]
+
+    class Query(graphene.ObjectType):
+        bar = Bar.as_field()
+
+    schema = graphene.Schema(query=Query)
+    result = schema.execute('''\
+{
+    bar {
+        foo
+    }
+}
+''')
+    assert not result.errors
+    assert result.data == {"bar": [{"foo": 1}, {"foo": 2}, {"foo": 1}]}
+    assert len(calls) == 2
+    assert Foo.cache_invalidate(2, field_name='foo')
+
+
+def test_fields():
+    class Name(resolver.Resolver):
+        schema = {
+            'type': 'String',
+            'cache': True,
+        }
+
+    class Query(graphene.ObjectType):
+        first = Name.as_field()
+        last = Name.as_field()
+
+    schema = graphene.Schema(query=Query)
+    root = type('Root', (), dict(first='A', last='B'))()
+    for _ in range(2):
+        result = schema.execute('{ first last }', root_value=root)
+        assert not result.errors
+        assert result.data == {'first': 'A', 'last': 'B'}
+    assert Name.cache_stats() == resolver.cache.Stats(hits=2, misses=2, size=2)
+    assert Name.cache_invalidate(resolver.cache.default_key(root), field_name='last')
+
+
+def test_promise():
+    calls = []
+
+    class Foo(resolver.Resolver):
+        schema = {
+            'type': 'Int',
+            'cache': True,
+        }
+
+        def resolve_batch(self, parents, **kwargs):
+            calls.append(parents)
+            return [1 for _ in parents]
+
+    class Query(graphene.ObjectType):
+        foo = Foo.as_field()
+
+    schema = graphene.Schema(query=Query)
+    for _ in range(2):
+        result = schema.execute('{ foo }', context_value={})
+        assert not result.errors
+        assert result.data == {'foo': 1}
+    assert len(calls) == 1
+
+
+def test_not_enabled():
+    class Foo(resolver.Resolver):
+        schema = 'Int'
+
+    Foo.cache_clear()
+    assert Foo.cache_stats() is None
+    assert not Foo.cache_invalidate(None, field_name='foo')
@@ -0,0 +1,165 @@
+# pylint:disable=missing-docstring,invalid-name,unused-variable
+import asyncio
+
+import graphene
+from graphql.execution.executors.asyncio import AsyncioExecutor
+
+import graphene_resolver as resolver
+
+
+def _run(coroutine):
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coroutine)
+    finally:
+        loop.close()
+
+
+def test_simple():
+    consumed = []
+
+    async def _generate():
+        for i in range(100):
+            await asyncio.sleep(0)
+            consumed.append(i)
+            yield {'name': str(i)}
+
+    async def _count():
+        return 100
+
+    class Item(resolver.Resolver):
+        schema = {'name': 'String!'}
+
+    class Items(resolver.Resolver):
+        schema = resolver.connection.get_type(Item)
+
+        async def resolve(self, **kwargs):
+            return await resolver.connection.resolve_async(
+                _generate(), count=_count, **kwargs)
+
+    class Query(graphene.ObjectType):
+        items = Items.as_field()
+
+    schema = graphene.Schema(query=Query)
+    loop = asyncio.new_event_loop()
+    try:
+        result = schema.execute('''\
+{
+    items(first: 2, after: "YXJyYXljb25uZWN0aW9uOjA=") {
+        nodes {
+            name
+        }
+        edges {
+            cursor
+        }
+        pageInfo {
+            hasNextPage
+            hasPreviousPage
+            startCursor
+            endCursor
+        }
+        totalCount
+    }
+}
+''', executor=AsyncioExecutor(loop=loop))
+    finally:
+        loop.close()
+    assert not result.errors
+    assert result.data == {'items': {
+        'nodes': [{'name': '1'}, {'name': '2'}],
+        'edges': [
+            {'cursor': 'YXJyYXljb25uZWN0aW9uOjE='},
+            {'cursor': 'YXJyYXljb25uZWN0aW9uOjI='},
+        ],
+        'pageInfo': {
+            'hasNextPage': True,
+            'hasPreviousPage': False,
+            'startCursor': 'YXJyYXljb25uZWN0aW9uOjE=',
+            'endCursor': 'YXJyYXljb25uZWN0aW9uOjI=',
+        },
+        'totalCount': 100,
+    }}
+    assert consumed == [0, 1, 2, 3]
+
+
+def test_source():
+    calls = []
+
+    class Source(resolver.connection.AsyncPageableSource):
+        async def count(self):
+            calls.append('count')
+            return 10
+
+        async def fetch(self, offset, limit):
+            calls.append(('fetch', offset, limit))
+            return list(range(offset, min(offset + limit, 10)))
+
+    result = _run(resolver.connection.resolve_async(Source(), last=3))
+    assert result['nodes'] == [7, 8, 9]
+    assert result['pageInfo']['has_previous_page']
+    assert not result['pageInfo']['has_next_page']
+    assert result['totalCount'] == 10
+    assert calls == ['count', ('fetch', 7, 3)]
+
+    calls.clear()
+    result = _run(resolver.connection.resolve_async(Source(), first=20))
+    assert result['nodes'] == list(range(10))
+    assert not result['pageInfo']['has_next_page']
+    assert calls == [('fetch', 0, 21)]
+
+
+def test_iterator_closed():
+    closed = []
+
+    async def _generate():
+        try:
+            for i in range(10):
+                yield i
+        finally:
+            closed.append(True)
+
+    result = _run(resolver.connection.resolve_async(_generate(), first=2))
+    assert result['nodes'] == [0, 1]
+    assert closed == [True]
+
+
+def test_total_count_alias():
+    count_calls = []
+
+    async def _generate():
+        for i in range(10):
+            yield i
+
+    async def _count():
+        count_calls.append(1)
+        return 10
+
+    class Item(resolver.Resolver):
+        schema = 'Int!'
+
+    class Items(resolver.Resolver):
+        schema = resolver.connection.get_type(Item)
+
+        async def resolve(self, **kwargs):
+            return await resolver.connection.resolve_async(
+                _generate(), count=_count, **kwargs)
+
+    class Query(graphene.ObjectType):
+        items = Items.as_field()
+
+    schema = graphene.Schema(query=Query)
+    loop = asyncio.new_event_loop()
+    try:
+        result = schema.execute('''\
+{
+    items(first: 2) {
+        a: totalCount
+        b: totalCount
+    }
+}
+''', executor=AsyncioExecutor(loop=loop))
+    finally:
+        loop.close()
+    assert not result.errors
+    assert result.data == {'items': {'a': 10, 'b': 10}}
+    assert count_calls == [1]
@@ -0,0 +1,187 @@
+# pylint:disable=missing-docstring,invalid-name,unused-variable
+import asyncio
+
+import graphene
+import pytest
+from graphql.execution.executors.asyncio import AsyncioExecutor
+
+import graphene_resolver as resolver
+
+
+class _Source(resolver.connection.PageableSource):
+    def __init__(self, estimate=None):
+        self.calls = []
+        self.estimate = estimate
+
+    def count(self):
+        self.calls.append('count')
+        return 10
+
+    def fetch(self, offset, limit):
+        return list(range(10))[offset:offset+limit]
+
+    def estimate_count(self):
+        self.calls.append('estimate_count')
+        return self.estimate
+
+
+def test_approximate_count():
+    source = _Source(estimate=12)
+
+    class Item(resolver.Resolver):
+        schema = 'Int!'
+
+    class Items(resolver.Resolver):
+        schema = resolver.connection.get_type(
+            Item, name='EstimatedItemConnection', total_count_is_estimate=True)
+
+        def resolve(self, **kwargs):
+            return resolver.connection.resolve(source, approximate_count=True, **kwargs)
+
+    class Query(graphene.ObjectType):
+        items = Items.as_field()
+
+    schema = graphene.Schema(query=Query)
+    query = '''\
+{
+    items{
+        totalCount
+        totalCountIsEstimate
+    }
+}
+'''
+    result = schema.execute(query)
+    assert not result.errors
+    assert result.data == {
+        "items": {
+            "totalCount": 12,
+            "totalCountIsEstimate": True,
+        }
+    }
+    assert source.calls == ['estimate_count']
+
+    source.estimate = None
+    result = schema.execute(query)
+    assert not result.errors
+    assert result.data == {
+        "items": {
+            "totalCount": 10,
+            "totalCountIsEstimate": False,
+        }
+    }
+
+
+def test_count_cache():
+    now = [0]
+    cache = resolver.cache.Cache(ttl=10, timer=lambda: now[0])
+    source = _Source()
+
+    def _resolve():
+        return resolver.connection.resolve(
+            source, first=1, count_cache=cache, count_key='items').totalCount
+
+    assert _resolve() == 10
+    assert _resolve() == 10
+    assert source.calls == ['count']
+    now[0] = 10
+    assert _resolve() == 10
+    assert source.calls == ['count', 'count']
+
+
+def test_count_cache_requires_key():
+    cache = resolver.cache.Cache()
+    with pytest.raises(ValueError):
+        resolver.connection.resolve([1, 2, 3], count_cache=cache)
+    loop = asyncio.new_event_loop()
+    try:
+        with pytest.raises(ValueError):
+            loop.run_until_complete(
+                resolver.connection.resolve_async([1, 2, 3], count_cache=cache))
+    finally:
+        loop.close()
+
+
+def test_request_count_cache():
+    source = _Source()
+
+    class Item(resolver.Resolver):
+        schema = 'Int!'
+
+    class Items(resolver.Resolver):
+        schema = resolver.connection.get_type(Item, name='CachedItemConnection')
+
+        def resolve(self, **kwargs):
+            return resolver.connection.resolve(
+                source,
+                count_cache=resolver.connection.get_request_count_cache(self.context),
+                count_key='items',
+                **kwargs)
+
+    class Query(graphene.ObjectType):
+        items = Items.as_field()
+
+    schema = graphene.Schema(query=Query)
+    query = '''\
+{
+    a: items(first: 1){
+        totalCount
+    }
+    b: items(last: 1){
+        nodes
+    }
+}
+'''
+    result = schema.execute(query, context_value={})
+    assert not result.errors
+    assert result.data == {"a": {"totalCount": 10}, "b": {"nodes": [9]}}
+    assert source.calls == ['count']
+    result = schema.execute(query, context_value={})
+    assert source.calls == ['count', 'count']
+    assert resolver.connection.get_request_count_cache(None) is None
+
+
+def test_async_approximate_count():
+    class Source(resolver.connection.AsyncPageableSource):
+        async def count(self):
+            return 10
+
+        async def fetch(self, offset, limit):
+            return list(range(10))[offset:offset+limit]
+
+        async def estimate_count(self):
+            return 12
+
+    class Item(resolver.Resolver):
+        schema = 'Int!'
+
+    class Items(resolver.Resolver):
+        schema = resolver.connection.get_type(
+            Item, name='AsyncEstimatedItemConnection', total_count_is_estimate=True)
+
+        async def resolve(self, **kwargs):
+            return await resolver.connection.resolve_async(
+                Source(), approximate_count=True, **kwargs)
+
+    class Query(graphene.ObjectType):
+        items = Items.as_field()
+
+    schema = graphene.Schema(query=Query)
+    loop = asyncio.new_event_loop()
+    try:
+        result = schema.execute('''\
+{
+    items(first: 1){
+        totalCount
+        totalCountIsEstimate
+    }
+}
+''', executor=AsyncioExecutor(loop=loop))
+    finally:
+        loop.close()
+    assert not result.errors
+    assert result.data == {
+        "items": {
+            "totalCount": 12,
+            "totalCountIsEstimate": True,
+        }
+    }
@@ -0,0 +1,151 @@
+# pylint:disable=missing-docstring,invalid-name,unused-variable
+import sqlite3
+
+import graphene
+import pytest
+
+import graphene_resolver as resolver
+
+
+@pytest.fixture(name='db')
+def _db():
+    db = sqlite3.connect(':memory:')
+    db.row_factory = sqlite3.Row
+    db.execute('CREATE TABLE item (id INTEGER PRIMARY KEY, name TEXT)')
+    db.executemany('INSERT INTO item VALUES (?, ?)',
+                   [(i, f'item{i}') for i in range(1, 11)])
+    yield db
+    db.close()
+
+
+def _query_factory(db, statements):
+    def _query(*, after, before, limit, descending):
+        sql = 'SELECT id, name FROM item'
+        where = []
+        params = []
+        if after is not None:
+            where.append('id > ?')
+            params.append(after[0])
+        if before is not None:
+            where.append('id < ?')
+            params.append(before[0])
+        if where:
+            sql += ' WHERE ' + ' AND '.join(where)
+        sql += ' ORDER BY id DESC' if descending else ' ORDER BY id'
+        if limit is not None:
+            sql += ' LIMIT ?'
+            params.append(limit)
+        statements.append(sql)
+        return [dict(i) for i in db.execute(sql, params)]
+    return _query
+
+
+def _schema(db, statements):
+    class Item(resolver.Resolver):
+        schema = {'id': 'Int!', 'name': 'String!'}
+
+    class Items(resolver.Resolver):
+        schema = resolver.connection.get_type(Item)
+
+        def resolve(self, **kwargs):
+            return resolver.connection.resolve_keyset(
+                _query_factory(db, statements),
+                sort_keys=('id',),
+                count=lambda: db.execute(
+                    'SELECT COUNT(*) FROM item').fetchone()[0],
+                **kwargs)
+
+    class Query(graphene.ObjectType):
+        items = Items.as_field()
+
+    return graphene.Schema(query=Query)
+
+
+_QUERY = '''\
+query ($first: Int, $last: Int, $after: String, $before: String) {
+    items(first: $first, last: $last, after: $after, before: $before) {
+        nodes {
+            id
+        }
+        pageInfo {
+            hasNextPage
+            hasPreviousPage
+            startCursor
+            endCursor
+        }
+    }
+}
+'''
+
+
+def test_forward(db):
+    statements = []
+    schema = _schema(db, statements)
+    result = schema.execute(_QUERY, variable_values={'first': 3})
+    assert not result.errors
+    data = result.data['items']
+    assert [i['id'] for i in data['nodes']] == [1, 2, 3]
+    assert data['pageInfo']['hasNextPage'] is True
+    assert data['pageInfo']['startCursor'] == resolver.connection.keyset_to_cursor([1])
+
+    result = schema.execute(_QUERY, variable_values={
+        'first': 3, 'after': data['pageInfo']['endCursor']})
+    assert not result.errors
+    data = result.data['items']
+    assert [i['id'] for i in data['nodes']] == [4, 5, 6]
+
+    result = schema.execute(_QUERY, variable_values={
+        'first': 5, 'after': resolver.connection.keyset_to_cursor([8])})
+    assert not result.errors
+    data = result.data['items']
+    assert [i['id'] for i in data['nodes']] == [9, 10]
+    assert data['pageInfo']['hasNextPage'] is False
+
+    assert statements == [
+        'SELECT id, name FROM item ORDER BY id LIMIT ?',
+        'SELECT id, name FROM item WHERE id > ? ORDER BY id LIMIT ?',
+        'SELECT id, name FROM item WHERE id > ? ORDER BY id LIMIT ?',
+    ]
+
+
+def test_backward(db):
+    statements = []
+    schema = _schema(db, statements)
+    result = schema.execute(_QUERY, variable_values={'last': 3})
+    assert not result.errors
+    data = result.data['items']
+    assert [i['id'] for i in data['nodes']] == [8, 9, 10]
+    assert data['pageInfo']['hasPreviousPage'] is True
+
+    result = schema.execute(_QUERY, variable_values={
+        'last': 3, 'before': data['pageInfo']['startCursor']})
+    assert not result.errors
+    data = result.data['items']
+    assert [i['id'] for i in data['nodes']] == [5, 6, 7]
+    assert statements == [
+        'SELECT id, name FROM item ORDER BY id DESC LIMIT ?',
+        'SELECT id, name FROM item WHERE id < ? ORDER BY id DESC LIMIT ?',
+    ]
+
+
+def test_total_count(db):
+    statements = []
+    schema = _schema(db, statements)
+    result = schema.execute('''\
+{
+    items(first: 1) {
+        totalCount
+    }
+}
+''')
+    assert not result.errors
+    assert result.data == {'items': {'totalCount': 10}}
+    assert statements == []
+
+
+def test_cursor():
+    cursor = resolver.connection.keyset_to_cursor(['a', 1])
+    assert resolver.connection.cursor_to_keyset(cursor) == ('a', 1)
+    assert resolver.connection.cursor_to_keyset(
+        'YXJyYXljb25uZWN0aW9uOjA=') is None
+    assert resolver.connection.cursor_to_keyset('invalid') is None
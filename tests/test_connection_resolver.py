@@ -2,6 +2,8 @@
 import json
 
 import graphene
+import graphql
+import pytest
 
 import graphene_resolver as resolver
 
@@ -356,3 +358,241 @@ def test_empty_with_last():
 }
 ''',)
     assert not result.errors
+
+
+def test_result_type():
+    calls = []
+
+    class Source(resolver.connection.PageableSource):
+        def count(self):
+            calls.append('count')
+            return 3
+
+        def fetch(self, start, limit):
+            calls.append(('fetch', start, limit))
+            return [1, 2, 3][start:start+limit]
+
+    result = resolver.connection.resolve(Source(), first=2)
+    assert isinstance(result, resolver.connection.Connection)
+    assert isinstance(result.pageInfo, resolver.connection.PageInfo)
+    assert not calls
+    assert result.nodes == [1, 2]
+    assert calls == [('fetch', 0, 3)]
+    assert result.pageInfo.has_next_page is True
+    assert result['pageInfo']['end_cursor'] == 'YXJyYXljb25uZWN0aW9uOjE='
+    assert calls == [('fetch', 0, 3)]
+    assert result.totalCount == 3
+    assert calls == [('fetch', 0, 3), 'count']
+    assert not hasattr(result, '__dict__')
+
+
+def test_result_mapping():
+    result = resolver.connection.resolve([1, 2, 3], first=2)
+    assert 'totalCount' in result
+    assert 'foo' not in result
+    assert len(result) == len(resolver.connection.Connection.FIELDS)
+    data = {**result}
+    assert data['nodes'] == [1, 2]
+    assert data['totalCount'] == 3
+    assert dict(data['pageInfo']) == {
+        'start_cursor': 'YXJyYXljb25uZWN0aW9uOjA=',
+        'end_cursor': 'YXJyYXljb25uZWN0aW9uOjE=',
+        'has_previous_page': False,
+        'has_next_page': True,
+    }
+    assert dict(result.items())['edges'] == data['edges']
+    assert result.get('foo') is None
+
+
+def test_default_resolver_not_patched():
+    assert (graphene.types.resolver.get_default_resolver()
+            is graphene.types.resolver.dict_or_attr_resolver)
+
+
+def test_lazy_proxy_fields():
+    import lazy_object_proxy as lazy
+
+    class Item(resolver.Resolver):
+        schema = {'name': 'String!'}
+
+    class Items(resolver.Resolver):
+        schema = resolver.connection.get_type(Item)
+
+        def resolve(self, **kwargs):
+            nodes = [{'name': 'a'}, {'name': 'b'}]
+            return dict(
+                nodes=lazy.Proxy(lambda: nodes),
+                edges=lazy.Proxy(lambda: [
+                    dict(node=i, cursor=lazy.Proxy(lambda: 'c'))
+                    for i in nodes
+                ]),
+                pageInfo=lazy.Proxy(lambda: dict(
+                    start_cursor=lazy.Proxy(lambda: None),
+                    end_cursor=None,
+                    has_previous_page=lazy.Proxy(lambda: False),
+                    has_next_page=lazy.Proxy(lambda: True),
+                )),
+                totalCount=lazy.Proxy(lambda: 2),
+            )
+
+    class Query(graphene.ObjectType):
+        items = Items.as_field()
+
+    schema = graphene.Schema(query=Query)
+    result = schema.execute('''\
+{
+    items{
+        nodes{
+            name
+        }
+        edges{
+            node{
+                name
+            }
+            cursor
+        }
+        pageInfo{
+            hasNextPage
+            hasPreviousPage
+            startCursor
+        }
+        totalCount
+    }
+}
+''')
+    assert not result.errors
+    assert json.dumps(result.data)
+    assert result.data == {
+        "items": {
+            "nodes": [{"name": "a"}, {"name": "b"}],
+            "edges": [
+                {"node": {"name": "a"}, "cursor": "c"},
+                {"node": {"name": "b"}, "cursor": "c"},
+            ],
+            "pageInfo": {
+                "hasNextPage": True,
+                "hasPreviousPage": False,
+                "startCursor": None,
+            },
+            "totalCount": 2,
+        },
+    }
+
+
+def test_cursor_codec():
+    from graphql_relay.connection import arrayconnection
+
+    assert (resolver.connection.offsets_to_cursors(98, 102)
+            == [arrayconnection.offset_to_cursor(i) for i in range(98, 102)])
+    assert resolver.connection.offset_to_cursor(
+        7) == arrayconnection.offset_to_cursor(7)
+    assert resolver.connection.offsets_to_cursors(
+        1, 3, compact=True) == ['~1', '~2']
+    assert resolver.connection.cursor_to_offset(
+        arrayconnection.offset_to_cursor(12)) == 12
+    assert resolver.connection.cursor_to_offset('~12') == 12
+    assert resolver.connection.cursor_to_offset('~a') is None
+    assert resolver.connection.cursor_to_offset('invalid') is None
+
+
+def test_compact_cursor():
+    from graphql_relay.connection import arrayconnection
+
+    result = resolver.connection.resolve(
+        list(range(10)), first=2, after='~3', compact_cursor=True)
+    assert result.nodes == [4, 5]
+    assert [i['cursor'] for i in result.edges] == ['~4', '~5']
+    assert result.pageInfo.start_cursor == '~4'
+    assert result.pageInfo.end_cursor == '~5'
+
+    result = resolver.connection.resolve(
+        list(range(10)), first=2, after=arrayconnection.offset_to_cursor(3), compact_cursor=True)
+    assert result.nodes == [4, 5]
+
+
+def test_page_size():
+    class Item(resolver.Resolver):
+        schema = {'name': 'String!'}
+
+    class Items(resolver.Resolver):
+        schema = resolver.connection.get_type(
+            Item, name='LimitedItemConnection', max_page_size=3, default_page_size=2)
+
+        def resolve(self, **kwargs):
+            return resolver.connection.resolve(
+                [{'name': str(i)} for i in range(10)], **kwargs)
+
+    class Query(graphene.ObjectType):
+        items = Items.as_field()
+
+    schema = graphene.Schema(query=Query)
+    result = schema.execute('''\
+{
+    items{
+        nodes{
+            name
+        }
+        pageInfo{
+            hasNextPage
+        }
+    }
+}
+''')
+    assert not result.errors
+    assert result.data == {
+        "items": {
+            "nodes": [{"name": "0"}, {"name": "1"}],
+            "pageInfo": {"hasNextPage": True},
+        },
+    }
+    result = schema.execute('''\
+{
+    items(last: 3){
+        nodes{
+            name
+        }
+    }
+}
+''')
+    assert not result.errors
+    assert result.data == {
+        "items": {
+            "nodes": [{"name": "7"}, {"name": "8"}, {"name": "9"}],
+        },
+    }
+    result = schema.execute('''\
+{
+    items(first: 4){
+        nodes{
+            name
+        }
+    }
+}
+''')
+    assert len(result.errors) == 1
+    assert str(result.errors[0]) == '`first` exceeds max page size 3, got 4'
+
+
+def test_page_size_registered():
+    class Item(resolver.Resolver):
+        schema = {'name': 'String!'}
+
+    default = resolver.connection.get_type(Item)
+    assert resolver.connection.get_type(Item) is default
+    with pytest.raises(ValueError):
+        resolver.connection.get_type(Item, max_page_size=10)
+    limited = resolver.connection.get_type(Item, name='LimitedItemConnection', max_page_size=10)
+    assert resolver.connection.get_type(
+        Item, name='LimitedItemConnection', max_page_size=10) is limited
+    with pytest.raises(ValueError):
+        resolver.connection.get_type(Item, name='LimitedItemConnection', default_page_size=5)
+
+
+def test_resolve_page_size():
+    result = resolver.connection.resolve(list(range(10)), max_page_size=4)
+    assert result.nodes == [0, 1, 2, 3]
+    result = resolver.connection.resolve(
+        list(range(10)), max_page_size=4, default_page_size=1)
+    assert result.nodes == [0]
+    with pytest.raises(graphql.GraphQLError, match='`last` exceeds max page size 4, got 5'):
+        resolver.connection.resolve(list(range(10)), last=5, max_page_size=4)
@@ -0,0 +1,266 @@
+# pylint:disable=missing-docstring,invalid-name,unused-variable
+import asyncio
+import sqlite3
+
+import graphene
+import pytest
+
+import graphene_resolver as resolver
+
+
+@pytest.fixture(name='db')
+def _db():
+    db = sqlite3.connect(':memory:')
+    db.execute('CREATE TABLE item (id INTEGER PRIMARY KEY, name TEXT)')
+    db.executemany('INSERT INTO item VALUES (?, ?)',
+                   [(i, f'item{i}') for i in range(10)])
+    yield db
+    db.close()
+
+
+class _Row(dict):
+    def __getitem__(self, key):
+        if isinstance(key, int):
+            return list(self.values())[key]
+        return super().__getitem__(key)
+
+
+def _schema(db):
+    class Item(resolver.Resolver):
+        schema = {'id': 'Int!', 'name': 'String!'}
+
+    class Items(resolver.Resolver):
+        schema = resolver.connection.get_type(Item)
+
+        def resolve(self, **kwargs):
+            cursor = db.cursor()
+            cursor.row_factory = lambda cursor, row: _Row(
+                zip((i[0] for i in cursor.description), row))
+            return resolver.connection.resolve(
+                resolver.connection.DBAPISource(
+                    cursor,
+                    'SELECT id, name FROM item WHERE id >= ? ORDER BY id',
+                    (1,),
+                ),
+                **kwargs)
+
+    class Query(graphene.ObjectType):
+        items = Items.as_field()
+
+    return graphene.Schema(query=Query)
+
+
+def test_db_api(db):
+    statements = []
+    db.set_trace_callback(statements.append)
+    schema = _schema(db)
+    result = schema.execute('''\
+{
+    items(first: 2) {
+        nodes {
+            id
+        }
+        edges {
+            cursor
+        }
+        pageInfo {
+            hasNextPage
+            hasPreviousPage
+            endCursor
+        }
+    }
+}
+''')
+    assert not result.errors
+    assert result.data == {'items': {
+        'nodes': [{'id': 1}, {'id': 2}],
+        'edges': [
+            {'cursor': 'YXJyYXljb25uZWN0aW9uOjA='},
+            {'cursor': 'YXJyYXljb25uZWN0aW9uOjE='},
+        ],
+        'pageInfo': {
+            'hasNextPage': True,
+            'hasPreviousPage': False,
+            'endCursor': 'YXJyYXljb25uZWN0aW9uOjE=',
+        },
+    }}
+    assert statements == [
+        'SELECT id, name FROM item WHERE id >= 1 ORDER BY id LIMIT 3 OFFSET 0',
+    ]
+
+    statements.clear()
+    result = schema.execute('''\
+{
+    items(first: 2, after: "YXJyYXljb25uZWN0aW9uOjc=") {
+        nodes {
+            id
+        }
+        pageInfo {
+            hasNextPage
+        }
+        totalCount
+    }
+}
+''')
+    assert not result.errors
+    assert result.data == {'items': {
+        'nodes': [{'id': 9}],
+        'pageInfo': {'hasNextPage': False},
+        'totalCount': 9,
+    }}
+    assert sorted(statements) == sorted([
+        'SELECT id, name FROM item WHERE id >= 1 ORDER BY id LIMIT 3 OFFSET 8',
+        'SELECT COUNT(*) FROM (SELECT id, name FROM item WHERE id >= 1 ORDER BY id) AS _count',
+    ])
+
+
+def test_db_api_without_limit(db):
+    source = resolver.connection.DBAPISource(
+        db.cursor(), 'SELECT id FROM item ORDER BY id')
+    assert source.fetch(7, None) == [(7,), (8,), (9,)]
+    assert source.fetch(7, 1) == [(7,)]
+    assert source.count() == 10
+
+
+def test_sequence():
+    source = resolver.connection.SequenceSource([1, 2, 3])
+    assert source.count() == 3
+    assert source.fetch(1, None) == [2, 3]
+    assert source.fetch(1, 1) == [2]
+    assert source.estimate_count() is None
+    result = resolver.connection.resolve(source, first=2)
+    assert result['nodes'] == [1, 2]
+    assert result['pageInfo']['has_next_page']
+
+
+def test_custom_source():
+    calls = []
+
+    class Source(resolver.connection.PageableSource):
+        def count(self):
+            calls.append('count')
+            return 100
+
+        def fetch(self, offset, limit):
+            calls.append(('fetch', offset, limit))
+            return list(range(offset, min(offset + limit, 100)))
+
+    result = resolver.connection.resolve(
+        Source(),
+        first=10,
+        after=resolver.connection.arrayconnection.offset_to_cursor(94))
+    assert result['nodes'] == [95, 96, 97, 98, 99]
+    assert not result['pageInfo']['has_next_page']
+    assert calls == [('fetch', 95, 11)]
+    assert result['totalCount'] == 100
+    assert calls == [('fetch', 95, 11), 'count']
+
+
+def test_iterator():
+    consumed = []
+
+    def _generate():
+        for i in range(1000):
+            consumed.append(i)
+            yield {'name': str(i)}
+
+    result = resolver.connection.resolve(
+        _generate(),
+        first=3,
+        after=resolver.connection.offset_to_cursor(1))
+    assert result['nodes'] == [{'name': '2'}, {'name': '3'}, {'name': '4'}]
+    assert result['pageInfo']['has_next_page']
+    assert consumed == [0, 1, 2, 3, 4, 5]
+
+    result = resolver.connection.resolve(iter([1, 2]), first=3)
+    assert result['nodes'] == [1, 2]
+    assert not result['pageInfo']['has_next_page']
+
+
+def test_iterator_count():
+    calls = []
+
+    def _count():
+        calls.append('count')
+        return 1000
+
+    result = resolver.connection.resolve(
+        (i for i in range(1000)), first=1, count=_count)
+    assert result['nodes'] == [0]
+    assert calls == []
+    assert result['totalCount'] == 1000
+    assert calls == ['count']
+
+    result = resolver.connection.resolve(iter(range(10)), first=1)
+    with pytest.raises(NotImplementedError):
+        int(result['totalCount'])
+
+
+class _TailSource(resolver.connection.PageableSource):
+    def __init__(self):
+        self.calls = []
+
+    def count(self):
+        self.calls.append('count')
+        return 10
+
+    def fetch(self, offset, limit):
+        self.calls.append(('fetch', offset, limit))
+        return list(range(10))[offset:offset+limit]
+
+    def fetch_last(self, limit, skip):
+        self.calls.append(('fetch_last', limit, skip))
+        return list(range(10))[max(10 - skip - limit, 0):10 - skip]
+
+
+def test_fetch_last():
+    source = _TailSource()
+    result = resolver.connection.resolve(source, last=3)
+    assert result.nodes == [7, 8, 9]
+    assert result.pageInfo.has_previous_page
+    assert not result.pageInfo.has_next_page
+    assert source.calls == [('fetch_last', 4, 0)]
+
+    source = _TailSource()
+    result = resolver.connection.resolve(
+        source, last=5, before=result.pageInfo.start_cursor)
+    assert result.nodes == [2, 3, 4, 5, 6]
+    assert result.pageInfo.has_previous_page
+    before = result.pageInfo.start_cursor
+    result = resolver.connection.resolve(source, last=5, before=before)
+    assert result.nodes == [0, 1]
+    assert not result.pageInfo.has_previous_page
+    assert result.pageInfo.start_cursor == resolver.connection.offset_to_cursor(-10)
+    assert source.calls == [('fetch_last', 6, 3), ('fetch_last', 6, 8)]
+
+    # Cursor from the end used as `after` requires count.
+    source = _TailSource()
+    result = resolver.connection.resolve(source, first=2, after=before)
+    assert result.nodes == [3, 4]
+    assert source.calls == ['count', ('fetch', 3, 3)]
+
+
+def test_fetch_last_async():
+    class Source(resolver.connection.AsyncPageableSource):
+        async def count(self):
+            raise AssertionError('count should not be called')
+
+        async def fetch(self, offset, limit):
+            raise AssertionError('fetch should not be called')
+
+        async def fetch_last(self, limit, skip):
+            return list(range(10))[max(10 - skip - limit, 0):10 - skip]
+
+    loop = asyncio.new_event_loop()
+    try:
+        result = loop.run_until_complete(
+            resolver.connection.resolve_async(Source(), last=3))
+        assert result.nodes == [7, 8, 9]
+        assert result.pageInfo.has_previous_page
+        result = loop.run_until_complete(
+            resolver.connection.resolve_async(
+                Source(), last=8, before=result.pageInfo.start_cursor))
+        assert result.nodes == [0, 1, 2, 3, 4, 5, 6]
+        assert not result.pageInfo.has_previous_page
+    finally:
+        loop.close()
@@ -0,0 +1,189 @@
+# pylint:disable=missing-docstring,invalid-name,unused-variable
+import threading
+
+import graphene
+import pytest
+
+import graphene_resolver as resolver
+
+
+def test_simple():
+    class Foo(resolver.Resolver, lazy=True):
+        schema = {
+            'args': {'value': 'String!'},
+            'type': 'String!',
+        }
+
+        def resolve(self, **kwargs):
+            return kwargs['value']
+
+    assert '_schema' not in Foo.__dict__
+
+    class Query(graphene.ObjectType):
+        foo = Foo.as_field()
+
+    assert '_schema' in Foo.__dict__
+    schema = graphene.Schema(query=Query)
+    result = schema.execute('''\
+{
+    foo(value: "v")
+}
+''')
+    assert not result.errors
+    assert result.data == {"foo": "v"}
+
+
+def test_inherit():
+    class Base(resolver.Resolver, abstract=True, lazy=True):
+        pass
+
+    class Foo(Base):
+        schema = 'Int'
+
+        def resolve(self, **kwargs):
+            return self.parent['bar']
+
+    class Bar(Base):
+        schema = {'foo': Foo}
+
+        def resolve(self, **kwargs):
+            return {'bar': 42}
+
+    class Eager(Base, lazy=False):
+        schema = 'Int'
+
+    assert '_schema' not in Foo.__dict__
+    assert '_schema' not in Bar.__dict__
+    assert '_schema' in Eager.__dict__
+
+    class Query(graphene.ObjectType):
+        bar = Bar.as_field()
+
+    assert '_schema' in Foo.__dict__
+    schema = graphene.Schema(query=Query)
+    result = schema.execute('''\
+{
+    bar {
+        foo
+    }
+}
+''')
+    assert not result.errors
+    assert result.data == {"bar": {"foo": 42}}
+
+
+def test_compile_all():
+    class Foo(resolver.Resolver, lazy=True):
+        schema = 'Int'
+
+    class Bar(resolver.Resolver, lazy=True):
+        schema = {'foo': Foo}
+
+    assert 'Bar' not in resolver.typedef.REGISTRY
+    resolver.compile_all()
+    assert '_schema' in Foo.__dict__
+    assert '_schema' in Bar.__dict__
+    assert 'Bar' in resolver.typedef.REGISTRY
+    assert not resolver.resolver._PENDING
+
+
+def test_dynamic_type():
+    class Foo(resolver.Resolver, lazy=True):
+        schema = {'value': 'Int'}
+
+    class Bar(resolver.Resolver):
+        schema = {'foo': 'Foo'}
+
+        def resolve(self, **kwargs):
+            return {'foo': {'value': 42}}
+
+    class Query(graphene.ObjectType):
+        bar = Bar.as_field()
+
+    assert '_schema' not in Foo.__dict__
+    schema = graphene.Schema(query=Query)
+    assert '_schema' in Foo.__dict__
+    result = schema.execute('''\
+{
+    bar {
+        foo {
+            value
+        }
+    }
+}
+''')
+    assert not result.errors
+    assert result.data == {"bar": {"foo": {"value": 42}}}
+
+
+def test_compile_all_concurrent():
+    classes = [type(f'Foo{i}', (resolver.Resolver,), dict(schema='Int'), lazy=True)
+               for i in range(50)]
+    threads = [threading.Thread(target=resolver.compile_all) for _ in range(8)]
+    errors = []
+
+    def _hook(args):
+        errors.append(args.exc_value)
+    old_hook, threading.excepthook = threading.excepthook, _hook
+    try:
+        for i in threads:
+            i.start()
+        for i in threads:
+            i.join()
+    finally:
+        threading.excepthook = old_hook
+    assert not errors
+    assert all('_schema' in i.__dict__ for i in classes)
+    assert not resolver.resolver._PENDING
+
+
+def test_compile_failed():
+    class Foo(resolver.Resolver, lazy=True):
+        schema = {'name': 'String'}
+
+        async def validate(self, value):
+            return True
+
+    with pytest.raises(TypeError):
+        resolver.compile_all()
+    assert '_schema' not in Foo.__dict__
+    assert Foo not in resolver.resolver._PENDING
+    resolver.compile_all()
+    with pytest.raises(TypeError):
+        Foo.as_type()
+
+
+def test_as_type_concurrent():
+    classes = [type(f'Bar{i}', (resolver.Resolver,), dict(schema={'name': 'String'}), lazy=True)
+               for i in range(20)]
+    results = []
+
+    def _run():
+        results.append([i.as_type() for i in classes])
+    threads = [threading.Thread(target=_run) for _ in range(8)]
+    for i in threads:
+        i.start()
+    for i in threads:
+        i.join()
+    assert len(results) == 8
+    assert all(i == results[0] for i in results)
+
+
+def test_interface():
+    class Named(resolver.Resolver, lazy=True):
+        schema = {'name': 'String'}
+
+    class Foo(resolver.Resolver):
+        schema = {
+            'type': {'name': 'String'},
+            'interfaces': (Named,),
+        }
+
+        def resolve(self, **kwargs):
+            return {'name': 'foo'}
+
+    class Query(graphene.ObjectType):
+        foo = Foo.as_field()
+
+    schema = graphene.Schema(query=Query)
+    assert 'interface Named' in str(schema)
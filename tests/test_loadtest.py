@@ -0,0 +1,49 @@
+# pylint:disable=missing-docstring,invalid-name,unused-variable
+import json
+
+import pytest
+
+from graphene_resolver import loadtest
+
+
+def test_queries():
+    schema = loadtest.build_schema(100)
+    for name, variables in loadtest.plan(50, size=100):
+        result = schema.execute(loadtest.QUERIES[name], variable_values=variables)
+        assert not result.errors, (name, variables)
+        assert result.data
+
+
+def test_plan():
+    assert loadtest.plan(20, seed=1) == loadtest.plan(20, seed=1)
+    assert loadtest.plan(20, seed=1) != loadtest.plan(20, seed=2)
+    assert {i for i, _ in loadtest.plan(20, mix={'node': 1})} == {'node'}
+
+
+def test_percentile():
+    values = list(range(1, 101))
+    assert loadtest.percentile(values, 50) == 50
+    assert loadtest.percentile(values, 99) == 99
+    assert loadtest.percentile(values, 100) == 100
+    assert loadtest.percentile([1], 0) == 1
+
+
+@pytest.mark.parametrize('executor', ['thread', 'process'])
+def test_run(executor):
+    report = loadtest.run(20, concurrency=2, executor=executor, size=50)
+    assert report.total.count == 20
+    assert report.total.errors == 0
+    assert sum(i.count for i in report.by_query.values()) == 20
+    assert report.throughput > 0
+    assert report.total.p50 <= report.total.p95 <= report.total.p99 <= report.total.max
+    assert 'throughput' in str(report)
+
+
+def test_main(tmp_path, capsys):
+    output = tmp_path / 'report.json'
+    assert loadtest.main(['-n', '10', '-c', '2', '-s', '50',
+                          '-q', 'feed', '-o', str(output)]) == 0
+    data = json.loads(output.read_text())
+    assert list(data['by_query']) == ['feed']
+    assert data['total']['count'] == 10
+    assert 'feed' in capsys.readouterr()[0]
@@ -0,0 +1,202 @@
+# pylint:disable=missing-docstring,invalid-name,unused-variable
+import asyncio
+
+import graphene
+from graphql.execution.executors.asyncio import AsyncioExecutor
+
+import graphene_resolver as resolver
+
+
+def test_simple():
+    calls = []
+
+    class Foo(resolver.Resolver):
+        schema = {
+            'args': {'value': 'Int'},
+            'type': 'Int',
+            'memoize': True,
+        }
+
+        def resolve(self, **kwargs):
+            calls.append(kwargs)
+            return kwargs.get('value', 0)
+
+    class Query(graphene.ObjectType):
+        foo = Foo.as_field()
+
+    schema = graphene.Schema(query=Query)
+    context = {}
+    result = schema.execute('''\
+{
+    a: foo
+    b: foo
+    c: foo(value: 1)
+    d: foo(value: 1)
+    e: foo(value: 2)
+}
+''', context_value=context)
+    assert not result.errors
+    assert result.data == {"a": 0, "b": 0, "c": 1, "d": 1, "e": 2}
+    assert calls == [{}, {'value': 1}, {'value': 2}]
+    stats = resolver.memo.get_stats(context)
+    assert stats[Foo] == resolver.memo.Stats(hits=2, misses=3)
+
+    # Not shared between requests.
+    result = schema.execute('''\
+{
+    a: foo
+}
+''', context_value={})
+    assert not result.errors
+    assert len(calls) == 4
+
+
+def test_fields():
+    class Name(resolver.Resolver):
+        schema = {
+            'type': 'String',
+            'memoize': True,
+        }
+
+    class Query(graphene.ObjectType):
+        first = Name.as_field()
+        last = Name.as_field()
+
+    schema = graphene.Schema(query=Query)
+    result = schema.execute(
+        '{ first last }',
+        root_value={'first': 'A', 'last': 'B'},
+        context_value={})
+    assert not result.errors
+    assert result.data == {'first': 'A', 'last': 'B'}
+
+
+def test_parent_key():
+    calls = []
+
+    class Foo(resolver.Resolver):
+        schema = {
+            'type': 'Int',
+            'memoize': lambda parent: parent['id'],
+        }
+
+        def resolve(self, **kwargs):
+            calls.append(self.parent)
+            return self.parent['id']
+
+    class Bar(resolver.Resolver):
+        schema = [{'foo': Foo}]
+
+        def resolve(self, **kwargs):
+            return [{'id': 1}, {'id': 2}, {'id': 1}]
+
+    class Query(graphene.ObjectType):
+        bar = Bar.as_field()
+
+    schema = graphene.Schema(query=Query)
+    result = schema.execute('''\
+{
+    bar {
+        foo
+    }
+}
+''', context_value={})
+    assert not result.errors
+    assert result.data == {"bar": [{"foo": 1}, {"foo": 2}, {"foo": 1}]}
+    assert calls == [{'id': 1}, {'id': 2}]
+
+
+def test_identity():
+    calls = []
+
+    class Foo(resolver.Resolver):
+        schema = {
+            'type': 'Int',
+            'memoize': True,
+        }
+
+        def resolve(self, **kwargs):
+            calls.append(self.parent)
+            return self.parent['id']
+
+    class Bar(resolver.Resolver):
+        schema = [{'foo': Foo}]
+
+        def resolve(self, **kwargs):
+            return [{'id': 1}, {'id': 1}]
+
+    class Query(graphene.ObjectType):
+        bar = Bar.as_field()
+
+    schema = graphene.Schema(query=Query)
+    result = schema.execute('''\
+{
+    bar {
+        a: foo
+        b: foo
+    }
+}
+''', context_value={})
+    assert not result.errors
+    assert result.data == {"bar": [{"a": 1, "b": 1}, {"a": 1, "b": 1}]}
+    assert len(calls) == 2
+
+
+def test_without_context():
+    calls = []
+
+    class Foo(resolver.Resolver):
+        schema = {
+            'type': 'Int',
+            'memoize': True,
+        }
+
+        def resolve(self, **kwargs):
+            calls.append(kwargs)
+            return 1
+
+    class Query(graphene.ObjectType):
+        foo = Foo.as_field()
+
+    schema = graphene.Schema(query=Query)
+    result = schema.execute('''\
+{
+    a: foo
+    b: foo
+}
+''')
+    assert not result.errors
+    assert len(calls) == 2
+
+
+def test_async():
+    calls = []
+
+    class Foo(resolver.Resolver):
+        schema = {
+            'type': 'Int',
+            'memoize': True,
+        }
+
+        async def resolve(self, **kwargs):
+            calls.append(kwargs)
+            await asyncio.sleep(0)
+            return 1
+
+    class Query(graphene.ObjectType):
+        foo = Foo.as_field()
+
+    schema = graphene.Schema(query=Query)
+    loop = asyncio.new_event_loop()
+    try:
+        result = schema.execute('''\
+{
+    a: foo
+    b: foo
+}
+''', context_value={}, executor=AsyncioExecutor(loop=loop))
+    finally:
+        loop.close()
+    assert not result.errors
+    assert result.data == {"a": 1, "b": 1}
+    assert len(calls) == 1
@@ -0,0 +1,132 @@
+# pylint:disable=missing-docstring,invalid-name,unused-variable
+import math
+
+import graphene
+
+import graphene_resolver as resolver
+
+
+def test_histogram():
+    histogram = resolver.metrics.Histogram([1, 2, 4])
+    assert math.isnan(histogram.quantile(0.5))
+    for i in (0.5, 1.5, 1.5, 3, 10):
+        histogram.observe(i)
+    assert histogram.cumulative_counts() == [1, 3, 4]
+    assert histogram.count == 5
+    assert histogram.sum == 16.5
+    assert histogram.quantile(0.2) == 1
+    assert histogram.quantile(0.4) == 1.5
+    assert histogram.quantile(0.99) == 4
+
+
+def test_render(tmp_path):
+    registry = resolver.metrics.Registry()
+    registry.inc('foo_total', resolver='Foo')
+    registry.inc('foo_total', 2, resolver='Foo')
+    registry.set('bar', 1.5, label='a"b')
+    registry.observe('baz_seconds', 0.3, buckets=[0.1, 1], resolver='Foo')
+    expected = '''\
+# TYPE bar gauge
+bar{label="a\\"b"} 1.5
+# TYPE baz_seconds histogram
+baz_seconds_bucket{resolver="Foo",le="0.1"} 0
+baz_seconds_bucket{resolver="Foo",le="1"} 1
+baz_seconds_bucket{resolver="Foo",le="+Inf"} 1
+baz_seconds_sum{resolver="Foo"} 0.3
+baz_seconds_count{resolver="Foo"} 1
+# TYPE foo_total counter
+foo_total{resolver="Foo"} 3
+'''
+    assert registry.render() == expected
+    path = tmp_path / 'metrics.prom'
+    registry.write(str(path))
+    assert path.read_text() == expected
+    assert registry.get_value('foo_total', resolver='Foo') == 3
+    assert registry.get_value('foo_total', resolver='Bar') is None
+
+
+def test_resolver_metrics():
+    class CachedFoo(resolver.Resolver):
+        schema = {
+            'type': 'Int',
+            'cache': True,
+        }
+
+        def resolve(self, **kwargs):
+            return 1
+
+    class Broken(resolver.Resolver):
+        schema = 'Int'
+
+        def resolve(self, **kwargs):
+            raise ValueError('broken')
+
+    class Query(graphene.ObjectType):
+        foo = CachedFoo.as_field()
+        broken = Broken.as_field()
+
+    schema = graphene.Schema(query=Query)
+    schema.execute('{ foo }')
+    registry = resolver.metrics.enable()
+    schema.execute('{ foo broken }')
+    schema.execute('{ foo }')
+    histogram = registry.get_histogram(
+        'graphene_resolver_call_seconds',
+        resolver='CachedFoo', kind='resolve', field='Query.foo', type='Int')
+    assert histogram.count == 2
+    assert registry.get_value(
+        'graphene_resolver_call_errors_total',
+        resolver='Broken', kind='resolve', field='Query.broken', type='Int') == 1
+    text = registry.render()
+    assert '# TYPE graphene_resolver_call_seconds histogram' in text
+    assert 'graphene_resolver_cache_hits_total{resolver="CachedFoo"} 2' in text
+    assert 'graphene_resolver_cache_hit_ratio{resolver="CachedFoo"} 0.6666666666666666' in text
+
+    resolver.metrics.disable()
+    schema.execute('{ foo }')
+    assert histogram.count == 2
+
+
+def test_connection_metrics():
+    registry = resolver.metrics.enable()
+    result = resolver.connection.resolve(list(range(10)), first=3)
+    assert result.nodes == [0, 1, 2]
+    assert result.totalCount == 10
+    assert registry.get_histogram(
+        'graphene_resolver_connection_page_size', source='SequenceSource').sum == 4
+    assert registry.get_histogram(
+        'graphene_resolver_connection_source_seconds',
+        source='SequenceSource', operation='count').count == 1
+
+
+def test_union_metrics():
+    class Foo(resolver.Resolver):
+        schema = {'foo': 'String'}
+
+    class Bar(resolver.Resolver):
+        schema = {'bar': 'String'}
+
+    class Items(resolver.Resolver):
+        schema = [{'name': 'FooOrBar', 'type': (Foo, Bar)}]
+
+        def resolve(self, **kwargs):
+            return [{'foo': 'a'}, {'bar': 'b'}]
+
+    class Query(graphene.ObjectType):
+        items = Items.as_field()
+
+    registry = resolver.metrics.enable()
+    result = graphene.Schema(query=Query).execute('''\
+{
+    items {
+        ... on Foo { foo }
+        ... on Bar { bar }
+    }
+}
+''')
+    assert not result.errors
+    assert result.data == {'items': [{'foo': 'a'}, {'bar': 'b'}]}
+    assert registry.get_histogram(
+        'graphene_resolver_union_resolve_type_seconds', union='FooOrBar').count == 2
+    assert registry.get_value(
+        'graphene_resolver_union_resolve_type_cache_total', union='FooOrBar', result='miss') == 2
@@ -0,0 +1,91 @@
+# pylint:disable=missing-docstring,invalid-name,unused-variable
+import pytest
+
+from graphene_resolver import processor
+
+
+def test_weight():
+    p = processor.Processor()
+    calls = []
+
+    def _factory(name, ret=None):
+        def _process(value):
+            calls.append(name)
+            return ret
+        return _process
+
+    p.register(0)(_factory('a'))
+    p.register(10)(_factory('b'))
+    p.register(0)(_factory('c', 'c'))
+    p.register(5)(_factory('d'))
+    assert [i for i, _ in p._process_registry] == [10, 5, 0, 0]
+    assert p.process(value=1) == 'c'
+    assert calls == ['b', 'd', 'a', 'c']
+
+
+def test_not_implemented():
+    p = processor.Processor()
+    with pytest.raises(NotImplementedError):
+        p.process(value=1)
+
+
+def test_dispatch_cache():
+    p = processor.Processor(dispatch_key='value')
+    calls = []
+
+    def _str(value):
+        calls.append('str')
+        if isinstance(value, str):
+            return 'str'
+        return None
+
+    def _positive(value):
+        calls.append('positive')
+        if isinstance(value, int) and value > 0:
+            return 'positive'
+        return None
+
+    def _int(value):
+        calls.append('int')
+        if isinstance(value, int):
+            return 'int'
+        return None
+
+    def _default(value):
+        calls.append('default')
+        return 'default'
+
+    p.register(30, type_determined=True)(_str)
+    p.register(20)(_positive)
+    p.register(10, type_determined=True)(_int)
+    p.register(0, type_determined=True)(_default)
+
+    assert p.process(value='a') == 'str'
+    assert p.process(value=-1) == 'int'
+    assert calls == ['str', 'str', 'positive', 'int']
+    calls.clear()
+
+    assert p.process(value='b') == 'str'
+    assert p.process(value=1) == 'positive'
+    assert p.process(value=-2) == 'int'
+    assert p.process(value=None) == 'default'
+    assert calls == ['str', 'positive', 'positive', 'int',
+                     'str', 'positive', 'int', 'default']
+    calls.clear()
+
+    assert p.process(value=None) == 'default'
+    assert calls == ['positive', 'default']
+
+    assert p.match_counts[_str] == 2
+    assert p.match_counts[_positive] == 1
+    assert p.match_counts[_int] == 2
+    assert p.match_counts[_default] == 2
+
+
+def test_register_clear_cache():
+    p = processor.Processor(dispatch_key='value')
+
+    p.register(0, type_determined=True)(lambda value: 'a')
+    assert p.process(value=1) == 'a'
+    p.register(10, type_determined=True)(lambda value: 'b')
+    assert p.process(value=1) == 'b'
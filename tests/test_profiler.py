@@ -0,0 +1,92 @@
+# pylint:disable=missing-docstring,invalid-name,unused-variable
+import time
+
+import graphene
+
+import graphene_resolver as resolver
+
+
+def _schema():
+    class Owner(resolver.Resolver):
+        schema = {'name': 'String'}
+
+        def resolve(self, **kwargs):
+            time.sleep(0.02)
+            return {'name': 'owner'}
+
+    class Pet(resolver.Resolver):
+        schema = {'name': 'String', 'owner': Owner}
+
+    class Pets(resolver.Resolver):
+        schema = {
+            'args': {'filter': {'name': 'String'}, 'ids': ['ID']},
+            'type': [Pet],
+        }
+
+        def resolve(self, **kwargs):
+            return [{'name': 'a'}, {'name': 'b'}]
+
+    class Query(graphene.ObjectType):
+        pets = Pets.as_field()
+
+    return graphene.Schema(query=Query), Owner, Pets
+
+
+def test_profiler():
+    schema, Owner, Pets = _schema()
+    slow = []
+    profiler = resolver.profiler.Profiler(threshold=0.01, callback=slow.append)
+    resolver.tracing.add_hook(profiler)
+    context = {}
+    result = schema.execute('''\
+{
+    pets(filter: {name: "a"}, ids: ["1", "2"]) {
+        owner {
+            name
+        }
+    }
+}
+''', context_value=context)
+    assert not result.errors
+    profile = profiler.get_profile(context)
+    assert [i.path for i in profile.fields] == [
+        ('pets',), ('pets', 0, 'owner'), ('pets', 1, 'owner')]
+    assert profile.fields[0].args == {
+        'filter': {'name': 'str'}, 'ids': 'list[2]'}
+    assert len(slow) == 2
+    assert slow[0].resolver is Owner
+    assert slow[0].chain == (Pets,)
+    assert str(slow[0]).startswith('pets.0.owner (Pets > Owner) took ')
+    assert profiler.get_profile(None) is None
+
+
+def test_sampling():
+    schema, Owner, Pets = _schema()
+    now = [0]
+    samples = iter([0.5, 0.1, 0.1, 0.1, 0.1])
+    profiler = resolver.profiler.Profiler(
+        sample_rate=0.2,
+        max_samples_per_second=1,
+        timer=lambda: now[0],
+        random_fn=lambda: next(samples),
+    )
+    resolver.tracing.add_hook(profiler)
+
+    def _execute():
+        context = {}
+        schema.execute('{ pets { name } }', context_value=context)
+        return profiler.get_profile(context)
+
+    assert _execute() is None  # Random not in sample rate.
+    assert _execute() is not None
+    assert _execute() is None  # Exceeds max samples per second.
+    now[0] = 1
+    assert _execute() is not None
+
+
+def test_log(caplog):
+    schema, Owner, Pets = _schema()
+    resolver.tracing.add_hook(resolver.profiler.Profiler(threshold=0.01))
+    schema.execute('{ pets { owner { name } } }', context_value={})
+    assert [i.getMessage() for i in caplog.records][0].startswith(
+        'Slow resolver: pets.0.owner (Pets > Owner) took ')
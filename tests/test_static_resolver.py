@@ -0,0 +1,169 @@
+# pylint:disable=missing-docstring,invalid-name,unused-variable
+import typing
+
+import graphene
+
+import graphene_resolver as resolver
+
+
+class _NoInstanceResolver(resolver.Resolver, abstract=True):
+    __slots__ = ()
+
+    def __init__(self, **kwargs):
+        raise AssertionError('should not create instance')
+
+
+def test_simple():
+    class Foo(_NoInstanceResolver):
+        schema = {
+            'args': {'value': 'String!'},
+            'type': 'String!',
+        }
+
+        @staticmethod
+        def resolve(parent, info, **kwargs):
+            assert info.field_name == 'foo'
+            return kwargs['value']
+
+    class Query(graphene.ObjectType):
+        foo = Foo.as_field()
+
+    schema = graphene.Schema(query=Query)
+    result = schema.execute('''\
+{
+    foo(value: "v")
+}
+''')
+    assert not result.errors
+    assert result.data == {"foo": "v"}
+
+
+def test_nested():
+    class Foo(_NoInstanceResolver):
+        schema = 'Int'
+
+        @staticmethod
+        def resolve(parent, info, **kwargs):
+            return parent['bar']
+
+    class Bar(_NoInstanceResolver):
+        schema = [{'foo': Foo}]
+
+        @staticmethod
+        def resolve(parent, info, **kwargs):
+            return [{'bar': i} for i in range(3)]
+
+    class Query(graphene.ObjectType):
+        bar = Bar.as_field()
+
+    schema = graphene.Schema(query=Query)
+    result = schema.execute('''\
+{
+    bar {
+        foo
+    }
+}
+''')
+    assert not result.errors
+    assert result.data == {"bar": [{"foo": 0}, {"foo": 1}, {"foo": 2}]}
+
+
+def test_batch():
+    class Foo(_NoInstanceResolver):
+        schema = 'Int'
+
+        @staticmethod
+        def resolve_batch(parents, info, **kwargs):
+            return [i['bar'] for i in parents]
+
+    class Bar(_NoInstanceResolver):
+        schema = [{'foo': Foo}]
+
+        @staticmethod
+        def resolve(parent, info, **kwargs):
+            return [{'bar': i} for i in range(3)]
+
+    class Query(graphene.ObjectType):
+        bar = Bar.as_field()
+
+    schema = graphene.Schema(query=Query)
+    result = schema.execute('''\
+{
+    bar {
+        foo
+    }
+}
+''', context_value={})
+    assert not result.errors
+    assert result.data == {"bar": [{"foo": 0}, {"foo": 1}, {"foo": 2}]}
+
+
+def test_node():
+    pets = [dict(
+        id=1,
+        name='pet1',
+        age=1,
+    )]
+
+    class Pet(_NoInstanceResolver):
+        schema = {
+            'type': {
+                'name': 'String',
+                'age': 'Int',
+            },
+            'interfaces': (graphene.Node,)
+        }
+
+        @staticmethod
+        def get_node(info, id_):
+            return next(i for i in pets if i['id'] == int(id_))
+
+        @staticmethod
+        def validate(value, info):
+            return (
+                isinstance(value, typing.Mapping)
+                and isinstance(value.get('name'), str)
+                and isinstance(value.get('age'), int)
+            )
+
+    class Query(graphene.ObjectType):
+        node = graphene.Node.Field()
+
+    schema = graphene.Schema(query=Query, types=[Pet.as_type()])
+    result = schema.execute('''\
+{
+    node(id: "UGV0OjE=") {
+        id
+        __typename
+        ... on Pet {
+            name
+            age
+        }
+    }
+}
+''')
+    assert not result.errors
+    assert result.data == {"node": {"id": "UGV0OjE=", "__typename": "Pet",
+                                    "name": "pet1", "age": 1}}
+
+
+def test_slots():
+    class Foo(resolver.Resolver):
+        __slots__ = ()
+        schema = 'Int'
+
+        def resolve(self, **kwargs):
+            assert not hasattr(self, '__dict__')
+            return 1
+
+    class Query(graphene.ObjectType):
+        foo = Foo.as_field()
+
+    schema = graphene.Schema(query=Query)
+    result = schema.execute('''\
+{
+    foo
+}
+''')
+    assert not result.errors
+    assert result.data == {"foo": 1}
@@ -0,0 +1,146 @@
+# pylint:disable=missing-docstring,invalid-name,unused-variable
+import threading
+import time
+
+import graphene
+import pytest
+
+import graphene_resolver as resolver
+
+
+def test_simple():
+    class Foo(resolver.Resolver):
+        schema = {
+            'type': 'String',
+            'executor': 'thread',
+        }
+
+        def resolve(self, **kwargs):
+            time.sleep(0.1)
+            return str(threading.get_ident())
+
+    class Query(graphene.ObjectType):
+        foo = Foo.as_field()
+
+    schema = graphene.Schema(query=Query)
+    start = time.perf_counter()
+    result = schema.execute('''\
+{
+    a: foo
+    b: foo
+    c: foo
+    d: foo
+}
+''')
+    cost = time.perf_counter() - start
+    assert not result.errors
+    assert str(threading.get_ident()) not in result.data.values()
+    assert cost < 0.3
+
+
+def test_max_concurrency():
+    lock = threading.Lock()
+    running = [0]
+    max_running = [0]
+
+    class Foo(resolver.Resolver):
+        schema = {
+            'type': 'Int',
+            'executor': 'thread',
+            'max_concurrency': 2,
+        }
+
+        def resolve(self, **kwargs):
+            with lock:
+                running[0] += 1
+                max_running[0] = max(max_running[0], running[0])
+            time.sleep(0.05)
+            with lock:
+                running[0] -= 1
+            return 1
+
+    class Query(graphene.ObjectType):
+        foo = Foo.as_field()
+
+    schema = graphene.Schema(query=Query)
+    result = schema.execute('''\
+{
+    a: foo
+    b: foo
+    c: foo
+    d: foo
+    e: foo
+}
+''')
+    assert not result.errors
+    assert result.data == {"a": 1, "b": 1, "c": 1, "d": 1, "e": 1}
+    assert max_running[0] == 2
+    assert Foo._limiter.running == 0
+    assert Foo._limiter.pending == 0
+
+
+def test_error():
+    class Foo(resolver.Resolver):
+        schema = {
+            'type': 'Int',
+            'executor': 'thread',
+        }
+
+        def resolve(self, **kwargs):
+            raise ValueError('test error')
+
+    class Query(graphene.ObjectType):
+        foo = Foo.as_field()
+
+    schema = graphene.Schema(query=Query)
+    result = schema.execute('''\
+{
+    foo
+}
+''')
+    assert len(result.errors) == 1
+    assert 'test error' in str(result.errors[0])
+    assert result.data == {"foo": None}
+
+
+def test_nested():
+    class Foo(resolver.Resolver):
+        schema = {
+            'type': 'Int',
+            'executor': 'thread',
+        }
+
+        def resolve(self, **kwargs):
+            return self.parent['bar']
+
+    class Bar(resolver.Resolver):
+        schema = {
+            'type': [{'foo': Foo}],
+            'executor': 'thread',
+        }
+
+        def resolve(self, **kwargs):
+            return [{'bar': i} for i in range(3)]
+
+    class Query(graphene.ObjectType):
+        bar = Bar.as_field()
+
+    schema = graphene.Schema(query=Query)
+    result = schema.execute('''\
+{
+    bar {
+        foo
+    }
+}
+''')
+    assert not result.errors
+    assert result.data == {"bar": [{"foo": 0}, {"foo": 1}, {"foo": 2}]}
+
+
+def test_unknown_executor():
+    with pytest.raises(ValueError):
+        class Foo(resolver.Resolver):
+            schema = {
+                'type': 'Int',
+                'executor': 'unknown',
+            }
@@ -0,0 +1,158 @@
+# pylint:disable=missing-docstring,invalid-name,unused-variable
+import asyncio
+
+import graphene
+import pytest
+from graphql.execution.executors.asyncio import AsyncioExecutor
+
+import graphene_resolver as resolver
+
+
+def _schema():
+    class Item(resolver.Resolver):
+        schema = {'name': 'String!'}
+
+        @staticmethod
+        def validate(value, info):
+            return isinstance(value, dict)
+
+    class Items(resolver.Resolver):
+        schema = [Item]
+
+        def resolve(self, **kwargs):
+            return [{'name': 'a'}, {'name': 'b'}]
+
+    class Broken(resolver.Resolver):
+        schema = 'Int'
+
+        def resolve(self, **kwargs):
+            raise ValueError('broken')
+
+    class Query(graphene.ObjectType):
+        items = Items.as_field()
+        broken = Broken.as_field()
+
+    return graphene.Schema(query=Query), Item, Items, Broken
+
+
+def test_collector():
+    schema, Item, Items, Broken = _schema()
+    collector = resolver.tracing.Collector()
+    resolver.tracing.add_hook(collector)
+    try:
+        result = schema.execute('''\
+{
+    items {
+        name
+    }
+    broken
+}
+''')
+    finally:
+        resolver.tracing.remove_hook(collector)
+    assert result.data == {
+        'items': [{'name': 'a'}, {'name': 'b'}],
+        'broken': None,
+    }
+    assert collector.by_resolver[(Items, 'resolve')].count == 1
+    assert collector.by_resolver[(Items, 'resolve')].errors == 0
+    assert collector.by_resolver[(Broken, 'resolve')].count == 1
+    assert collector.by_resolver[(Broken, 'resolve')].errors == 1
+    assert collector.by_path[('items',)].count == 1
+    assert collector.by_path[('broken',)].max_time >= 0
+    assert collector.by_resolver[(Item, 'is_type_of')].count == 2
+
+    schema.execute('{ broken }')
+    assert collector.by_resolver[(Broken, 'resolve')].count == 1
+
+
+def test_apollo_tracing():
+    schema, Item, Items, Broken = _schema()
+    context = {}
+    tracing = resolver.tracing.ApolloTracing(context=context)
+    resolver.tracing.add_hook(tracing)
+    try:
+        schema.execute('{ items { name } }', context_value=context)
+        schema.execute('{ broken }', context_value={})
+    finally:
+        resolver.tracing.remove_hook(tracing)
+    data = tracing.as_dict()
+    assert data['version'] == 1
+    assert data['duration'] >= 0
+    assert data['startTime'].endswith('Z')
+    resolvers = data['execution']['resolvers']
+    assert len(resolvers) == 1
+    assert resolvers[0]['path'] == ['items']
+    assert resolvers[0]['parentType'] == 'Query'
+    assert resolvers[0]['fieldName'] == 'items'
+    assert resolvers[0]['returnType'] == '[Item]'
+    assert resolvers[0]['startOffset'] >= 0
+
+
+def test_trace_async():
+    class Foo(resolver.Resolver):
+        schema = 'Int'
+
+        async def resolve(self, **kwargs):
+            await asyncio.sleep(0.01)
+            return 1
+
+    class Query(graphene.ObjectType):
+        foo = Foo.as_field()
+
+    events = []
+    resolver.tracing.add_hook(events.append)
+    loop = asyncio.new_event_loop()
+    try:
+        result = graphene.Schema(query=Query).execute(
+            '{ foo }', executor=AsyncioExecutor(loop=loop))
+    finally:
+        loop.close()
+        resolver.tracing.remove_hook(events.append)
+    assert result.data == {'foo': 1}
+    assert len(events) == 1
+    assert events[0].resolver is Foo
+    assert events[0].duration >= 0.01
+    assert events[0].path == ('foo',)
+
+
+def test_trace_promise():
+    events = []
+    resolver.tracing.add_hook(events.append)
+    ret = resolver.tracing.trace(
+        str, 'resolve', None, resolver.executor.Limiter().submit, args=(lambda: 1,))
+    assert ret.get() == 1
+    assert len(events) == 1
+    assert events[0].error is None
+
+    ret = resolver.tracing.trace(
+        str, 'resolve', None, resolver.executor.Limiter().submit, args=(lambda: 1 / 0,))
+    with pytest.raises(ZeroDivisionError):
+        ret.get()
+    assert isinstance(events[1].error, ZeroDivisionError)
+
+
+def test_argument_names():
+    class Foo(resolver.Resolver):
+        schema = {
+            'args': {'kind': 'String', 'resolver': 'String'},
+            'type': 'String',
+        }
+
+        def resolve(self, **kwargs):
+            return kwargs['kind'] + kwargs['resolver']
+
+    class Query(graphene.ObjectType):
+        foo = Foo.as_field()
+
+    schema = graphene.Schema(query=Query)
+    events = []
+    resolver.tracing.add_hook(events.append)
+    try:
+        result = schema.execute('{ foo(kind: "a", resolver: "b") }')
+    finally:
+        resolver.tracing.remove_hook(events.append)
+    assert not result.errors
+    assert result.data == {'foo': 'ab'}
+    assert events[0].kind == 'resolve'
+    assert events[0].kwargs == {'kind': 'a', 'resolver': 'b'}
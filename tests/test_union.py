@@ -309,3 +309,260 @@ def test_with_typename_processor():
             {"__typename": "Foo1", },
         ],
     }}
+
+
+def test_typename_of():
+    class A:
+        a = 'a'
+
+    class B:
+        b = 1
+
+    class SubA(A):
+        pass
+
+    class Foo(resolver.Resolver):
+        schema = {
+            'type': ({'a': 'String'}, {'b': 'Int'}),
+            'typename_of': {A: 'Foo0', B: 'Foo1'},
+        }
+
+    class FooList(resolver.Resolver):
+        schema = [Foo]
+
+        def resolve(self, **kwargs):
+            return [A(), B(), SubA()]
+
+    class Query(graphene.ObjectType):
+        foo_list = FooList.as_field()
+
+    schema = graphene.Schema(query=Query)
+    result = schema.execute('''\
+{
+    fooList {
+        __typename
+        ... on Foo0 {
+            a
+        }
+        ... on Foo1 {
+            b
+        }
+    }
+}
+''')
+    assert not result.errors
+    assert result.data == {"fooList": [
+        {"__typename": "Foo0", "a": 'a'},
+        {"__typename": "Foo1", "b": 1},
+        {"__typename": "Foo0", "a": 'a'},
+    ]}
+    union = schema.get_type('Foo').graphene_type
+    assert union._typename_cache == {A: 'Foo0', B: 'Foo1', SubA: 'Foo0'}
+
+
+def test_typename_cache():
+    calls = []
+
+    class A:
+        a = 'a'
+
+    def _resolve_type(value):
+        calls.append(value)
+        if isinstance(value, A):
+            return {'__typename': 'Foo0'}
+        return None
+    resolver.TYPENAME_PROCESSOR.register(0, type_determined=True)(
+        _resolve_type)
+
+    class Foo(resolver.Resolver):
+        schema = ({'a': 'String'}, {'b': 'Int'})
+
+    class FooList(resolver.Resolver):
+        schema = [Foo]
+
+        def resolve(self, **kwargs):
+            return [A(), A(), A(), {'__typename': 'Foo1', 'b': 1}]
+
+    class Query(graphene.ObjectType):
+        foo_list = FooList.as_field()
+
+    schema = graphene.Schema(query=Query)
+    result = schema.execute('''\
+{
+    fooList {
+        __typename
+    }
+}
+''')
+    assert not result.errors
+    assert result.data == {"fooList": [
+        {"__typename": "Foo0"},
+        {"__typename": "Foo0"},
+        {"__typename": "Foo0"},
+        {"__typename": "Foo1"},
+    ]}
+    assert len(calls) == 1
+
+
+def test_unique_key():
+
+    class Bar(resolver.Resolver):
+        schema = {'c': 'String', 'shared': 'String'}
+
+    class Foo(resolver.Resolver):
+        schema = ({'a': 'String', 'shared': 'String'},
+                  {'b': 'Int', 'shared': 'String'},
+                  Bar)
+
+    class FooList(resolver.Resolver):
+        schema = [Foo]
+
+        def resolve(self, **kwargs):
+            return [{'a': 'a', 'shared': 's'}, {'b': 1}, {'c': 'c'}]
+
+    class Query(graphene.ObjectType):
+        foo_list = FooList.as_field()
+
+    schema = graphene.Schema(query=Query)
+    union = schema.get_type('Foo').graphene_type
+    assert union._typename_by_key == {'a': 'Foo0', 'b': 'Foo1', 'c': 'Bar'}
+    result = schema.execute('''\
+{
+    fooList {
+        __typename
+    }
+}
+''')
+    assert not result.errors
+    assert result.data == {"fooList": [
+        {"__typename": "Foo0"},
+        {"__typename": "Foo1"},
+        {"__typename": "Bar"},
+    ]}
+
+
+def test_discriminator():
+
+    class Foo(resolver.Resolver):
+        schema = {
+            'type': ({'kind': 'String', 'a': 'String'},
+                     {'kind': 'String', 'b': 'Int'}),
+            'discriminator': 'kind',
+        }
+
+    class FooList(resolver.Resolver):
+        schema = [Foo]
+
+        def resolve(self, **kwargs):
+            return [{'kind': 'Foo1'}, {'kind': 'Foo0', 'a': 'a'}]
+
+    class Query(graphene.ObjectType):
+        foo_list = FooList.as_field()
+
+    schema = graphene.Schema(query=Query)
+    result = schema.execute('''\
+{
+    fooList {
+        __typename
+        ... on Foo0 {
+            a
+        }
+    }
+}
+''')
+    assert not result.errors
+    assert result.data == {"fooList": [
+        {"__typename": "Foo1"},
+        {"__typename": "Foo0", "a": "a"},
+    ]}
+
+
+def test_unique_key_ambiguous():
+
+    class Foo(resolver.Resolver):
+        schema = ({'a': 'String'}, {'b': 'Int'})
+
+    class FooList(resolver.Resolver):
+        schema = [Foo]
+
+        def resolve(self, **kwargs):
+            return [{'a': 'a'}, {'a': None, 'b': 1}]
+
+    class Query(graphene.ObjectType):
+        foo_list = FooList.as_field()
+
+    schema = graphene.Schema(query=Query)
+    result = schema.execute('''\
+{
+    fooList {
+        __typename
+    }
+}
+''')
+    assert len(result.errors) == 1
+    assert 'must resolve to an Object type' in str(result.errors[0])
+    assert result.data == {"fooList": [{"__typename": "Foo0"}, None]}
+
+
+def test_unique_key_after_processor():
+
+    class Foo(resolver.Resolver):
+        schema = ({'a': 'String'}, {'b': 'Int'})
+
+    class FooList(resolver.Resolver):
+        schema = [Foo]
+
+        def resolve(self, **kwargs):
+            return [{'a': 'a', 'is_b': True}]
+
+    @resolver.TYPENAME_PROCESSOR.register(10)
+    def _resolve_type(value):
+        if isinstance(value, dict) and value.get('is_b'):
+            return {'__typename': 'Foo1'}
+        return None
+
+    class Query(graphene.ObjectType):
+        foo_list = FooList.as_field()
+
+    schema = graphene.Schema(query=Query)
+    result = schema.execute('''\
+{
+    fooList {
+        __typename
+    }
+}
+''')
+    assert not result.errors
+    assert result.data == {"fooList": [{"__typename": "Foo1"}]}
+
+
+def test_discriminator_invalid():
+
+    class Foo(resolver.Resolver):
+        schema = {
+            'type': ({'kind': 'String', 'a': 'String'},
+                     {'kind': 'String', 'b': 'Int'}),
+            'discriminator': 'kind',
+        }
+
+    class FooList(resolver.Resolver):
+        schema = [Foo]
+
+        def resolve(self, **kwargs):
+            return [{'kind': 'Bar'}]
+
+    class Query(graphene.ObjectType):
+        foo_list = FooList.as_field()
+
+    schema = graphene.Schema(query=Query)
+    result = schema.execute('''\
+{
+    fooList {
+        __typename
+    }
+}
+''')
+    assert len(result.errors) == 1
+    assert str(result.errors[0]) == (
+        "Union `Foo` has no member named 'Bar', got it from `kind` key, "
+        "expected one of: Foo0, Foo1")